@@ -4,6 +4,7 @@ from abc import (
 )
 from collections import defaultdict
 from collections.abc import (
+    Callable,
     MutableMapping,
     Sequence,
     Set,
@@ -149,13 +150,14 @@ class DiffCoverage:
         return uncovered_data == {}
 
     def changed_path_covered_by_path(self, path: jsonpath_ng.JSONPath) -> bool:
-        return str(self.diff.path).startswith(str(path)) or path == jsonpath_ng.Root()
+        return self.diff.path_str().startswith(str(path)) or path == jsonpath_ng.Root()
 
     def path_under_changed_path(self, path: jsonpath_ng.JSONPath) -> bool:
+        path_str = str(path)
+        diff_path_str = self.diff.path_str()
         return (
-            str(path).startswith(str(self.diff.path))
-            or str(self.diff.path) == JSON_PATH_ROOT
-        ) and str(path) != str(self.diff.path)
+            path_str.startswith(diff_path_str) or diff_path_str == JSON_PATH_ROOT
+        ) and path_str != diff_path_str
 
     def split(
         self, path: jsonpath_ng.JSONPath, ctx: "ChangeTypeContext"
@@ -224,6 +226,53 @@ class DiffCoverage:
         return coverages
 
 
+class JsonPathMatches:
+    """
+    Remembers the matches of jsonpath expressions within documents, so that
+    change-types sharing change detectors (e.g. via inheritance) and the many
+    contexts of a change-type don't search the same document over and over.
+
+    Documents are compared by identity. They are referenced by the cache, so
+    their ids can't be reused while the cache exists.
+    """
+
+    def __init__(self) -> None:
+        self._matches: dict[tuple[int, int], tuple[jsonpath_ng.JSONPath, Any, Any]] = {}
+        self._full_paths: dict[
+            tuple[int, int], tuple[jsonpath_ng.JSONPath, Any, Any]
+        ] = {}
+
+    @staticmethod
+    def _cached(
+        cache: dict[tuple[int, int], tuple[jsonpath_ng.JSONPath, Any, Any]],
+        path: jsonpath_ng.JSONPath,
+        document: Any,
+        compute: Callable[[], Any],
+    ) -> Any:
+        key = (id(path), id(document))
+        cached = cache.get(key)
+        if cached and cached[0] is path and cached[1] is document:
+            return cached[2]
+        result = compute()
+        cache[key] = (path, document, result)
+        return result
+
+    def find(
+        self, path: jsonpath_ng.JSONPath, document: Any
+    ) -> list[jsonpath_ng.DatumInContext]:
+        return self._cached(self._matches, path, document, lambda: path.find(document))
+
+    def full_paths(
+        self, path: jsonpath_ng.JSONPath, document: Any
+    ) -> list[jsonpath_ng.JSONPath]:
+        return self._cached(
+            self._full_paths,
+            path,
+            document,
+            lambda: [m.full_path for m in self.find(path, document)],
+        )
+
+
 class PathExpression:
     """
     PathExpression is a wrapper around a JSONPath expression that can contain
@@ -236,6 +285,9 @@ class PathExpression:
     def __init__(self, jsonpath_expression: str):
         self.jsonpath_expression = jsonpath_expression
         self.parsed_jsonpath = None
+        # the template is rendered and parsed once per context file
+        self._jsonpath_by_ctx_file_path: dict[str, jsonpath_ng.JSONPath] = {}
+        self._matches = JsonPathMatches()
         if "{{" in jsonpath_expression:
             env = jinja2.Environment()
             ast = env.parse(self.jsonpath_expression)
@@ -253,10 +305,22 @@ class PathExpression:
         if self.parsed_jsonpath:
             return self.parsed_jsonpath
 
-        expr = self.template.render({
-            self.CTX_FILE_PATH_VAR_NAME: ctx.context_file.path,
-        })
-        return parse_jsonpath(expr)
+        ctx_file_path = ctx.context_file.path
+        if (jsonpath := self._jsonpath_by_ctx_file_path.get(ctx_file_path)) is None:
+            expr = self.template.render({
+                self.CTX_FILE_PATH_VAR_NAME: ctx_file_path,
+            })
+            jsonpath = parse_jsonpath(expr)
+            self._jsonpath_by_ctx_file_path[ctx_file_path] = jsonpath
+        return jsonpath
+
+    def find_paths(
+        self, ctx: "ChangeTypeContext", file_content: Any
+    ) -> list[jsonpath_ng.JSONPath]:
+        """
+        The full paths of the matches of the expression within the file content.
+        """
+        return self._matches.full_paths(self.jsonpath_for_context(ctx), file_content)
 
     def __eq__(self, obj: object) -> bool:
         return (
@@ -287,14 +351,17 @@ class OwnershipContext(ABC):
 class ForwardrefOwnershipContext(OwnershipContext):
     selector: jsonpath_ng.JSONPath
     when: str | None = None
+    _matches: JsonPathMatches = field(
+        default_factory=JsonPathMatches, init=False, repr=False, compare=False
+    )
 
     def find_ownership_context(
         self,
         context_schema: str | None,
         change: FileChange,
     ) -> list[FileRef]:
-        old_contexts = {e.value for e in self.selector.find(change.old)}
-        new_contexts = {e.value for e in self.selector.find(change.new)}
+        old_contexts = {e.value for e in self._matches.find(self.selector, change.old)}
+        new_contexts = {e.value for e in self._matches.find(self.selector, change.new)}
 
         # apply conditions
         if self.when == "added":
@@ -321,6 +388,9 @@ class BackrefOwnershipContext(OwnershipContext):
     selector: jsonpath_ng.JSONPath
     file_diff_resolver: FileDiffResolver
     when: str | None = None
+    _matches: JsonPathMatches = field(
+        default_factory=JsonPathMatches, init=False, repr=False, compare=False
+    )
 
     def find_ownership_context(
         self,
@@ -338,12 +408,18 @@ class BackrefOwnershipContext(OwnershipContext):
         old_contexts = {
             ref
             for ref, data in backref_datafile_content.items()
-            if any(f.value == change.file_ref.path for f in self.selector.find(data[0]))
+            if any(
+                f.value == change.file_ref.path
+                for f in self._matches.find(self.selector, data[0])
+            )
         }
         new_contexts = {
             ref
             for ref, data in backref_datafile_content.items()
-            if any(f.value == change.file_ref.path for f in self.selector.find(data[1]))
+            if any(
+                f.value == change.file_ref.path
+                for f in self._matches.find(self.selector, data[1])
+            )
         }
 
         # apply conditions
@@ -490,6 +566,7 @@ class ChangeTypeProcessor:
             tuple[BundleFileType, str | None], list[PathExpression]
         ] = defaultdict(list)
         self._change_detectors: list[ChangeDetector] = []
+        self._change_schemas: set[str | None] = set()
         self._context_expansions: list[ContextExpansion] = []
         self._heritage: set[str] = set()
 
@@ -497,6 +574,18 @@ class ChangeTypeProcessor:
     def change_detectors(self) -> Sequence[ChangeDetector]:
         return self._change_detectors
 
+    def finds_context_for_schema(self, schema: str | None) -> bool:
+        """
+        Cheap precheck for `find_context_file_refs`, which finds contexts only
+        for files of the context schema (directly) or of the change schema of
+        a change detector (context detection).
+        """
+        return (
+            self.context_schema is None
+            or self.context_schema == schema
+            or schema in self._change_schemas
+        )
+
     def find_context_file_refs(
         self,
         change: FileChange,
@@ -652,12 +741,7 @@ class ChangeTypeProcessor:
             for change_type_path_expression in self._expressions_by_file_type_schema[
                 file_type, file_schema
             ]:
-                paths.extend([
-                    p.full_path
-                    for p in change_type_path_expression.jsonpath_for_context(ctx).find(
-                        file_content
-                    )
-                ])
+                paths.extend(change_type_path_expression.find_paths(ctx, file_content))
         return paths
 
     def add_change_detector(
@@ -666,6 +750,7 @@ class ChangeTypeProcessor:
     ) -> None:
         if isinstance(detector, JsonPathChangeDetector):
             self._change_detectors.append(detector)
+            self._change_schemas.add(detector.change_schema)
             change_schema = detector.change_schema or self.context_schema
             expressions = self._expressions_by_file_type_schema[
                 self.context_type, change_schema
@@ -691,6 +776,28 @@ class ChangeTypeProcessor:
         return self._heritage.union({self.name})
 
 
+class ChangeTypeProcessorIndex:
+    """
+    Indexes ChangeTypeProcessors by the schemas of the files they can find
+    contexts for, so that a changed file is only matched against the
+    processors that can react to it. The processors keep their order.
+    """
+
+    def __init__(self, processors: Sequence[ChangeTypeProcessor]) -> None:
+        self._processors = processors
+        self._by_schema: dict[str | None, list[ChangeTypeProcessor]] = {}
+
+    def processors_for(self, file_ref: FileRef) -> list[ChangeTypeProcessor]:
+        if (processors := self._by_schema.get(file_ref.schema)) is None:
+            processors = [
+                ctp
+                for ctp in self._processors
+                if ctp.finds_context_for_schema(file_ref.schema)
+            ]
+            self._by_schema[file_ref.schema] = processors
+        return processors
+
+
 def build_ownership_context(
     file_diff_resolver: FileDiffResolver,
     selector: jsonpath_ng.JSONPath,
@@ -19,6 +19,7 @@ from reconcile.change_owners.bundle import (
     QontractServerDiff,
 )
 from reconcile.change_owners.change_types import (
+    JSON_PATH_ROOT,
     ChangeTypeContext,
     ChangeTypePriority,
     ChangeTypeProcessor,
@@ -154,7 +155,17 @@ class BundleFileChange:
             ) in change_type_context.change_type_processor.allowed_changed_paths(
                 self.fileref, file_content, change_type_context
             ):
+                allowed_path_str = str(allowed_path)
                 for dc in diffs:
+                    diff_path_str = dc.diff.path_str()
+                    if not (
+                        diff_path_str.startswith(allowed_path_str)
+                        or allowed_path_str.startswith(diff_path_str)
+                        or JSON_PATH_ROOT in {diff_path_str, allowed_path_str}
+                    ):
+                        # quick string check, the allowed path is neither
+                        # above nor below the changed path
+                        continue
                     if dc.changed_path_covered_by_path(allowed_path):
                         covered_diffs[dc.diff.path_str()] = dc.diff
                         dc.coverage.append(change_type_context)
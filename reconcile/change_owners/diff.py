@@ -1,6 +1,9 @@
 import copy
 import json
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    field,
+)
 from enum import Enum
 from functools import reduce
 from typing import Any
@@ -30,6 +33,7 @@ class Diff:
     diff_type: DiffType
     old: Any | None
     new: Any | None
+    _path_str: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def create_subdiff(self, sub_path: jsonpath_ng.JSONPath) -> "Diff":
         if sub_path == self.path:
@@ -64,7 +68,11 @@ class Diff:
         raise Exception(f"Unknown diff type {self.diff_type}")
 
     def path_str(self) -> str:
-        return str(self.path)
+        # rendering a jsonpath is not cheap and the coverage calculation
+        # compares the path of a diff with many other paths
+        if self._path_str is None:
+            self._path_str = str(self.path)
+        return self._path_str
 
     def old_value_repr(self) -> str | None:
         return self._value_repr(self.old)
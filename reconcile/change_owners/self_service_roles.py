@@ -10,6 +10,7 @@ from reconcile.change_owners.change_types import (
     Approver,
     ChangeTypeContext,
     ChangeTypeProcessor,
+    ChangeTypeProcessorIndex,
     FileChange,
 )
 from reconcile.change_owners.changes import BundleFileChange
@@ -140,8 +141,9 @@ def change_type_contexts_for_self_service_roles(
 
     # match every BundleChange with every relevant ChangeTypeV1
     change_type_contexts = []
+    processor_index = ChangeTypeProcessorIndex(change_type_processors)
     for bc in bundle_changes:
-        for ctp in change_type_processors:
+        for ctp in processor_index.processors_for(bc.fileref):
             for ownership in ctp.find_context_file_refs(
                 change=FileChange(
                     file_ref=bc.fileref,
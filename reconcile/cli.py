@@ -777,11 +777,12 @@ def aws_saml_idp(
 
 
 @integration.command(short_help="Configures the teams and members in a GitHub org.")
+@threaded()
 @click.pass_context
-def github(ctx):
+def github(ctx, thread_pool_size):
     import reconcile.github_org
 
-    run_integration(reconcile.github_org, ctx.obj)
+    run_integration(reconcile.github_org, ctx.obj, thread_pool_size)
 
 
 @integration.command(short_help="Configures owners in a GitHub org.")
@@ -1258,11 +1259,14 @@ def gitlab_permissions(ctx, thread_pool_size):
     default=False,
     help="wait for pending/running pipelines before acting.",
 )
+@threaded()
 @click.pass_context
-def gitlab_housekeeping(ctx, wait_for_pipeline):
+def gitlab_housekeeping(ctx, wait_for_pipeline, thread_pool_size):
     import reconcile.gitlab_housekeeping
 
-    run_integration(reconcile.gitlab_housekeeping, ctx.obj, wait_for_pipeline)
+    run_integration(
+        reconcile.gitlab_housekeeping, ctx.obj, wait_for_pipeline, thread_pool_size
+    )
 
 
 @integration.command(short_help="Listen to SQS and creates MRs out of the messages.")
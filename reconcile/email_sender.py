@@ -108,7 +108,9 @@ def run(dry_run, defer=None):
         logging.error("email names must be unique.")
         sys.exit(1)
 
-    emails_to_send = [e for e in emails if not state.exists(e["name"])]
+    # a single listing instead of one existence check per email
+    sent_emails = {k.lstrip("/") for k in state.ls()}
+    emails_to_send = [e for e in emails if e["name"] not in sent_emails]
     for email in emails_to_send:
         logging.info(["send_email", email["name"], email["subject"]])
 
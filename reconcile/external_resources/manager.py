@@ -252,9 +252,10 @@ class ExternalResourcesManager:
 
     def _get_deleted_objects_reconciliations(self) -> set[Reconciliation]:
         to_reconcile: set[Reconciliation] = set()
-        deleted_keys = (k for k, v in self.er_inventory.items() if v.marked_to_delete)
+        deleted_keys = {k for k, v in self.er_inventory.items() if v.marked_to_delete}
+        states = self.state_mgr.get_external_resource_states(deleted_keys)
         for key in deleted_keys:
-            state = self.state_mgr.get_external_resource_state(key)
+            state = states[key]
             if state.resource_status == ResourceStatus.NOT_EXISTS:
                 logging.debug("Resource has already been removed. key: %s", key)
                 continue
@@ -383,6 +384,7 @@ class ExternalResourcesManager:
             for spec in self.secrets_reconciler.sync_secrets(specs=specs)
         }
 
+        synced_keys: set[ExternalResourceKey] = set()
         for key in to_sync_keys:
             if key in sync_error_spec_keys:
                 logging.error(
@@ -394,7 +396,8 @@ class ExternalResourcesManager:
                     ResourceStatus.CREATED,
                     key,
                 )
-                self.state_mgr.update_resource_status(key, ResourceStatus.CREATED)
+                synced_keys.add(key)
+        self.state_mgr.update_resource_statuses(synced_keys, ResourceStatus.CREATED)
 
     def _build_external_resource(
         self, spec: ExternalResourceSpec, er_inventory: ExternalResourcesInventory
@@ -410,9 +413,13 @@ class ExternalResourcesManager:
     def handle_resources(self) -> None:
         desired_r = self._get_desired_objects_reconciliations()
         deleted_r = self._get_deleted_objects_reconciliations()
+        reconciliations = desired_r.union(deleted_r)
+        states = self.state_mgr.get_external_resource_states(
+            r.key for r in reconciliations
+        )
         to_sync_keys: set[ExternalResourceKey] = set()
-        for r in desired_r.union(deleted_r):
-            state = self.state_mgr.get_external_resource_state(r.key)
+        for r in reconciliations:
+            state = states[r.key]
             status = self._get_reconciliation_status(r, state)
             self._update_resource_state(r, state, status)
 
@@ -439,8 +446,11 @@ class ExternalResourcesManager:
         reconciliations = desired_r.union(deleted_r)
         triggered: set[Reconciliation] = set()
 
+        states = self.state_mgr.get_external_resource_states(
+            r.key for r in reconciliations
+        )
         for r in reconciliations:
-            state = self.state_mgr.get_external_resource_state(key=r.key)
+            state = states[r.key]
             if (
                 r.action == Action.APPLY
                 and state.reconciliation.resource_hash != r.resource_hash
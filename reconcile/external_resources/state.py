@@ -1,10 +1,15 @@
 import logging
-from collections.abc import Mapping
+import time
+from collections.abc import (
+    Iterable,
+    Mapping,
+)
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any
 
 from pydantic import BaseModel
+from sretoolbox.utils import threaded
 
 from reconcile.external_resources.model import (
     ExternalResourceKey,
@@ -174,45 +179,121 @@ class ExternalResourcesStateDynamoDB:
         DynamoDBStateAdapter.RESOURCE_STATUS,
         f"{DynamoDBStateAdapter.RECONC}.{DynamoDBStateAdapter.RECONC_RESOURCE_HASH}",
     ])
+    # DynamoDB limits
+    BATCH_GET_SIZE = 100
+    BATCH_WRITE_SIZE = 25
+    BATCH_MAX_ATTEMPTS = 8
 
-    def __init__(self, aws_api: AWSApi, table_name: str) -> None:
+    def __init__(
+        self, aws_api: AWSApi, table_name: str, scan_segments: int = 4
+    ) -> None:
         self.adapter = DynamoDBStateAdapter()
         self.aws_api = aws_api
         self._table = table_name
+        self._scan_segments = scan_segments
+        # read-through cache of the full states read or written in this run
+        self._states: dict[ExternalResourceKey, ExternalResourceState] = {}
         self.partial_resources = self._get_partial_resources()
 
+    @property
+    def _client(self) -> Any:
+        return self.aws_api.dynamodb.boto3_client
+
+    def _key(self, key: ExternalResourceKey) -> dict[str, Any]:
+        return {self.adapter.ER_KEY_HASH: {"S": key.hash()}}
+
+    @staticmethod
+    def _not_exists(key: ExternalResourceKey) -> ExternalResourceState:
+        return ExternalResourceState(
+            key=key,
+            ts=datetime.now(UTC),
+            resource_status=ResourceStatus.NOT_EXISTS,
+            reconciliation=Reconciliation(key=key),
+            reconciliation_errors=0,
+        )
+
+    def _cached(self, key: ExternalResourceKey) -> ExternalResourceState | None:
+        # callers modify the returned states, hand out copies
+        state = self._states.get(key)
+        return state.copy(deep=True) if state else None
+
+    def _backoff(self, attempt: int, unprocessed: str) -> None:
+        if attempt >= self.BATCH_MAX_ATTEMPTS:
+            raise RuntimeError(
+                f"DynamoDB table {self._table} left {unprocessed} unprocessed"
+            )
+        time.sleep(min(0.05 * 2**attempt, 5))
+
     def get_external_resource_state(
         self, key: ExternalResourceKey
     ) -> ExternalResourceState:
-        data = self.aws_api.dynamodb.boto3_client.get_item(
-            TableName=self._table,
-            ConsistentRead=True,
-            Key={self.adapter.ER_KEY_HASH: {"S": key.hash()}},
+        if state := self._cached(key):
+            return state
+        data = self._client.get_item(
+            TableName=self._table, ConsistentRead=True, Key=self._key(key)
         )
         if "Item" in data:
-            return self.adapter.deserialize(data["Item"])
+            state = self.adapter.deserialize(data["Item"])
         else:
-            return ExternalResourceState(
-                key=key,
-                ts=datetime.now(UTC),
-                resource_status=ResourceStatus.NOT_EXISTS,
-                reconciliation=Reconciliation(key=key),
-                reconciliation_errors=0,
-            )
+            state = self._not_exists(key)
+        self._states[key] = state
+        return state.copy(deep=True)
+
+    def get_external_resource_states(
+        self, keys: Iterable[ExternalResourceKey]
+    ) -> dict[ExternalResourceKey, ExternalResourceState]:
+        """Gets the states of many resources with BatchGetItem. States already
+        read in this run are served from the cache.
+        """
+        keys = set(keys)
+        missing = {k.hash(): k for k in keys if k not in self._states}
+        hashes = list(missing)
+        for i in range(0, len(hashes), self.BATCH_GET_SIZE):
+            request: dict[str, Any] = {
+                self._table: {
+                    "Keys": [
+                        {self.adapter.ER_KEY_HASH: {"S": h}}
+                        for h in hashes[i : i + self.BATCH_GET_SIZE]
+                    ],
+                    "ConsistentRead": True,
+                }
+            }
+            attempt = 0
+            while request:
+                data = self._client.batch_get_item(RequestItems=request)
+                for item in data.get("Responses", {}).get(self._table, []):
+                    state = self.adapter.deserialize(item)
+                    self._states[missing[state.key.hash()]] = state
+                if request := data.get("UnprocessedKeys") or {}:
+                    attempt += 1
+                    self._backoff(attempt, "keys")
+        for key in missing.values():
+            self._states.setdefault(key, self._not_exists(key))
+        return {k: self._states[k].copy(deep=True) for k in keys}
 
     def set_external_resource_state(
         self,
         state: ExternalResourceState,
     ) -> None:
-        self.aws_api.dynamodb.boto3_client.put_item(
-            TableName=self._table, Item=self.adapter.serialize(state)
-        )
+        self._client.put_item(TableName=self._table, Item=self.adapter.serialize(state))
+        self._states[state.key] = state.copy(deep=True)
 
     def del_external_resource_state(self, key: ExternalResourceKey) -> None:
-        self.aws_api.dynamodb.boto3_client.delete_item(
-            TableName=self._table,
-            Key={self.adapter.ER_KEY_HASH: {"S": key.hash()}},
-        )
+        self._client.delete_item(TableName=self._table, Key=self._key(key))
+        self._states[key] = self._not_exists(key)
+
+    def _scan_segment(self, segment: int) -> list[ExternalResourceState]:
+        paginator = self._client.get_paginator("scan")
+        return [
+            self.adapter.deserialize(item, partial_data=True)
+            for page in paginator.paginate(
+                TableName=self._table,
+                ProjectionExpression=self.PARTIALS_PROJECTED_VALUES,
+                Segment=segment,
+                TotalSegments=self._scan_segments,
+            )
+            for item in page.get("Items", [])
+        ]
 
     def _get_partial_resources(
         self,
@@ -220,15 +301,15 @@ class ExternalResourcesStateDynamoDB:
         """A Partial Resoure is the minimum resource data reguired
         to check if a resource has been removed from the configuration.
         Getting less data from DynamoDb saves money and the logic does not need it.
+        The table is scanned in parallel segments, following every page.
         """
         logging.debug("Getting Managed resources from DynamoDb")
-        partials = {}
-        for item in self.aws_api.dynamodb.boto3_client.scan(
-            TableName=self._table, ProjectionExpression=self.PARTIALS_PROJECTED_VALUES
-        ).get("Items", []):
-            s = self.adapter.deserialize(item, partial_data=True)
-            partials[s.key] = s
-        return partials
+        segments = threaded.run(
+            self._scan_segment,
+            range(self._scan_segments),
+            thread_pool_size=self._scan_segments,
+        )
+        return {s.key: s for segment in segments for s in segment}
 
     def get_all_resource_keys(self) -> set[ExternalResourceKey]:
         return set(self.partial_resources)
@@ -245,10 +326,44 @@ class ExternalResourcesStateDynamoDB:
     def update_resource_status(
         self, key: ExternalResourceKey, status: ResourceStatus
     ) -> None:
-        self.aws_api.dynamodb.boto3_client.update_item(
+        self._client.update_item(
             TableName=self._table,
-            Key={self.adapter.ER_KEY_HASH: {"S": key.hash()}},
+            Key=self._key(key),
             UpdateExpression="set resource_status=:new_value",
             ExpressionAttributeValues={":new_value": {"S": status.value}},
             ReturnValues="UPDATED_NEW",
         )
+        if state := self._states.get(key):
+            state.resource_status = status
+
+    def update_resource_statuses(
+        self, keys: Iterable[ExternalResourceKey], status: ResourceStatus
+    ) -> None:
+        """Updates the status of many resources with BatchWriteItem.
+
+        BatchWriteItem only puts whole items, the current states are read
+        (mostly from the cache) first. Resources without a state are skipped.
+        """
+        states = [
+            state
+            for state in self.get_external_resource_states(keys).values()
+            if state.resource_status != ResourceStatus.NOT_EXISTS
+        ]
+        for state in states:
+            state.resource_status = status
+        for i in range(0, len(states), self.BATCH_WRITE_SIZE):
+            chunk = states[i : i + self.BATCH_WRITE_SIZE]
+            request: dict[str, Any] = {
+                self._table: [
+                    {"PutRequest": {"Item": self.adapter.serialize(state)}}
+                    for state in chunk
+                ]
+            }
+            attempt = 0
+            while request:
+                data = self._client.batch_write_item(RequestItems=request)
+                if request := data.get("UnprocessedItems") or {}:
+                    attempt += 1
+                    self._backoff(attempt, "items")
+            for state in chunk:
+                self._states[state.key] = state
@@ -4,7 +4,7 @@ from typing import Any
 
 from github import Github
 from github.GithubObject import NotSet  # type: ignore
-from sretoolbox.utils import retry
+from sretoolbox.utils import threaded
 
 from reconcile import (
     openshift_users,
@@ -18,7 +18,10 @@ from reconcile.utils.aggregated_list import (
     AggregatedDiffRunner,
     AggregatedList,
 )
-from reconcile.utils.raw_github_api import RawGithubApi
+from reconcile.utils.github_graphql import (
+    GithubGraphQLApi,
+    OrgMembership,
+)
 from reconcile.utils.secret_reader import SecretReader
 
 GH_BASE_URL = os.environ.get("GITHUB_API", "https://api.github.com")
@@ -131,49 +134,38 @@ def get_default_config():
     return next(iter(github_config["github"].values()))
 
 
-@retry()
-def get_org_and_teams(github, org_name):
-    org = github.get_organization(org_name)
-    teams = org.get_teams()
-    return org, teams
-
+def get_org_membership(org_name: str, gh_api_store: "GHApiStore") -> OrgMembership:
+    managed_teams = gh_api_store.managed_teams(org_name)
+    # if 'managedTeams' is not specified
+    # we manage all teams
+    is_managed = managed_teams is None or len(managed_teams) == 0
 
-@retry()
-def get_members(unit):
-    return [member.login for member in unit.get_members()]
+    return gh_api_store.graphql_api(org_name).org_membership(
+        org_name,
+        teams=None if is_managed else managed_teams,
+        members=is_managed,
+    )
 
 
-def fetch_current_state(gh_api_store):
+def fetch_current_state(gh_api_store, thread_pool_size=1):
     state = AggregatedList()
 
-    for org_name in gh_api_store.orgs():
-        g = gh_api_store.github(org_name)
-        raw_gh_api = gh_api_store.raw_github_api(org_name)
-        managed_teams = gh_api_store.managed_teams(org_name)
-        # if 'managedTeams' is not specified
-        # we manage all teams
-        is_managed = managed_teams is None or len(managed_teams) == 0
-
-        org, teams = get_org_and_teams(g, org_name)
-
+    org_names = list(gh_api_store.orgs())
+    memberships = threaded.run(
+        get_org_membership, org_names, thread_pool_size, gh_api_store=gh_api_store
+    )
+    for org_name, membership in zip(org_names, memberships, strict=True):
         org_members = None
-        if is_managed:
-            org_members = get_members(org)
-            org_members.extend(raw_gh_api.org_invitations(org_name))
-            org_members = [m.lower() for m in org_members]
+        if membership.members is not None:
+            org_members = [m.lower() for m in membership.members]
 
         all_team_members = []
-        for team in teams:
-            if not is_managed and team.name not in managed_teams:
-                continue
-
-            members = get_members(team)
-            members.extend(raw_gh_api.team_invitations(org.id, team.id))
+        for team_name, members in membership.teams.items():
             members = [m.lower() for m in members]
             all_team_members.extend(members)
 
             state.add(
-                {"service": "github-org-team", "org": org_name, "team": team.name},
+                {"service": "github-org-team", "org": org_name, "team": team_name},
                 members,
             )
         all_team_members = list(set(all_team_members))
@@ -277,7 +269,7 @@ class GHApiStore:
             managed_teams = org_config.get("managed_teams", None)
             self._orgs[org_name] = (
                 Github(token, base_url=GH_BASE_URL),
-                RawGithubApi(token),
+                GithubGraphQLApi(token),
                 managed_teams,
             )
 
@@ -287,7 +279,7 @@ class GHApiStore:
     def github(self, org_name):
         return self._orgs[org_name][0]
 
-    def raw_github_api(self, org_name):
+    def graphql_api(self, org_name):
         return self._orgs[org_name][1]
 
     def managed_teams(self, org_name):
@@ -425,11 +417,11 @@ def service_is(service):
     return lambda params: params.get("service") == service
 
 
-def run(dry_run):
+def run(dry_run, thread_pool_size=10):
     config = get_config()
     gh_api_store = GHApiStore(config)
 
-    current_state = fetch_current_state(gh_api_store)
+    current_state = fetch_current_state(gh_api_store, thread_pool_size)
     desired_state = fetch_desired_state()
 
     # Ensure current_state and desired_state match orgs
@@ -17,13 +17,17 @@ import gitlab
 from gitlab.v4.objects import (
     ProjectIssue,
     ProjectMergeRequest,
+    ProjectMergeRequestResourceLabelEvent,
 )
 from prometheus_client import (
     Counter,
     Gauge,
     Histogram,
 )
-from sretoolbox.utils import retry
+from sretoolbox.utils import (
+    retry,
+    threaded,
+)
 
 from reconcile import queries
 from reconcile.change_owners.change_types import ChangeTypePriority
@@ -277,21 +281,100 @@ def is_good_to_merge(labels):
     )
 
 
-def is_rebased(mr, gl: GitLabApi) -> bool:
-    target_branch = mr.target_branch
-    head = gl.project.commits.list(
+def get_target_branch_head(gl: GitLabApi, target_branch: str) -> str:
+    return gl.project.commits.list(
         ref_name=target_branch,
         per_page=1,
         page=1,
     )[0].id
+
+
+def is_rebased(mr, gl: GitLabApi, head: str | None = None) -> bool:
+    if head is None:
+        head = get_target_branch_head(gl, mr.target_branch)
     result = gl.project.repository_compare(mr.sha, head)
     return len(result["commits"]) == 0
 
 
+@dataclass(frozen=True)
+class MergeRequestData:
+    commits: int
+    label_events: list[ProjectMergeRequestResourceLabelEvent]
+
+
+class MergeRequestFetcher:
+    """
+    Fetches what housekeeping needs to know about the merge requests of a
+    project concurrently, with a bounded thread pool.
+
+    Commits and label events only change along with the merge request, so
+    they are cached by `updated_at` and `sha` for the lifetime of the
+    fetcher, i.e. across the merge retries and the rebase pass of a project.
+    Pipelines are fetched anew every time, they are what the retries wait for.
+    """
+
+    def __init__(self, gl: GitLabApi, thread_pool_size: int = 1) -> None:
+        self.gl = gl
+        self.thread_pool_size = thread_pool_size
+        self._data: dict[tuple[Any, ...], MergeRequestData] = {}
+        self._rebased: dict[tuple[str, str], bool] = {}
+
+    @staticmethod
+    def _key(mr: ProjectMergeRequest) -> tuple[Any, ...]:
+        attributes = mr.attributes
+        return (mr.iid, attributes.get("updated_at"), attributes.get("sha"))
+
+    def _fetch_data(self, mr: ProjectMergeRequest) -> MergeRequestData:
+        return MergeRequestData(
+            commits=len(mr.commits()),
+            label_events=self.gl.get_merge_request_label_events(mr),
+        )
+
+    def data(self, mrs: Iterable[ProjectMergeRequest]) -> dict[int, MergeRequestData]:
+        """Commits and label events by merge request iid."""
+        mrs = list(mrs)
+        missing = [mr for mr in mrs if self._key(mr) not in self._data]
+        fetched = threaded.run(self._fetch_data, missing, self.thread_pool_size)
+        for mr, mr_data in zip(missing, fetched, strict=True):
+            self._data[self._key(mr)] = mr_data
+        return {mr.iid: self._data[self._key(mr)] for mr in mrs}
+
+    def pipelines(self, mrs: Iterable[ProjectMergeRequest]) -> dict[int, list[dict]]:
+        """Pipelines by merge request iid, latest first."""
+        mrs = list(mrs)
+        pipelines = threaded.run(
+            self.gl.get_merge_request_pipelines, mrs, self.thread_pool_size
+        )
+        return {mr.iid: p for mr, p in zip(mrs, pipelines, strict=True)}
+
+    def _is_rebased(self, item: tuple[tuple[str, str], ProjectMergeRequest]) -> bool:
+        (_, head), mr = item
+        return is_rebased(mr, self.gl, head=head)
+
+    def rebased(self, mrs: Iterable[ProjectMergeRequest]) -> dict[int, bool]:
+        """Whether the merge requests are rebased on their target branch, by iid."""
+        mrs = list(mrs)
+        heads = {
+            branch: get_target_branch_head(self.gl, branch)
+            for branch in {mr.target_branch for mr in mrs}
+        }
+        missing: dict[tuple[str, str], ProjectMergeRequest] = {}
+        for mr in mrs:
+            key = (mr.sha, heads[mr.target_branch])
+            if key not in self._rebased:
+                missing[key] = mr
+        compared = threaded.run(
+            self._is_rebased, list(missing.items()), self.thread_pool_size
+        )
+        self._rebased.update(zip(missing, compared, strict=True))
+        return {mr.iid: self._rebased[mr.sha, heads[mr.target_branch]] for mr in mrs}
+
+
 def get_merge_requests(
     dry_run: bool,
     gl: GitLabApi,
     users_allowed_to_label: Iterable[str] | None = None,
+    mr_fetcher: MergeRequestFetcher | None = None,
 ) -> list[dict[str, Any]]:
     mrs = gl.get_merge_requests(state=MRState.OPENED)
     return preprocess_merge_requests(
@@ -299,6 +382,7 @@ def get_merge_requests(
         gl=gl,
         project_merge_requests=mrs,
         users_allowed_to_label=users_allowed_to_label,
+        mr_fetcher=mr_fetcher,
     )
 
 
@@ -307,22 +391,30 @@ def preprocess_merge_requests(
     gl: GitLabApi,
     project_merge_requests: list[ProjectMergeRequest],
     users_allowed_to_label: Iterable[str] | None = None,
+    mr_fetcher: MergeRequestFetcher | None = None,
 ) -> list[dict[str, Any]]:
-    results = []
-    for mr in project_merge_requests:
-        if mr.merge_status in {
+    if mr_fetcher is None:
+        mr_fetcher = MergeRequestFetcher(gl)
+    candidates = [
+        mr
+        for mr in project_merge_requests
+        if mr.merge_status
+        not in {
             MRStatus.CANNOT_BE_MERGED,
             MRStatus.CANNOT_BE_MERGED_RECHECK,
-        }:
-            continue
-        if mr.draft:
-            continue
-        if len(mr.commits()) == 0:
+        }
+        and not mr.draft
+        and mr.labels
+    ]
+    mrs_data = mr_fetcher.data(candidates)
+
+    results = []
+    for mr in candidates:
+        mr_data = mrs_data[mr.iid]
+        if mr_data.commits == 0:
             continue
 
         labels = set(mr.labels)
-        if not labels:
-            continue
 
         if (
             SAAS_FILE_UPDATE in labels or SELF_SERVICEABLE in labels
@@ -335,7 +427,7 @@ def preprocess_merge_requests(
                 gl.remove_label(mr, LGTM)
             continue
 
-        label_events = gl.get_merge_request_label_events(mr)
+        label_events = mr_data.label_events
         approval_found = False
         labels_by_unauthorized_users = set()
         labels_by_authorized_users = set()
@@ -405,16 +497,22 @@ def rebase_merge_requests(
     gl_instance=None,
     gl_settings=None,
     users_allowed_to_label=None,
+    mr_fetcher: MergeRequestFetcher | None = None,
 ):
+    if mr_fetcher is None:
+        mr_fetcher = MergeRequestFetcher(gl)
     rebases = 0
     merge_requests = [
-        item["mr"] for item in get_merge_requests(dry_run, gl, users_allowed_to_label)
+        item["mr"]
+        for item in get_merge_requests(
+            dry_run, gl, users_allowed_to_label, mr_fetcher=mr_fetcher
+        )
     ]
+    rebased = mr_fetcher.rebased(merge_requests)
+    merge_requests = [mr for mr in merge_requests if not rebased[mr.iid]]
+    mrs_pipelines = mr_fetcher.pipelines(merge_requests)
     for mr in merge_requests:
-        if is_rebased(mr, gl):
-            continue
-
-        pipelines = gl.get_merge_request_pipelines(mr)
+        pipelines = mrs_pipelines[mr.iid]
 
         # If pipeline_timeout is None no pipeline will be canceled
         if pipeline_timeout is not None:
@@ -477,21 +575,26 @@ def merge_merge_requests(
     gl_instance=None,
     gl_settings=None,
     users_allowed_to_label=None,
+    mr_fetcher: MergeRequestFetcher | None = None,
 ):
+    if mr_fetcher is None:
+        mr_fetcher = MergeRequestFetcher(gl)
     merges = 0
     if reload_toggle.reload:
         project_merge_requests = gl.get_merge_requests(state=MRState.OPENED)
     merge_requests = preprocess_merge_requests(
-        dry_run, gl, project_merge_requests, users_allowed_to_label
+        dry_run, gl, project_merge_requests, users_allowed_to_label, mr_fetcher
     )
     merge_requests_waiting.labels(gl.project.id).set(len(merge_requests))
 
+    if rebase:
+        rebased = mr_fetcher.rebased(item["mr"] for item in merge_requests)
+        merge_requests = [item for item in merge_requests if rebased[item["mr"].iid]]
+    mrs_pipelines = mr_fetcher.pipelines(item["mr"] for item in merge_requests)
+
     for merge_request in merge_requests:
         mr: ProjectMergeRequest = merge_request["mr"]
-        if rebase and not is_rebased(mr, gl):
-            continue
-
-        pipelines = gl.get_merge_request_pipelines(mr)
+        pipelines = mrs_pipelines[mr.iid]
         if not pipelines:
             continue
 
@@ -571,7 +674,7 @@ def publish_access_token_expiration_metrics(gl: GitLabApi) -> None:
                 gitlab_token_expiration.remove(pat.name)
 
 
-def run(dry_run, wait_for_pipeline):
+def run(dry_run, wait_for_pipeline, thread_pool_size=10):
     default_days_interval = 15
     default_limit = 8
     default_enable_closing = False
@@ -623,6 +726,7 @@ def run(dry_run, wait_for_pipeline):
                 mr for mr in opened_merge_requests if mr.state == MRState.OPENED
             ]
             reload_toggle = ReloadToggle(reload=False)
+            mr_fetcher = MergeRequestFetcher(gl, thread_pool_size)
             rebase = hk.get("rebase")
             try:
                 merge_merge_requests(
@@ -639,6 +743,7 @@ def run(dry_run, wait_for_pipeline):
                     gl_instance=instance,
                     gl_settings=settings,
                     users_allowed_to_label=users_allowed_to_label,
+                    mr_fetcher=mr_fetcher,
                 )
             except Exception:
                 logging.error(
@@ -657,6 +762,7 @@ def run(dry_run, wait_for_pipeline):
                     gl_instance=instance,
                     gl_settings=settings,
                     users_allowed_to_label=users_allowed_to_label,
+                    mr_fetcher=mr_fetcher,
                 )
             if rebase:
                 rebase_merge_requests(
@@ -668,4 +774,5 @@ def run(dry_run, wait_for_pipeline):
                     gl_instance=instance,
                     gl_settings=settings,
                     users_allowed_to_label=users_allowed_to_label,
+                    mr_fetcher=mr_fetcher,
                 )
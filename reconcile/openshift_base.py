@@ -1,5 +1,6 @@
 import itertools
 import logging
+import os
 from collections import Counter
 from collections.abc import (
     Iterable,
@@ -17,6 +18,7 @@ from typing import (
 )
 
 import yaml
+from kubernetes.dynamic.exceptions import ForbiddenError
 from sretoolbox.utils import (
     retry,
     threaded,
@@ -52,6 +54,12 @@ from reconcile.utils.three_way_diff_strategy import three_way_diff_using_hash
 
 ACTION_APPLIED = "applied"
 ACTION_DELETED = "deleted"
+# fetch the current state of a kind with a single cluster wide LIST if it is
+# managed in at least this many namespaces of a cluster. 0 (default) disables
+# it, cluster wide LISTs are opt-in.
+CLUSTER_WIDE_LIST_NAMESPACE_THRESHOLD = int(
+    os.environ.get("OC_CLUSTER_WIDE_LIST_NAMESPACE_THRESHOLD", "0")
+)
 
 
 class ValidationError(Exception):
@@ -82,7 +90,25 @@ class DesiredStateSpec(BaseStateSpec):
     privileged: bool = False
 
 
-StateSpec = CurrentStateSpec | DesiredStateSpec
+@dataclass
+class ClusterWideCurrentStateSpec:
+    """
+    Fetches the current state of a kind in many namespaces of a cluster
+    with a single cluster wide LIST.
+    """
+
+    oc: OCClient = field(compare=False, repr=False)
+    cluster: str
+    kind: str
+    namespace_specs: list[CurrentStateSpec] = field(repr=False)
+    labels: Mapping[str, str] | None = None
+
+    @property
+    def namespaces(self) -> set[str]:
+        return {s.namespace for s in self.namespace_specs}
+
+
+StateSpec = CurrentStateSpec | ClusterWideCurrentStateSpec | DesiredStateSpec
 
 
 @runtime_checkable
@@ -285,13 +311,113 @@ def init_specs_to_fetch(
     return state_specs
 
 
+def plan_current_state_fetch(
+    state_specs: Iterable[StateSpec],
+    namespace_threshold: int = CLUSTER_WIDE_LIST_NAMESPACE_THRESHOLD,
+    labels: Mapping[str, str] | None = None,
+) -> list[StateSpec]:
+    """
+    Replaces the namespaced current state specs of a kind in a cluster with a
+    single ClusterWideCurrentStateSpec, if the kind is managed in at least
+    `namespace_threshold` namespaces of that cluster. Specs for specific
+    resource names and cluster scoped specs are kept as they are.
+    """
+    if namespace_threshold <= 0:
+        return list(state_specs)
+
+    planned: list[StateSpec] = []
+    # specs of privileged and unprivileged namespaces use different clients
+    groups: dict[tuple[str, str, int], list[CurrentStateSpec]] = {}
+    for spec in state_specs:
+        if (
+            isinstance(spec, CurrentStateSpec)
+            and not spec.resource_names
+            and spec.namespace != "cluster"
+        ):
+            groups.setdefault((spec.cluster, spec.kind, id(spec.oc)), []).append(spec)
+        else:
+            planned.append(spec)
+
+    for (cluster, kind, _), specs in groups.items():
+        if len(specs) < namespace_threshold:
+            planned.extend(specs)
+            continue
+        planned.append(
+            ClusterWideCurrentStateSpec(
+                oc=specs[0].oc,
+                cluster=cluster,
+                kind=kind,
+                namespace_specs=specs,
+                labels=labels,
+            )
+        )
+    return planned
+
+
+def populate_cluster_wide_current_state(
+    spec: ClusterWideCurrentStateSpec,
+    ri: ResourceInventory,
+    integration: str,
+    integration_version: str,
+    caller: str | None = None,
+) -> None:
+    """
+    Lists a kind in all namespaces of a cluster and splits the items into
+    the managed namespaces of the ResourceInventory. Falls back to namespaced
+    LISTs if the cluster wide LIST is not possible, e.g. due to missing
+    permissions.
+    """
+    if not spec.oc.is_kind_supported(spec.kind):
+        msg = f"[{spec.cluster}] cluster has no API resource {spec.kind}."
+        logging.warning(msg)
+        return
+    namespaces = spec.namespaces
+    current: list[tuple[str, OR]] = []
+    try:
+        kwargs: dict[str, Any] = {"all_namespaces": True}
+        if spec.labels:
+            kwargs["labels"] = spec.labels
+        for item in spec.oc.iter_items(spec.kind, **kwargs):
+            namespace = item["metadata"].get("namespace")
+            if namespace not in namespaces:
+                continue
+            openshift_resource = OR(item, integration, integration_version)
+            if caller and openshift_resource.caller != caller:
+                continue
+            current.append((namespace, openshift_resource))
+    except (StatusCodeError, ForbiddenError) as e:
+        logging.info(
+            f"[{spec.cluster}] cluster wide LIST of {spec.kind} failed, "
+            f"falling back to namespaced LISTs: {e!s}"
+        )
+        for namespace_spec in spec.namespace_specs:
+            populate_current_state(
+                namespace_spec, ri, integration, integration_version, caller
+            )
+        return
+
+    for namespace, openshift_resource in current:
+        ri.add_current(
+            spec.cluster,
+            namespace,
+            spec.kind,
+            openshift_resource.name,
+            openshift_resource,
+        )
+
+
 def populate_current_state(
-    spec: CurrentStateSpec,
+    spec: CurrentStateSpec | ClusterWideCurrentStateSpec,
     ri: ResourceInventory,
     integration: str,
     integration_version: str,
     caller: str | None = None,
 ):
+    if isinstance(spec, ClusterWideCurrentStateSpec):
+        populate_cluster_wide_current_state(
+            spec, ri, integration, integration_version, caller
+        )
+        return
     # if spec.oc is None: - oc can't be none because init_namespace_specs_to_fetch does not create specs if oc is none
     #    return
     if not spec.oc.is_kind_supported(spec.kind):
@@ -299,7 +425,8 @@ def populate_current_state(
         logging.warning(msg)
         return
     try:
-        for item in spec.oc.get_items(
+        # items are consumed as they are fetched to keep memory usage flat
+        for item in spec.oc.iter_items(
             spec.kind,
             namespace=spec.namespace,
             resource_names=spec.resource_names,
@@ -359,7 +486,7 @@ def fetch_current_state(
     )
     threaded.run(
         populate_current_state,
-        state_specs,
+        plan_current_state_fetch(state_specs),
         thread_pool_size,
         ri=ri,
         integration=integration,
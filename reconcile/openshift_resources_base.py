@@ -733,6 +733,10 @@ def fetch_states(
                 spec.kind,
                 spec.resource_names,
             )
+        if isinstance(spec, ob.ClusterWideCurrentStateSpec):
+            ob.populate_cluster_wide_current_state(
+                spec, ri, QONTRACT_INTEGRATION, QONTRACT_INTEGRATION_VERSION
+            )
         if isinstance(spec, ob.DesiredStateSpec):
             fetch_desired_state(
                 spec.oc,
@@ -773,7 +777,13 @@ def fetch_data(
     state_specs = ob.init_specs_to_fetch(
         ri, oc_map, namespaces=namespaces, override_managed_types=overrides
     )
-    threaded.run(fetch_states, state_specs, thread_pool_size, ri=ri, settings=settings)
+    threaded.run(
+        fetch_states,
+        ob.plan_current_state_fetch(state_specs),
+        thread_pool_size,
+        ri=ri,
+        settings=settings,
+    )
 
     return oc_map, ri
 
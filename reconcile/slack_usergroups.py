@@ -56,6 +56,7 @@ from reconcile.utils.pagerduty_api import (
     PagerDutyApiException,
     PagerDutyMap,
     get_pagerduty_map,
+    get_pagerduty_resource,
 )
 from reconcile.utils.repo_owners import RepoOwners
 from reconcile.utils.secret_reader import (
@@ -241,12 +242,7 @@ def get_usernames_from_pagerduty(
     all_output_usernames = []
     all_pagerduty_names = [get_pagerduty_name(u) for u in users]
     for pagerduty in pagerduties:
-        if pagerduty.schedule_id is not None:
-            pd_resource_type = "schedule"
-            pd_resource_id = pagerduty.schedule_id
-        if pagerduty.escalation_policy_id is not None:
-            pd_resource_type = "escalationPolicy"
-            pd_resource_id = pagerduty.escalation_policy_id
+        pd_resource_type, pd_resource_id = get_pagerduty_resource(pagerduty)
 
         pd = pagerduty_map.get(pagerduty.instance.name)
         try:
@@ -403,17 +399,20 @@ def get_desired_state(
 ) -> SlackState:
     """Get the desired state of Slack usergroups."""
     desired_state: SlackState = {}
+    permissions = [
+        p
+        for p in permissions
+        if not p.skip
+        and p.workspace.managed_usergroups
+        and (not desired_workspace_name or desired_workspace_name == p.workspace.name)
+        and (not desired_usergroup_name or desired_usergroup_name == p.handle)
+    ]
+    # many usergroups share schedules, resolve each of them once up front
+    pagerduty_map.prefetch(
+        pagerduty for p in permissions for pagerduty in p.pagerduty or []
+    )
     for p in permissions:
-        if p.skip:
-            continue
-        if not p.workspace.managed_usergroups:
-            continue
-
-        if desired_workspace_name and desired_workspace_name != p.workspace.name:
-            continue
         usergroup = p.handle
-        if desired_usergroup_name and desired_usergroup_name != usergroup:
-            continue
         if usergroup not in p.workspace.managed_usergroups:
             raise KeyError(
                 f"[{p.workspace.name}] usergroup {usergroup} \
@@ -581,6 +580,13 @@ def _update_usergroup_users_from_state(
             f"Following usernames are incorrect for usergroup {desired_ug_state.usergroup} and could not be matched with slack users {desired_ug_state.user_names - active_user_names}"
         )
 
+    if current_ug_state and active_user_names == current_ug_state.user_names:
+        # only unknown users are missing, an update wouldn't change anything
+        logging.debug(
+            f"No usergroup user changes detected for {desired_ug_state.usergroup}"
+        )
+        return 0
+
     for user in active_user_names - current_ug_state.user_names:
         logging.info([
             "add_user_to_usergroup",
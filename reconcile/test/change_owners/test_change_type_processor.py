@@ -1,10 +1,15 @@
 import pytest
 from jsonpath_ng.exceptions import JsonPathParserError
 
-from reconcile.change_owners.bundle import BundleFileType
+from reconcile.change_owners.bundle import (
+    BundleFileType,
+    FileRef,
+)
 from reconcile.change_owners.change_types import (
     ChangeTypeContext,
     ChangeTypeProcessor,
+    ChangeTypeProcessorIndex,
+    PathExpression,
 )
 from reconcile.gql_definitions.change_owners.queries.change_types import ChangeTypeV1
 from reconcile.test.change_owners.fixtures import (
@@ -136,3 +141,66 @@ def test_change_type_processor_allowed_paths_conditions_ct_without_schema_file_w
     )
 
     assert {str(p) for p in paths} == {"$"}
+
+
+#
+# change type processor index
+#
+
+
+def test_change_type_processor_index() -> None:
+    namespace_owner = build_change_type(
+        "namespace-owner", ["description"], context_schema="namespace-1.yml"
+    )
+    role_member = build_change_type(
+        "role-member",
+        ["roles"],
+        change_schema="user-1.yml",
+        context_schema="role-1.yml",
+    )
+    any_file_owner = build_change_type("any-file-owner", ["$"])
+    index = ChangeTypeProcessorIndex([namespace_owner, role_member, any_file_owner])
+
+    def names(schema: str | None) -> list[str]:
+        file_ref = FileRef(
+            file_type=BundleFileType.DATAFILE, path="/file.yml", schema=schema
+        )
+        return [ctp.name for ctp in index.processors_for(file_ref)]
+
+    assert names("namespace-1.yml") == ["namespace-owner", "any-file-owner"]
+    assert names("user-1.yml") == ["role-member", "any-file-owner"]
+    assert names("role-1.yml") == ["role-member", "any-file-owner"]
+    assert names("cluster-1.yml") == ["any-file-owner"]
+    assert names(None) == ["any-file-owner"]
+
+
+#
+# path expressions
+#
+
+
+def test_path_expression_renders_once_per_context_file() -> None:
+    processor = build_change_type("owner", ["a"])
+    expression = PathExpression("owners[?(@.path=='{{ ctx_file_path }}')].name")
+    content = {"owners": [{"path": "/a.yml", "name": "a"}, {"path": "/b.yml"}]}
+
+    def ctx(path: str) -> ChangeTypeContext:
+        return ChangeTypeContext(
+            change_type_processor=processor,
+            context="RoleV1 - some role",
+            origin="",
+            approvers=[],
+            context_file=FileRef(
+                file_type=BundleFileType.DATAFILE, path=path, schema=None
+            ),
+        )
+
+    jsonpath = expression.jsonpath_for_context(ctx("/a.yml"))
+    assert expression.jsonpath_for_context(ctx("/a.yml")) is jsonpath
+    assert expression.jsonpath_for_context(ctx("/b.yml")) is not jsonpath
+
+    paths = expression.find_paths(ctx("/a.yml"), content)
+    assert [str(p) for p in paths] == ["owners.[0].name"]
+    assert expression.find_paths(ctx("/a.yml"), content) is paths
+    # other documents are searched again
+    assert expression.find_paths(ctx("/a.yml"), {"owners": []}) == []
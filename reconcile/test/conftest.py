@@ -18,9 +18,17 @@ from reconcile.gql_definitions.fragments.vault_secret import VaultSecret
 from reconcile.test.fixtures import Fixtures
 from reconcile.utils.gql import GqlApi
 from reconcile.utils.models import data_default_none
+from reconcile.utils.slack_api import clear_directory_cache
 from reconcile.utils.state import State
 
 
+@pytest.fixture(autouse=True)
+def slack_directory_cache() -> Iterable[None]:
+    # the Slack directory cache is process-wide, don't share it between tests
+    yield
+    clear_directory_cache()
+
+
 @pytest.fixture
 def patch_sleep(mocker):
     yield mocker.patch.object(time, "sleep")
@@ -1,11 +1,19 @@
-from collections.abc import Mapping
+from collections.abc import (
+    Iterator,
+    Mapping,
+)
 from typing import Any
+from unittest.mock import Mock
 
+import boto3
+from moto import mock_dynamodb2
 from pytest import fixture
 
 from reconcile.external_resources.state import (
     DynamoDBStateAdapter,
+    ExternalResourcesStateDynamoDB,
     ExternalResourceState,
+    ResourceStatus,
 )
 
 
@@ -60,3 +68,136 @@ def test_dynamodb_deserialize(
     adapter = DynamoDBStateAdapter()
     result = adapter.deserialize(dynamodb_serialized_values)
     assert result == state
+
+
+@fixture
+def dynamodb_client() -> Iterator[Any]:
+    with mock_dynamodb2():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="state",
+            KeySchema=[
+                {"AttributeName": DynamoDBStateAdapter.ER_KEY_HASH, "KeyType": "HASH"}
+            ],
+            AttributeDefinitions=[
+                {
+                    "AttributeName": DynamoDBStateAdapter.ER_KEY_HASH,
+                    "AttributeType": "S",
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield client
+
+
+def build_state(
+    state: ExternalResourceState,
+    identifier: str,
+    status: ResourceStatus,
+    resource_hash: str = "0000111100001111",
+) -> ExternalResourceState:
+    key = state.key.copy(update={"identifier": identifier})
+    return state.copy(
+        update={
+            "key": key,
+            "resource_status": status,
+            "reconciliation": state.reconciliation.copy(
+                update={"key": key, "resource_hash": resource_hash}
+            ),
+        },
+        deep=True,
+    )
+
+
+def build_state_manager(dynamodb_client: Any) -> ExternalResourcesStateDynamoDB:
+    aws_api = Mock()
+    aws_api.dynamodb.boto3_client = dynamodb_client
+    return ExternalResourcesStateDynamoDB(aws_api=aws_api, table_name="state")
+
+
+def test_state_partial_resources_paginated(
+    dynamodb_client: Any, state: ExternalResourceState
+) -> None:
+    adapter = DynamoDBStateAdapter()
+    # ~1.5MB of projected values, more than a single scan page
+    for i in range(30):
+        s = build_state(state, f"r-{i}", ResourceStatus.CREATED, "x" * 50_000)
+        dynamodb_client.put_item(TableName="state", Item=adapter.serialize(s))
+
+    state_mgr = build_state_manager(dynamodb_client)
+
+    assert len(state_mgr.get_all_resource_keys()) == 30
+    assert len(state_mgr.get_keys_by_status(ResourceStatus.CREATED)) == 30
+
+
+def test_state_get_external_resource_states(
+    dynamodb_client: Any, state: ExternalResourceState
+) -> None:
+    adapter = DynamoDBStateAdapter()
+    states = [build_state(state, f"r-{i}", ResourceStatus.CREATED) for i in range(150)]
+    for s in states:
+        dynamodb_client.put_item(TableName="state", Item=adapter.serialize(s))
+    missing = build_state(state, "missing", ResourceStatus.CREATED).key
+    state_mgr = build_state_manager(dynamodb_client)
+
+    result = state_mgr.get_external_resource_states([s.key for s in states] + [missing])
+
+    assert len(result) == 151
+    assert result[states[0].key] == states[0]
+    assert result[missing].resource_status == ResourceStatus.NOT_EXISTS
+
+    # served from the cache
+    dynamodb_client.delete_item(
+        TableName="state", Key={adapter.ER_KEY_HASH: {"S": states[0].key.hash()}}
+    )
+    assert state_mgr.get_external_resource_state(states[0].key) == states[0]
+
+
+def test_state_cache_updated_on_write(
+    dynamodb_client: Any, state: ExternalResourceState
+) -> None:
+    state_mgr = build_state_manager(dynamodb_client)
+    s = build_state(state, "r", ResourceStatus.IN_PROGRESS)
+
+    state_mgr.set_external_resource_state(s)
+    cached = state_mgr.get_external_resource_state(s.key)
+    assert cached == s
+    # the cache hands out copies
+    cached.resource_status = ResourceStatus.ERROR
+    assert state_mgr.get_external_resource_state(s.key) == s
+
+    state_mgr.update_resource_status(s.key, ResourceStatus.CREATED)
+    assert (
+        state_mgr.get_external_resource_state(s.key).resource_status
+        == ResourceStatus.CREATED
+    )
+
+    state_mgr.del_external_resource_state(s.key)
+    assert (
+        state_mgr.get_external_resource_state(s.key).resource_status
+        == ResourceStatus.NOT_EXISTS
+    )
+
+
+def test_state_update_resource_statuses(
+    dynamodb_client: Any, state: ExternalResourceState
+) -> None:
+    adapter = DynamoDBStateAdapter()
+    states = [
+        build_state(state, f"r-{i}", ResourceStatus.PENDING_SECRET_SYNC)
+        for i in range(30)
+    ]
+    for s in states:
+        dynamodb_client.put_item(TableName="state", Item=adapter.serialize(s))
+    missing = build_state(state, "missing", ResourceStatus.CREATED).key
+
+    build_state_manager(dynamodb_client).update_resource_statuses(
+        [s.key for s in states] + [missing], ResourceStatus.CREATED
+    )
+
+    state_mgr = build_state_manager(dynamodb_client)
+    assert len(state_mgr.get_keys_by_status(ResourceStatus.CREATED)) == 30
+    assert state_mgr.get_all_resource_keys() == {s.key for s in states}
+    assert state_mgr.get_external_resource_state(states[0].key) == states[0].copy(
+        update={"resource_status": ResourceStatus.CREATED}
+    )
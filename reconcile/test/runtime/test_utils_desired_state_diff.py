@@ -1,3 +1,4 @@
+import os
 from time import sleep
 from typing import Any
 
@@ -19,7 +20,9 @@ from reconcile.utils.runtime.desired_state_diff import (
     DiffDetectionFailure,
     DiffDetectionTimeout,
     build_desired_state_diff,
+    build_digest_tree,
     extract_diffs_with_timeout,
+    prune_unchanged_subtrees,
 )
 from reconcile.utils.runtime.integration import DesiredStateShardConfig
 
@@ -143,6 +146,68 @@ def test_desired_state_diff_building_time(
     assert diff.affected_shards == set()
 
 
+def test_desired_state_diff_building_only_extracts_changed_subtrees(
+    mocker: MockerFixture, shardable_test_integration: ShardableTestIntegration
+):
+    extract_diffs_with_timeout_mock = mocker.patch.object(
+        desired_state_diff, "extract_diffs_with_timeout", return_value=[]
+    )
+    build_desired_state_diff(
+        shardable_test_integration.get_desired_state_shard_config(),
+        previous_desired_state={
+            "unchanged": {"big": ["state"]},
+            "shards": [{"shard": "a", "value": "old"}],
+        },
+        current_desired_state={
+            "unchanged": {"big": ["state"]},
+            "shards": [{"shard": "a", "value": "new"}],
+        },
+    )
+    kwargs = extract_diffs_with_timeout_mock.call_args.kwargs
+    assert kwargs["previous_desired_state"] == {
+        "shards": [{"shard": "a", "value": "old"}]
+    }
+    assert kwargs["current_desired_state"] == {
+        "shards": [{"shard": "a", "value": "new"}]
+    }
+
+
+#
+# digest tree
+#
+
+
+def test_digest_tree_ignores_key_and_item_order():
+    assert (
+        build_digest_tree({"a": [1, 2, {"x": 1, "y": 2}], "b": "c"}).digest
+        == build_digest_tree({"b": "c", "a": [{"y": 2, "x": 1}, 2, 1]}).digest
+    )
+
+
+def test_digest_tree_detects_changes():
+    assert build_digest_tree({"a": 1}).digest != build_digest_tree({"a": "1"}).digest
+    assert build_digest_tree({"a": [1]}).digest != build_digest_tree({"a": 1}).digest
+    assert build_digest_tree({"a": {}}).digest != build_digest_tree({"a": []}).digest
+    assert build_digest_tree({"a": 1}).digest != build_digest_tree({"b": 1}).digest
+
+
+def test_prune_unchanged_subtrees():
+    previous = {
+        "same": {"x": 1},
+        "nested": {"same": [1, 2], "changed": 1, "removed": 1},
+    }
+    current = {
+        "same": {"x": 1},
+        "nested": {"same": [2, 1], "changed": 2, "added": 1},
+    }
+    assert prune_unchanged_subtrees(
+        previous, current, build_digest_tree(previous), build_digest_tree(current)
+    ) == (
+        {"nested": {"changed": 1, "removed": 1}},
+        {"nested": {"changed": 2, "added": 1}},
+    )
+
+
 #
 # extract diffs
 #
@@ -211,6 +276,43 @@ def test_extract_diffs_with_exception():
         )
 
 
+def diff_extraction_returning_worker_pid(
+    old_file_content: Any, new_file_content: Any
+) -> list[int]:
+    return [os.getpid()]
+
+
+def test_extract_diffs_reuses_worker_process():
+    pids = {
+        extract_diffs_with_timeout(
+            diff_extraction_returning_worker_pid,  # type: ignore[arg-type]
+            previous_desired_state={},
+            current_desired_state={},
+            timeout_seconds=100,
+        )[0]
+        for _ in range(3)
+    }
+    assert len(pids) == 1
+    assert os.getpid() not in pids
+
+
+def test_extract_diffs_replaces_timed_out_worker():
+    with pytest.raises(DiffDetectionTimeout):
+        extract_diffs_with_timeout(
+            diff_extration_with_3_second_sleep,
+            previous_desired_state={},
+            current_desired_state={},
+            timeout_seconds=1,
+        )
+    diffs = extract_diffs_with_timeout(
+        diff_extraction_returning_worker_pid,  # type: ignore[arg-type]
+        previous_desired_state={},
+        current_desired_state={},
+        timeout_seconds=100,
+    )
+    assert diffs
+
+
 #
 # find changed shards
 #
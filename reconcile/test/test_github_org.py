@@ -6,63 +6,27 @@ from reconcile.utils import (
     gql,
 )
 from reconcile.utils.aggregated_list import AggregatedList
+from reconcile.utils.github_graphql import OrgMembership
 
 from .fixtures import Fixtures
 
 fxt = Fixtures("github_org")
 
 
-class RawGithubApiMock:
-    @staticmethod
-    def org_invitations(org_name):
-        return []
-
-    @staticmethod
-    def team_invitations(org_id, team_id):
-        return []
-
-
-class AttrDict(dict):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.__dict__ = self
-
-
-class GithubMock:
+class GithubGraphQLApiMock:
     def __init__(self, spec):
         self.spec = spec
 
-    class GithubOrgMock:
-        def __init__(self, spec_org):
-            self.spec_org = spec_org
-
-        @property
-        def id(self):
-            return self.spec_org["id"]
-
-        class GithubTeamMock:
-            def __init__(self, spec_team):
-                self.spec_team = spec_team
-
-            def get_members(self):
-                return map(AttrDict, self.spec_team["members"])
-
-            @property
-            def id(self):
-                return self.spec_team["name"]
-
-            @property
-            def name(self):
-                return self.spec_team["name"]
-
-        def get_members(self):
-            return map(AttrDict, self.spec_org["members"])
-
-        def get_teams(self):
-            return map(self.GithubTeamMock, self.spec_org["teams"])
-
-    def get_organization(self, org_name):
-        return self.GithubOrgMock(self.spec[org_name])
+    def org_membership(self, org_name, teams=None, members=True):
+        spec_org = self.spec[org_name]
+        return OrgMembership(
+            members=[m["login"] for m in spec_org["members"]] if members else None,
+            teams={
+                team["name"]: [m["login"] for m in team["members"]]
+                for team in spec_org["teams"]
+                if teams is None or team["name"] in teams
+            },
+        )
 
 
 def get_items_by_params(state, params):
@@ -86,11 +50,10 @@ class TestGithubOrg:
         fixture = fxt.get_anymarkup(path)
 
         with (
-            patch("reconcile.github_org.RawGithubApi") as m_rga,
-            patch("reconcile.github_org.Github") as m_gh,
+            patch("reconcile.github_org.GithubGraphQLApi") as m_gql_api,
+            patch("reconcile.github_org.Github"),
         ):
-            m_gh.return_value = GithubMock(fixture["gh_api"])
-            m_rga.return_value = RawGithubApiMock()
+            m_gql_api.return_value = GithubGraphQLApiMock(fixture["gh_api"])
 
             gh_api_store = github_org.GHApiStore(config.get_config())
             current_state = github_org.fetch_current_state(gh_api_store)
@@ -126,31 +89,3 @@ class TestGithubOrg:
 
     def test_desired_state_simple(self):
         self.do_desired_state_test("desired_state_simple.yml")
-
-    def test_get_members(self):
-        class SimpleMemberMock:
-            def __init__(self, login):
-                self.login = login
-
-        class SimpleOrgMock:
-            @staticmethod
-            def get_members():
-                return [SimpleMemberMock("a"), SimpleMemberMock("b")]
-
-        org = SimpleOrgMock()
-        assert github_org.get_members(org) == ["a", "b"]
-
-    def test_get_org_teams(self):
-        class SimpleOrgMock:
-            @staticmethod
-            def get_teams():
-                return ["teams"]
-
-        class SimpleGithubMock:
-            @staticmethod
-            def get_organization(org_name):
-                return SimpleOrgMock()
-
-        g = SimpleGithubMock()
-        _, teams = github_org.get_org_and_teams(g, "org")
-        assert teams == ["teams"]
@@ -331,3 +331,92 @@ def test_close_item_without_enable_closing(
         1,
     ])
     mocked_logging.info.assert_not_called()
+
+
+def build_merge_request(iid: int, updated_at: str, sha: str = "sha") -> Mock:
+    mr = create_autospec(ProjectMergeRequest)
+    mr.iid = iid
+    mr.sha = sha
+    mr.target_branch = "master"
+    mr.attributes = {"updated_at": updated_at, "sha": sha}
+    mr.commits.return_value = [create_autospec(ProjectCommit)]
+    return mr
+
+
+def test_merge_request_fetcher_data_cached(project: Project) -> None:
+    mocked_gl = create_autospec(GitLabApi)
+    mocked_gl.project = project
+    mocked_gl.get_merge_request_label_events.return_value = ["event"]
+    fetcher = gl_h.MergeRequestFetcher(mocked_gl, thread_pool_size=2)
+    mr1 = build_merge_request(1, "2023-01-01T00:00:00.0Z")
+    mr2 = build_merge_request(2, "2023-01-01T00:00:00.0Z")
+
+    data = fetcher.data([mr1, mr2])
+    assert data[1] == gl_h.MergeRequestData(commits=1, label_events=["event"])
+    assert mocked_gl.get_merge_request_label_events.call_count == 2
+
+    fetcher.data([mr1, mr2])
+    assert mocked_gl.get_merge_request_label_events.call_count == 2
+
+    updated_mr1 = build_merge_request(1, "2023-01-02T00:00:00.0Z")
+    fetcher.data([updated_mr1, mr2])
+    mocked_gl.get_merge_request_label_events.assert_called_with(updated_mr1)
+    assert mocked_gl.get_merge_request_label_events.call_count == 3
+
+
+def test_merge_request_fetcher_rebased(project: Project) -> None:
+    mocked_gl = create_autospec(GitLabApi)
+    mocked_gl.project = project
+    mocked_commit = create_autospec(ProjectCommit)
+    mocked_commit.id = "head"
+    project.commits = create_autospec(ProjectCommitManager)
+    project.commits.list.return_value = [mocked_commit]
+    project.repository_compare.side_effect = lambda sha, head: {
+        "commits": [] if sha == "rebased" else ["commit"]
+    }
+    fetcher = gl_h.MergeRequestFetcher(mocked_gl, thread_pool_size=2)
+    mrs = [
+        build_merge_request(1, "t", sha="rebased"),
+        build_merge_request(2, "t", sha="behind"),
+    ]
+
+    assert fetcher.rebased(mrs) == {1: True, 2: False}
+    assert fetcher.rebased(mrs) == {1: True, 2: False}
+    assert project.commits.list.call_count == 2
+    assert project.repository_compare.call_count == 2
+
+
+def test_merge_merge_requests_with_retry_fetches_label_events_once(
+    mocker: MockerFixture,
+    project: Project,
+    can_be_merged_merge_request: Mock,
+    add_lgtm_merge_request_resource_label_event: ProjectMergeRequestResourceLabelEvent,
+    running_merge_request_pipeline: dict,
+) -> None:
+    mocker.patch("time.sleep")
+    mocked_gl = create_autospec(GitLabApi)
+    mocked_gl.project = project
+    mocked_gl.get_merge_requests.return_value = [can_be_merged_merge_request]
+    mocked_gl.get_merge_request_label_events.return_value = [
+        add_lgtm_merge_request_resource_label_event
+    ]
+    mocked_gl.get_merge_request_pipelines.return_value = [
+        running_merge_request_pipeline
+    ]
+
+    with pytest.raises(gl_h.InsistOnPipelineError):
+        gl_h.merge_merge_requests(
+            False,
+            mocked_gl,
+            [can_be_merged_merge_request],
+            gl_h.ReloadToggle(reload=False),
+            1,
+            False,
+            app_sre_usernames=set(),
+            insist=True,
+            wait_for_pipeline=True,
+            mr_fetcher=gl_h.MergeRequestFetcher(mocked_gl),
+        )
+
+    mocked_gl.get_merge_request_label_events.assert_called_once()
+    assert mocked_gl.get_merge_request_pipelines.call_count == 10
@@ -5,7 +5,9 @@ from unittest.mock import patch
 
 import pytest
 import yaml
+from kubernetes.client.exceptions import ApiException
 from kubernetes.dynamic import Resource
+from kubernetes.dynamic.exceptions import ForbiddenError
 from pydantic import BaseModel
 from pytest_mock import MockerFixture
 
@@ -556,9 +558,9 @@ def test_populate_current_state(
     # prepare client and resource inventory
     oc_cs1.init_api_resources = True
     oc_cs1.api_resources = api_resources
-    oc_cs1.get_items = lambda kind, **kwargs: [
+    oc_cs1.iter_items = lambda kind, **kwargs: iter([
         build_resource("Kind", "fully.qualified/v1", "name")
-    ]
+    ])
     resource_inventory.initialize_resource_type("cs1", "ns1", "Kind.fully.qualified")
 
     # process
@@ -588,7 +590,7 @@ def test_populate_current_state_unknown_kind(
     oc_cs1.init_api_resources = True
     k1 = Resource(prefix="", group="some.other.group", api_version="v1", kind="Kind")
     oc_cs1.api_resources = {"Kind": [k1]}
-    get_item_mock = mocker.patch.object(oc.OCNative, "get_items", autospec=True)
+    get_item_mock = mocker.patch.object(oc.OCNative, "iter_items", autospec=True)
 
     spec = sut.CurrentStateSpec(
         oc=oc_cs1,
@@ -618,13 +620,129 @@ def test_populate_current_state_resource_name_filtering(
     )
     sut.populate_current_state(spec, resource_inventory, TEST_INT, TEST_INT_VER)
 
-    oc_cs1.get_items.assert_called_with(
+    oc_cs1.iter_items.assert_called_with(
         "Kind.fully.qualified",
         namespace="ns1",
         resource_names=["name1", "name2"],
     )
 
 
+def _namespaced_specs(
+    oc_client: oc.OCClient, namespaces: list[str], kind: str = "Kind"
+) -> list[sut.CurrentStateSpec]:
+    return [
+        sut.CurrentStateSpec(
+            oc=oc_client,
+            cluster="cs1",
+            namespace=ns,
+            kind=kind,
+            resource_names=None,
+        )
+        for ns in namespaces
+    ]
+
+
+def test_plan_current_state_fetch_below_threshold(oc_cs1: oc.OCNative) -> None:
+    specs = _namespaced_specs(oc_cs1, ["ns1", "ns2"])
+    assert sut.plan_current_state_fetch(specs, namespace_threshold=3) == specs
+
+
+def test_plan_current_state_fetch_cluster_wide(oc_cs1: oc.OCNative) -> None:
+    namespaced = _namespaced_specs(oc_cs1, ["ns1", "ns2", "ns3"])
+    named = sut.CurrentStateSpec(
+        oc=oc_cs1,
+        cluster="cs1",
+        namespace="ns4",
+        kind="Kind",
+        resource_names=["name"],
+    )
+    other_kind = _namespaced_specs(oc_cs1, ["ns1"], kind="OtherKind")
+    planned = sut.plan_current_state_fetch(
+        [*namespaced, named, *other_kind],
+        namespace_threshold=3,
+        labels={"app": "a"},
+    )
+    assert len(planned) == 3
+    named_planned, cluster_wide, other_kind_planned = planned
+    assert named_planned == named
+    assert [other_kind_planned] == other_kind
+    assert isinstance(cluster_wide, sut.ClusterWideCurrentStateSpec)
+    assert cluster_wide.cluster == "cs1"
+    assert cluster_wide.kind == "Kind"
+    assert cluster_wide.namespaces == {"ns1", "ns2", "ns3"}
+    assert cluster_wide.labels == {"app": "a"}
+
+
+def test_plan_current_state_fetch_disabled(oc_cs1: oc.OCNative) -> None:
+    specs = _namespaced_specs(oc_cs1, ["ns1", "ns2"])
+    assert sut.plan_current_state_fetch(specs, namespace_threshold=0) == specs
+
+
+def _namespaced_resource(namespace: str, name: str) -> dict[str, Any]:
+    item = build_resource("Kind", "v1", name)
+    item["metadata"]["namespace"] = namespace
+    return item
+
+
+def test_populate_current_state_cluster_wide(
+    resource_inventory: resource.ResourceInventory, oc_cs1: oc.OCNative
+) -> None:
+    oc_cs1.iter_items.return_value = iter([
+        _namespaced_resource("ns1", "a"),
+        _namespaced_resource("ns2", "b"),
+        _namespaced_resource("unmanaged", "c"),
+    ])
+    for ns in ["ns1", "ns2"]:
+        resource_inventory.initialize_resource_type("cs1", ns, "Kind")
+    spec = sut.ClusterWideCurrentStateSpec(
+        oc=oc_cs1,
+        cluster="cs1",
+        kind="Kind",
+        namespace_specs=_namespaced_specs(oc_cs1, ["ns1", "ns2"]),
+    )
+
+    sut.populate_current_state(spec, resource_inventory, TEST_INT, TEST_INT_VER)
+
+    oc_cs1.iter_items.assert_called_once_with("Kind", all_namespaces=True)
+    assert resource_inventory.get_current("cs1", "ns1", "Kind", "a")
+    assert resource_inventory.get_current("cs1", "ns2", "Kind", "b")
+    assert resource_inventory.get_current("cs1", "unmanaged", "Kind", "c") is None
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        oc.StatusCodeError("forbidden"),
+        ForbiddenError(ApiException(status=403, reason="Forbidden")),
+    ],
+)
+def test_populate_current_state_cluster_wide_fallback(
+    resource_inventory: resource.ResourceInventory,
+    oc_cs1: oc.OCNative,
+    error: Exception,
+) -> None:
+    def iter_items(kind: str, **kwargs: Any) -> Any:
+        if kwargs.get("all_namespaces"):
+            raise error
+        return iter([_namespaced_resource(kwargs["namespace"], "a")])
+
+    oc_cs1.iter_items.side_effect = iter_items
+    for ns in ["ns1", "ns2"]:
+        resource_inventory.initialize_resource_type("cs1", ns, "Kind")
+    spec = sut.ClusterWideCurrentStateSpec(
+        oc=oc_cs1,
+        cluster="cs1",
+        kind="Kind",
+        namespace_specs=_namespaced_specs(oc_cs1, ["ns1", "ns2"]),
+    )
+
+    sut.populate_current_state(spec, resource_inventory, TEST_INT, TEST_INT_VER)
+
+    assert resource_inventory.get_current("cs1", "ns1", "Kind", "a")
+    assert resource_inventory.get_current("cs1", "ns2", "Kind", "a")
+    assert not resource_inventory.has_error_registered()
+
+
 #
 # determine_user_keys_for_access tests
 #
@@ -1,3 +1,6 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from reconcile.utils.openshift_resource import (
@@ -359,6 +362,33 @@ def test_resource_inventory_add_desired_without_managed_name():
         ri.add_desired_resource("cl", "ns", res)
 
 
+def test_resource_inventory_namespace_locks():
+    ri = ResourceInventory()
+    assert ri._namespace_lock("cl", "ns1") is ri._namespace_lock("cl", "ns1")
+    assert ri._namespace_lock("cl", "ns1") is not ri._namespace_lock("cl", "ns2")
+
+
+def test_resource_inventory_add_concurrently():
+    ri = ResourceInventory()
+    namespaces = [f"ns{i}" for i in range(10)]
+    for ns in namespaces:
+        ri.initialize_resource_type(cluster="cl", namespace=ns, resource_type="Pod")
+
+    def add(ns: str) -> None:
+        for i in range(100):
+            ri.add_desired_resource("cl", ns, build_resource("Pod", "v1", f"p{i}"))
+            ri.add_current(
+                "cl", ns, "Pod", f"p{i}", build_resource("Pod", "v1", f"p{i}")
+            )
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(add, namespaces))
+
+    for _, _, _, resource in ri:
+        assert len(resource["desired"]) == 100
+        assert len(resource["current"]) == 100
+
+
 def test_resource_inventory_add_desired_privileged():
     ri = ResourceInventory()
     ri.initialize_resource_type(
@@ -441,3 +471,61 @@ def test_resource_inventory_add_desired_resource_mixed_kinds():
             assert resource["desired"].get("foo")
         elif resource_type == "Deployment":
             assert len(resource["desired"]) == 0
+
+
+def test_canonicalize_does_not_modify_body():
+    resource = {
+        "kind": "Role",
+        "metadata": {"name": "role", "annotations": {"qontract.sha256sum": "x"}},
+        "rules": [{"resources": ["b", "a"], "verbs": ["list", "get"]}],
+    }
+    expected = copy.deepcopy(resource)
+    result = OR.canonicalize(resource)
+    assert resource == expected
+    assert result["rules"] == [{"resources": ["a", "b"], "verbs": ["get", "list"]}]
+    assert result["metadata"]["annotations"] == {}
+
+
+def test_sha256sum_is_cached(mocker):
+    resource = fxt.get_anymarkup("sha256sum.yml")
+    openshift_resource = OR(resource, TEST_INT, TEST_INT_VER)
+    canonical_view = mocker.spy(OR, "_canonical_view")
+
+    sha256sum = openshift_resource.sha256sum()
+    assert openshift_resource.sha256sum() == sha256sum
+    assert canonical_view.call_count == 1
+
+    # replacing the body invalidates the cached digest
+    body = copy.deepcopy(openshift_resource.body)
+    body["metadata"]["labels"] = {"foo": "bar"}
+    openshift_resource.body = body
+    assert openshift_resource.sha256sum() != sha256sum
+    assert canonical_view.call_count == 2
+
+
+def test_eq_does_not_modify_bodies():
+    desired = OR(
+        {
+            "kind": "Pod",
+            "metadata": {"name": "pod"},
+            "spec": {"env": [{"name": "a", "value": ""}]},
+        },
+        TEST_INT,
+        TEST_INT_VER,
+        validate_k8s_object=False,
+    )
+    current = OR(
+        {
+            "kind": "Pod",
+            "metadata": {"name": "pod"},
+            "spec": {"env": [{"name": "a"}]},
+        },
+        TEST_INT,
+        TEST_INT_VER,
+        validate_k8s_object=False,
+    )
+    sha256sum = current.sha256sum()
+
+    assert desired == current
+    assert current.body["spec"]["env"] == [{"name": "a"}]
+    assert current.sha256sum() == sha256sum
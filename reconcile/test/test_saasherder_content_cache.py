@@ -0,0 +1,103 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from reconcile.utils.disk_cache import DiskCache
+from reconcile.utils.saasherder import SaasHerder
+from reconcile.utils.saasherder.content_cache import ContentCache
+
+
+def test_content_cache_fetches_once() -> None:
+    cache = ContentCache()
+    fetch = MagicMock(return_value="content")
+
+    assert cache.get_or_fetch("key", fetch) == "content"
+    assert cache.get_or_fetch("key", fetch) == "content"
+
+    fetch.assert_called_once()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_content_cache_single_flight() -> None:
+    cache = ContentCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch() -> str:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "content"
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(cache.get_or_fetch, "key", fetch)]
+        started.wait(5)
+        futures += [executor.submit(cache.get_or_fetch, "key", fetch) for _ in range(4)]
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == ["content"] * 5
+    assert len(calls) == 1
+
+
+def test_content_cache_failed_fetch_is_not_cached() -> None:
+    cache = ContentCache()
+    fetch = MagicMock(side_effect=[Exception("boom"), "content"])
+
+    with pytest.raises(Exception, match="boom"):
+        cache.get_or_fetch("key", fetch)
+    assert cache.get_or_fetch("key", fetch) == "content"
+
+
+def test_content_cache_persists_to_disk(tmp_path: Path) -> None:
+    disk_cache = DiskCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    ContentCache(disk_cache).get_or_fetch("key", lambda: "content", persist=True)
+
+    fetch = MagicMock()
+    assert (
+        ContentCache(disk_cache).get_or_fetch("key", fetch, persist=True) == "content"
+    )
+    fetch.assert_not_called()
+
+
+def test_content_cache_does_not_persist_mutable_keys(tmp_path: Path) -> None:
+    disk_cache = DiskCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    ContentCache(disk_cache).get_or_fetch("key", lambda: "sha")
+
+    assert disk_cache.get("key") is None
+
+
+def test_saasherder_shares_file_contents_between_targets(
+    mocker: MockerFixture,
+) -> None:
+    saasherder = SaasHerder(
+        [MagicMock(), MagicMock()],
+        secret_reader=MagicMock(),
+        thread_pool_size=1,
+        integration="",
+        integration_version="",
+        hash_length=7,
+        repo_url="https://repo-url.com",
+    )
+    fetch_commit_sha = mocker.patch.object(
+        saasherder, "_fetch_commit_sha", return_value="sha"
+    )
+    fetch_file_contents = mocker.patch.object(
+        saasherder, "_fetch_file_contents", return_value="kind: Template"
+    )
+    url = "https://github.com/org/repo"
+
+    for _ in range(3):
+        template, commit_sha = saasherder._get_file_contents(
+            url=url, path="/template.yml", ref="main", github=MagicMock()
+        )
+        assert template == {"kind": "Template"}
+        assert commit_sha == "sha"
+
+    fetch_commit_sha.assert_called_once()
+    fetch_file_contents.assert_called_once()
@@ -0,0 +1,132 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+from requests import HTTPError
+from sretoolbox.container import Image
+
+from reconcile.utils.disk_cache import DiskCache
+from reconcile.utils.saasherder import SaasHerder
+from reconcile.utils.saasherder.image_cache import (
+    CachedImage,
+    ImageDigestCache,
+)
+from reconcile.utils.saasherder.models import ImageAuth
+
+DIGEST = "sha256:" + "a" * 64
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def get_manifest(mocker: MockerFixture) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = {"schemaVersion": 2}
+    response.headers = {"Docker-Content-Digest": DIGEST}
+    return mocker.patch.object(Image, "_get_manifest", return_value=response)
+
+
+def image(url: str, cache: ImageDigestCache) -> CachedImage:
+    return CachedImage(url, digest_cache=cache)
+
+
+def test_image_digest_cache_tag_hit(get_manifest: MagicMock) -> None:
+    cache = ImageDigestCache()
+
+    assert image("quay.io/org/app:tag", cache)
+    assert image("quay.io/org/app:tag", cache).digest == DIGEST
+    assert image("quay.io/org/app:tag", cache).url_digest == (
+        f"quay.io/org/app@{DIGEST}"
+    )
+
+    get_manifest.assert_called_once()
+
+
+def test_image_digest_cache_tag_expires(get_manifest: MagicMock) -> None:
+    clock = FakeClock()
+    cache = ImageDigestCache(ttl_seconds=60, clock=clock)
+
+    assert image("quay.io/org/app:tag", cache).digest == DIGEST
+    clock.now += 59
+    assert image("quay.io/org/app:tag", cache).digest == DIGEST
+    assert get_manifest.call_count == 1
+
+    clock.now += 1
+    assert image("quay.io/org/app:tag", cache).digest == DIGEST
+    assert get_manifest.call_count == 2
+
+
+def test_image_digest_cache_digest_reference_never_expires(
+    get_manifest: MagicMock,
+) -> None:
+    clock = FakeClock()
+    cache = ImageDigestCache(ttl_seconds=60, clock=clock)
+
+    assert image(f"quay.io/org/app@{DIGEST}", cache)
+    clock.now += 10**9
+    assert image(f"quay.io/org/app@{DIGEST}", cache)
+
+    get_manifest.assert_called_once()
+
+
+def test_image_digest_cache_keyed_by_reference(get_manifest: MagicMock) -> None:
+    cache = ImageDigestCache()
+
+    assert image("quay.io/org/app:tag", cache)
+    assert image("quay.io/org/app:other", cache)
+    assert image("quay.io/org/other:tag", cache)
+    assert CachedImage(
+        "quay.io/org/app:tag", username="user", password="pw", digest_cache=cache
+    )
+
+    assert get_manifest.call_count == 4
+
+
+def test_image_digest_cache_missing_image_not_cached(
+    mocker: MockerFixture,
+) -> None:
+    response = MagicMock(status_code=404)
+    get_manifest = mocker.patch.object(
+        Image, "_get_manifest", side_effect=HTTPError(response=response)
+    )
+    cache = ImageDigestCache()
+
+    assert not image("quay.io/org/app:tag", cache)
+    assert not image("quay.io/org/app:tag", cache)
+
+    assert get_manifest.call_count == 2
+
+
+def test_image_digest_cache_persisted(get_manifest: MagicMock, tmp_path: Path) -> None:
+    disk_cache = DiskCache(str(tmp_path), max_size_bytes=1024 * 1024)
+
+    assert image("quay.io/org/app:tag", ImageDigestCache(disk_cache=disk_cache))
+    assert (
+        image("quay.io/org/app:tag", ImageDigestCache(disk_cache=disk_cache)).digest
+        == DIGEST
+    )
+
+    get_manifest.assert_called_once()
+
+
+def test_get_image_uses_digest_cache(get_manifest: MagicMock) -> None:
+    image_auth = ImageAuth(username="user", password="pw")
+
+    for _ in range(3):
+        img = SaasHerder._get_image(
+            "quay.io/org/app-get-image:tag",
+            ["quay.io/org"],
+            image_auth,
+            "prefix",
+        )
+        assert isinstance(img, CachedImage)
+        assert img.digest == DIGEST
+
+    get_manifest.assert_called_once()
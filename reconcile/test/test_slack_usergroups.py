@@ -644,6 +644,26 @@ def test_act_update_usergroup_users(
     ]
 
 
+def test_act_update_usergroup_users_unknown_users_only(
+    base_state: SlackState, slack_map: SlackMap, slack_client_mock: Mock
+) -> None:
+    """Users that can't be matched don't cause an update on every run."""
+    current_state = base_state
+    desired_state = copy.deepcopy(base_state)
+
+    desired_state["slack-workspace"]["usergroup-1"].user_names = {
+        "username",
+        "unknownuser",
+    }
+
+    slack_client_mock.get_usergroup_id.return_value = "USERGA"
+    slack_client_mock.get_active_users_by_names.return_value = {"USERA": "username"}
+
+    assert act(current_state, desired_state, slack_map, dry_run=False) == 0
+
+    slack_client_mock.update_usergroup_users.assert_not_called()
+
+
 def test_act_update_usergroup_channels(
     base_state: SlackState, slack_map: SlackMap, slack_client_mock: Mock
 ) -> None:
@@ -1,3 +1,4 @@
+import threading
 from collections.abc import Callable
 from typing import Any
 
@@ -45,6 +46,9 @@ def controller(oc: OCCli, mocker: MockerFixture) -> K8sJobController:
     return controller
 
 
+WATCH_GRACE_SECONDS = 0.5
+
+
 class TimeMock:
     def __init__(self) -> None:
         self.current_time = 0.0
@@ -56,3 +60,16 @@ class TimeMock:
         if seconds < 0:
             raise ValueError("Negative value for sleep seconds not allowed")
         self.current_time += seconds
+
+    def wait_for(
+        self,
+        condition: threading.Condition,
+        predicate: Callable[[], bool],
+        timeout: float,
+    ) -> bool:
+        # job watches deliver their events from a real thread, give it a
+        # moment before the whole timeout passes on the mocked clock
+        if condition.wait_for(predicate, WATCH_GRACE_SECONDS):
+            return True
+        self.sleep(max(timeout, 0))
+        return predicate()
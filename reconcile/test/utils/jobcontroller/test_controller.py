@@ -1,9 +1,16 @@
+import queue
+import threading
+from collections.abc import Iterator
 from typing import Any
 from unittest.mock import patch
 
 import pytest
+from pytest_mock import MockerFixture
 
-from reconcile.test.utils.jobcontroller.conftest import OCItemSetter
+from reconcile.test.utils.jobcontroller.conftest import (
+    OCItemSetter,
+    TimeMock,
+)
 from reconcile.test.utils.jobcontroller.fixtures import (
     SomeJob,
     build_job_resource,
@@ -15,6 +22,7 @@ from reconcile.utils.jobcontroller.models import (
     JobStatus,
     JobValidationError,
 )
+from reconcile.utils.oc import OCNative
 
 #
 # enqueue_job
@@ -423,3 +431,147 @@ def test_get_job_status_no_job_resource_status(
     job = SomeJob(identifying_attribute="some-id")
     set_oc_get_items_side_effect([[build_job_resource(job)]])
     assert controller.get_job_status(job_name=job.name()) == JobStatus.IN_PROGRESS
+
+
+#
+# wait with a job watch
+#
+
+
+class FakeJobStream:
+    def __init__(self) -> None:
+        self.events: queue.Queue[tuple[str, dict[str, Any]]] = queue.Queue()
+        self.calls = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Iterator[tuple[str, dict]]:
+        self.calls += 1
+        while True:
+            yield self.events.get(timeout=10)
+
+
+@pytest.fixture
+def native_oc(mocker: MockerFixture) -> OCNative:
+    return mocker.create_autospec(OCNative)
+
+
+@pytest.fixture
+def job_stream(native_oc: OCNative) -> FakeJobStream:
+    stream = FakeJobStream()
+    native_oc.watch_items.side_effect = stream  # type: ignore[attr-defined]
+    return stream
+
+
+@pytest.fixture
+def watching_controller(native_oc: OCNative) -> K8sJobController:
+    return K8sJobController(
+        oc=native_oc,
+        cluster="some-cluster",
+        namespace="some-ns",
+        integration="some-integration",
+        integration_version="0.1",
+        time_module=TimeMock(),
+    )
+
+
+def test_controller_wait_for_completion_watch(
+    watching_controller: K8sJobController,
+    native_oc: OCNative,
+    job_stream: FakeJobStream,
+) -> None:
+    job = SomeJob(identifying_attribute="some-id", description="some-description")
+    native_oc.get_items.return_value = [  # type: ignore[attr-defined]
+        build_job_resource(job, build_job_status(active=1))
+    ]
+    job_stream.events.put((
+        "MODIFIED",
+        build_job_resource(job, build_job_status(succeeded=1)),
+    ))
+
+    assert watching_controller.wait_for_job_completion(
+        job.name(), check_interval_seconds=60, timeout_seconds=30
+    )
+    assert watching_controller.time_module.time() == 0
+    native_oc.get_items.assert_called_once()  # type: ignore[attr-defined]
+
+
+def test_controller_wait_for_completion_shared_watch(
+    watching_controller: K8sJobController,
+    native_oc: OCNative,
+    job_stream: FakeJobStream,
+) -> None:
+    jobs = [
+        SomeJob(identifying_attribute=f"some-id-{i}", description="some-description")
+        for i in range(5)
+    ]
+    native_oc.get_items.return_value = [  # type: ignore[attr-defined]
+        build_job_resource(job, build_job_status(active=1)) for job in jobs
+    ]
+    results: dict[str, bool] = {}
+
+    def wait(job: SomeJob) -> None:
+        results[job.name()] = watching_controller.wait_for_job_completion(
+            job.name(), check_interval_seconds=60, timeout_seconds=30
+        )
+
+    threads = [threading.Thread(target=wait, args=(job,)) for job in jobs]
+    for t in threads:
+        t.start()
+    for job in jobs:
+        job_stream.events.put((
+            "MODIFIED",
+            build_job_resource(job, build_job_status(failed=7)),
+        ))
+    for t in threads:
+        t.join(timeout=10)
+
+    assert results == {job.name(): False for job in jobs}
+    assert job_stream.calls == 1
+    native_oc.get_items.assert_called_once()  # type: ignore[attr-defined]
+
+
+def test_controller_wait_for_job_list_completion_watch_timeout(
+    watching_controller: K8sJobController,
+    native_oc: OCNative,
+    job_stream: FakeJobStream,
+) -> None:
+    job1 = SomeJob(identifying_attribute="some-id-1", description="some-description")
+    job2 = SomeJob(identifying_attribute="some-id-2", description="some-description")
+    native_oc.get_items.return_value = [  # type: ignore[attr-defined]
+        build_job_resource(job1, build_job_status(active=1)),
+        build_job_resource(job2, build_job_status(active=1)),
+    ]
+    job_stream.events.put((
+        "MODIFIED",
+        build_job_resource(job1, build_job_status(succeeded=1)),
+    ))
+    job_stream.events.put(("DELETED", build_job_resource(job2)))
+
+    assert watching_controller.wait_for_job_list_completion(
+        {job1.name(), job2.name()}, check_interval_seconds=60, timeout_seconds=30
+    ) == {job1.name(): JobStatus.SUCCESS, job2.name(): JobStatus.NOT_EXISTS}
+    assert watching_controller.time_module.time() == 30
+    native_oc.get_items.assert_called_once()  # type: ignore[attr-defined]
+
+
+def test_controller_wait_for_completion_watch_failed(
+    native_oc: OCNative,
+) -> None:
+    controller = K8sJobController(
+        oc=native_oc,
+        cluster="some-cluster",
+        namespace="some-ns",
+        integration="some-integration",
+        integration_version="0.1",
+        time_module=TimeMock(),
+    )
+    job = SomeJob(identifying_attribute="some-id", description="some-description")
+    native_oc.watch_items.side_effect = Exception("forbidden")  # type: ignore[attr-defined]
+    native_oc.get_items.side_effect = [  # type: ignore[attr-defined]
+        [build_job_resource(job, build_job_status(active=1))],
+        [build_job_resource(job, build_job_status(succeeded=1))],
+    ]
+
+    # falls back to polling
+    assert controller.wait_for_job_completion(
+        job.name(), check_interval_seconds=5, timeout_seconds=-1
+    )
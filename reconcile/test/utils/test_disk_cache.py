@@ -0,0 +1,64 @@
+import os
+
+from pytest_mock import MockerFixture
+
+from reconcile.utils.disk_cache import (
+    EVICT_INTERVAL_WRITES,
+    DiskCache,
+    cache_key,
+)
+
+
+def test_cache_key_is_stable() -> None:
+    assert cache_key("a", {"x": 1, "y": 2}) == cache_key("a", {"y": 2, "x": 1})
+    assert cache_key("a", {"x": 1}) != cache_key("b", {"x": 1})
+
+
+def test_disk_cache_get_set(tmp_path) -> None:
+    cache = DiskCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    key = cache_key("query")
+    assert cache.get(key) is None
+    cache.set(key, {"data": {"foo": "bar"}})
+    assert cache.get(key) == {"data": {"foo": "bar"}}
+    # a second instance on the same directory sees the entry
+    assert DiskCache(str(tmp_path), 1024 * 1024).get(key) == {"data": {"foo": "bar"}}
+
+
+def test_disk_cache_corrupted_entry_is_a_miss(tmp_path) -> None:
+    cache = DiskCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    key = cache_key("query")
+    cache.set(key, {"data": {}})
+    with open(cache._path(key), "w", encoding="utf-8") as f:
+        f.write("{not json")
+    assert cache.get(key) is None
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = DiskCache(str(tmp_path), max_size_bytes=120)
+    value = {"data": "x" * 40}
+    keys = [cache_key(i) for i in range(3)]
+    cache.set(keys[0], value)
+    cache.set(keys[1], value)
+    os.utime(cache._path(keys[0]), (0, 0))
+    os.utime(cache._path(keys[1]), (1, 1))
+    # refresh keys[0], so keys[1] becomes the least recently used entry
+    cache.get(keys[0])
+    cache.set(keys[2], value)
+    assert cache.get(keys[0]) == value
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) == value
+
+
+def test_disk_cache_scans_only_when_needed(tmp_path, mocker: MockerFixture) -> None:
+    cache = DiskCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    walk = mocker.spy(os, "walk")
+
+    for i in range(EVICT_INTERVAL_WRITES + 1):
+        cache.set(cache_key(i), {"data": i})
+    # once to initialize the size estimate, once after the interval
+    assert walk.call_count == 2
+
+    cache.max_size_bytes = 1
+    cache.set(cache_key("over budget"), {"data": "x"})
+    assert walk.call_count == 3
+    assert cache.get(cache_key("over budget")) is None
@@ -0,0 +1,145 @@
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from reconcile.utils.disk_cache import cache_key
+from reconcile.utils.git import GitError
+from reconcile.utils.git_mirror import GitMirror
+
+
+def git(*args: str, cwd: Path) -> str:
+    result = subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def commit(repo: Path, content: str) -> str:
+    (repo / "chart").mkdir(exist_ok=True)
+    (repo / "chart" / "Chart.yaml").write_text(content, encoding="utf-8")
+    git("add", ".", cwd=repo)
+    git("commit", "--quiet", "-m", content, cwd=repo)
+    return git("rev-parse", "HEAD", cwd=repo)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git("init", "--quiet", "--initial-branch", "main", cwd=repo)
+    return repo
+
+
+@pytest.fixture
+def mirror(tmp_path: Path) -> GitMirror:
+    return GitMirror(str(tmp_path / "store"), max_checkouts=2)
+
+
+def test_git_mirror_checkout_branch(repo: Path, mirror: GitMirror) -> None:
+    commit(repo, "v1")
+
+    with mirror.checkout(repo.as_uri(), "main") as path:
+        assert Path(path, "chart", "Chart.yaml").read_text(encoding="utf-8") == "v1"
+
+    commit(repo, "v2")
+
+    with mirror.checkout(repo.as_uri(), "main") as path:
+        assert Path(path, "chart", "Chart.yaml").read_text(encoding="utf-8") == "v2"
+
+
+def test_git_mirror_commit_fetched_once(
+    repo: Path, mirror: GitMirror, mocker: MockerFixture
+) -> None:
+    sha = commit(repo, "v1")
+    git_spy = mocker.spy(GitMirror, "_git")
+
+    with mirror.checkout(repo.as_uri(), sha) as first:
+        pass
+    with mirror.checkout(repo.as_uri(), sha) as second:
+        pass
+
+    assert first == second
+    fetches = [c for c in git_spy.call_args_list if c.args[0][0] == "fetch"]
+    checkouts = [c for c in git_spy.call_args_list if "checkout" in c.args[0]]
+    assert len(fetches) == 1
+    assert len(checkouts) == 1
+
+
+def test_git_mirror_shared_checkout(repo: Path, mirror: GitMirror) -> None:
+    sha = commit(repo, "v1")
+
+    def checkout(_: int) -> str:
+        with mirror.checkout(repo.as_uri(), sha) as path:
+            return path
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        paths = set(executor.map(checkout, range(8)))
+
+    assert len(paths) == 1
+    assert os.listdir(mirror.checkouts_dir) == [os.path.basename(paths.pop())]
+
+
+def test_git_mirror_evicts_unused_checkouts(repo: Path, mirror: GitMirror) -> None:
+    shas = [commit(repo, f"v{i}") for i in range(3)]
+
+    with mirror.checkout(repo.as_uri(), shas[0]) as in_use:
+        for sha in shas[1:]:
+            with mirror.checkout(repo.as_uri(), sha):
+                pass
+        os.utime(in_use, (0, 0))
+        with mirror.checkout(repo.as_uri(), "main"):
+            pass
+        assert os.path.isdir(in_use)
+
+    assert len(os.listdir(mirror.checkouts_dir)) == 2
+    assert not os.path.isdir(in_use)
+
+
+def test_git_mirror_keeps_checkouts_used_by_other_processes(
+    repo: Path, mirror: GitMirror
+) -> None:
+    shas = [commit(repo, f"v{i}") for i in range(3)]
+    # another GitMirror on the same directory stands in for another process
+    other = GitMirror(os.path.dirname(mirror.checkouts_dir), max_checkouts=1)
+
+    with mirror.checkout(repo.as_uri(), shas[0]) as in_use:
+        os.utime(in_use, (0, 0))
+        with other.checkout(repo.as_uri(), shas[1]):
+            pass
+        assert os.path.isdir(in_use)
+
+
+def test_git_mirror_evicts_unused_mirrors(tmp_path: Path) -> None:
+    repos = []
+    for name in ["a", "b"]:
+        repo = tmp_path / name
+        repo.mkdir()
+        git("init", "--quiet", "--initial-branch", "main", cwd=repo)
+        commit(repo, name)
+        repos.append(repo)
+    mirror = GitMirror(str(tmp_path / "store"), max_mirrors=1)
+
+    with mirror.checkout(repos[0].as_uri(), "main"):
+        pass
+    os.utime(
+        os.path.join(mirror.mirrors_dir, os.listdir(mirror.mirrors_dir)[0]), (0, 0)
+    )
+    with mirror.checkout(repos[1].as_uri(), "main"):
+        pass
+
+    assert os.listdir(mirror.mirrors_dir) == [f"{cache_key(repos[1].as_uri())}.git"]
+
+
+def test_git_mirror_unknown_ref(repo: Path, mirror: GitMirror) -> None:
+    commit(repo, "v1")
+
+    with pytest.raises(GitError), mirror.checkout(repo.as_uri(), "missing"):
+        pass
@@ -0,0 +1,254 @@
+import json
+from typing import Any
+
+import pytest
+import responses
+from requests import (
+    ConnectionError,
+    HTTPError,
+    ReadTimeout,
+)
+
+from reconcile.utils.github_graphql import (
+    GithubGraphQLApi,
+    GithubGraphQLError,
+    graphql_url,
+)
+
+URL = "https://api.github.com/graphql"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def api(clock: FakeClock) -> GithubGraphQLApi:
+    return GithubGraphQLApi("token", url=URL, sleep=clock.sleep, clock=clock)
+
+
+def connection(nodes: list[Any], cursor: str | None = None) -> dict[str, Any]:
+    return {
+        "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+        "nodes": nodes,
+    }
+
+
+def users(*logins: str) -> list[dict[str, str]]:
+    return [{"login": login} for login in logins]
+
+
+def invitations(*logins: str | None) -> list[dict[str, Any]]:
+    return [{"invitee": {"login": login} if login else None} for login in logins]
+
+
+def team(name: str, members: dict, invites: dict | None = None) -> dict[str, Any]:
+    return {
+        "name": name,
+        "slug": name.lower(),
+        "members": members,
+        "invitations": invites or connection([]),
+    }
+
+
+def add_page(operation: str, cursor: str | None, data: dict[str, Any]) -> None:
+    def match(request: Any) -> tuple[bool, str]:
+        body = json.loads(request.body)
+        matched = (
+            f"query {operation}(" in body["query"]
+            and body["variables"].get("cursor") == cursor
+        )
+        return matched, ""
+
+    responses.add(
+        responses.POST,
+        URL,
+        json={"data": {"organization": data}},
+        match=[match],
+        headers={"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "4600"},
+    )
+
+
+@pytest.mark.parametrize(
+    "base_url, expected",
+    [
+        ("https://api.github.com", "https://api.github.com/graphql"),
+        (
+            "https://github.example.com/api/v3/",
+            "https://github.example.com/api/graphql",
+        ),
+    ],
+)
+def test_graphql_url(base_url: str, expected: str) -> None:
+    assert graphql_url(base_url) == expected
+
+
+@responses.activate
+def test_org_membership(api: GithubGraphQLApi, clock: FakeClock) -> None:
+    add_page("OrgMembers", None, {"membersWithRole": connection(users("a"), "c1")})
+    add_page("OrgMembers", "c1", {"membersWithRole": connection(users("b"))})
+    add_page(
+        "OrgPendingMembers", None, {"pendingMembers": connection(users("invited"))}
+    )
+    add_page(
+        "OrgTeams",
+        None,
+        {
+            "teams": connection(
+                [
+                    team("Team1", connection(users("a"), "t1")),
+                    team("unmanaged", connection(users("b"))),
+                ],
+                "teams",
+            )
+        },
+    )
+    add_page(
+        "OrgTeams",
+        "teams",
+        {
+            "teams": connection([
+                team(
+                    "team2",
+                    connection(users("b")),
+                    connection(invitations("c", None), "i1"),
+                )
+            ])
+        },
+    )
+    add_page("TeamMembers", "t1", {"team": {"members": connection(users("b"))}})
+    add_page(
+        "TeamInvitations",
+        "i1",
+        {"team": {"invitations": connection(invitations("d"))}},
+    )
+
+    membership = api.org_membership("org", teams={"Team1", "team2"})
+
+    assert membership.members == ["a", "b", "invited"]
+    assert membership.teams == {"Team1": ["a", "b"], "team2": ["b", "c", "d"]}
+    assert len(responses.calls) == 7
+    assert clock.sleeps == []
+
+
+@responses.activate
+def test_org_membership_teams_only(api: GithubGraphQLApi) -> None:
+    add_page(
+        "OrgTeams", None, {"teams": connection([team("t", connection(users("a")))])}
+    )
+
+    membership = api.org_membership("org", members=False)
+
+    assert membership.members is None
+    assert membership.teams == {"t": ["a"]}
+
+
+@responses.activate
+def test_query_retries_secondary_rate_limit(
+    api: GithubGraphQLApi, clock: FakeClock
+) -> None:
+    responses.add(responses.POST, URL, status=403, headers={"Retry-After": "30"})
+    responses.add(responses.POST, URL, status=502)
+    responses.add(responses.POST, URL, json={"data": {"ok": True}})
+
+    assert api.query("query", {}) == {"ok": True}
+    assert clock.sleeps == [30.0, 4.0]
+
+
+@responses.activate
+def test_query_waits_for_rate_limit_reset(
+    api: GithubGraphQLApi, clock: FakeClock
+) -> None:
+    responses.add(
+        responses.POST,
+        URL,
+        json={"errors": [{"type": "RATE_LIMITED", "message": "limit exceeded"}]},
+        headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1060"},
+    )
+    responses.add(responses.POST, URL, json={"data": {"ok": True}})
+
+    assert api.query("query", {}) == {"ok": True}
+    assert clock.sleeps == [61.0]
+
+
+@responses.activate
+def test_query_throttles_when_budget_is_low(
+    api: GithubGraphQLApi, clock: FakeClock
+) -> None:
+    responses.add(
+        responses.POST,
+        URL,
+        json={"data": {"ok": True}},
+        headers={"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1099"},
+    )
+
+    api.query("query", {})
+
+    assert clock.sleeps == [10.0]
+
+
+@responses.activate
+def test_query_gives_up(api: GithubGraphQLApi, clock: FakeClock) -> None:
+    responses.add(responses.POST, URL, status=429)
+
+    with pytest.raises(HTTPError):
+        api.query("query", {})
+    assert len(responses.calls) == GithubGraphQLApi.MAX_ATTEMPTS
+
+
+@responses.activate
+def test_query_retries_connection_errors(
+    api: GithubGraphQLApi, clock: FakeClock
+) -> None:
+    responses.add(responses.POST, URL, body=ConnectionError("connection reset"))
+    responses.add(responses.POST, URL, body=ReadTimeout("read timed out"))
+    responses.add(responses.POST, URL, json={"data": {"ok": True}})
+
+    assert api.query("query", {}) == {"ok": True}
+    assert clock.sleeps == [2.0, 4.0]
+
+
+@responses.activate
+def test_query_gives_up_on_connection_errors(
+    api: GithubGraphQLApi, clock: FakeClock
+) -> None:
+    responses.add(responses.POST, URL, body=ConnectionError("connection refused"))
+
+    with pytest.raises(ConnectionError):
+        api.query("query", {})
+    assert len(responses.calls) == GithubGraphQLApi.MAX_ATTEMPTS
+
+
+@responses.activate
+def test_query_does_not_retry_forbidden(api: GithubGraphQLApi) -> None:
+    responses.add(responses.POST, URL, status=403, json={"message": "Forbidden"})
+
+    with pytest.raises(HTTPError):
+        api.query("query", {})
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_query_errors(api: GithubGraphQLApi) -> None:
+    responses.add(
+        responses.POST,
+        URL,
+        json={"data": None, "errors": [{"type": "NOT_FOUND", "message": "nope"}]},
+    )
+
+    with pytest.raises(GithubGraphQLError):
+        api.query("query", {})
@@ -1,12 +1,22 @@
+from functools import partial
+
 import pytest
 import requests
 from gql.transport.exceptions import TransportQueryError
 
+from reconcile.gql_definitions.common import (
+    clusters_minimal,
+    namespaces_minimal,
+)
+from reconcile.utils.disk_cache import DiskCache
 from reconcile.utils.gql import (
     GqlApi,
     GqlApiError,
     GqlApiErrorForbiddenSchema,
     GqlApiIntegrationNotFound,
+    GqlBatchError,
+    merge_queries,
+    split_batch_result,
 )
 
 TEST_QUERY = """
@@ -79,3 +89,100 @@ def test_gqlapi_throws_gqlapierrorforbiddenschema_exception(mocker):
     with pytest.raises(GqlApiErrorForbiddenSchema):
         gql_api = GqlApi("test_url", "test_token", "INTEGRATION", validate_schemas=True)
         gql_api.query.__wrapped__(gql_api, TEST_QUERY)
+
+
+def test_gqlapi_response_cache(mocker, tmp_path):
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = {
+        "data": {"integrations": []},
+        "extensions": {"schemas": ["TEST_SCHEMA"]},
+    }
+    cache = DiskCache(str(tmp_path), max_size_bytes=1024 * 1024)
+
+    gql_api = GqlApi("test_url", "test_token", commit="sha", response_cache=cache)
+    assert gql_api.query(TEST_QUERY) == {"integrations": []}
+    # same bundle, new process
+    gql_api = GqlApi("test_url", "test_token", commit="sha", response_cache=cache)
+    assert gql_api.query(TEST_QUERY) == {"integrations": []}
+    assert patched_client.call_count == 1
+
+    gql_api = GqlApi("test_url", "test_token", commit="other", response_cache=cache)
+    gql_api.query(TEST_QUERY)
+    assert patched_client.call_count == 2
+
+
+def test_gqlapi_response_cache_disabled_without_commit(mocker, tmp_path):
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = {"data": {"integrations": []}}
+    cache = DiskCache(str(tmp_path), max_size_bytes=1024 * 1024)
+
+    gql_api = GqlApi("test_url", "test_token", response_cache=cache)
+    gql_api.query(TEST_QUERY)
+    gql_api.query(TEST_QUERY)
+    assert patched_client.call_count == 2
+
+
+def test_merge_queries():
+    query, variables = merge_queries([
+        (
+            "query A($name: String) { items: items_v1(name: $name) { ...F } }"
+            " fragment F on Item_v1 { name }",
+            {"name": "foo"},
+        ),
+        (
+            "query B { items_v1 { ...F } other: other_v1 { name } }"
+            " fragment F on Item_v1 { name }",
+            None,
+        ),
+    ])
+    assert variables == {"q0_name": "foo"}
+    assert "query Batch($q0_name: String)" in query
+    assert "q0_items: items_v1(name: $q0_name)" in query
+    assert "q1_items_v1: items_v1" in query
+    assert "q1_other: other_v1" in query
+    assert query.count("fragment F on Item_v1") == 1
+
+
+def test_merge_queries_conflicting_fragments():
+    with pytest.raises(GqlBatchError):
+        merge_queries([
+            ("query A { a { ...F } } fragment F on A { name }", None),
+            ("query B { a { ...F } } fragment F on A { path }", None),
+        ])
+
+
+def test_split_batch_result():
+    assert split_batch_result(
+        {"q0_items": [1], "q1_items_v1": [2], "q1_other": [3]}, 2
+    ) == [{"items": [1]}, {"items_v1": [2], "other": [3]}]
+
+
+def test_gqlapi_query_batch(mocker):
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = {
+        "data": {
+            "q0_clusters": [],
+            "q1_namespaces": [],
+        }
+    }
+    gql_api = GqlApi("test_url", "test_token")
+    clusters, namespaces = gql_api.query_batch([
+        partial(clusters_minimal.query, variables={"name": "cluster"}),
+        namespaces_minimal.query,
+    ])
+    assert patched_client.call_count == 1
+    assert patched_client.call_args[0][2] == {"q0_name": "cluster"}
+    assert isinstance(clusters, clusters_minimal.ClustersMinimalQueryData)
+    assert clusters.clusters == []
+    assert isinstance(namespaces, namespaces_minimal.NamespacesMinimalQueryData)
+    assert namespaces.namespaces == []
+
+
+def test_gqlapi_query_batch_fallback(mocker):
+    patched_query = mocker.patch.object(GqlApi, "query", autospec=True)
+    patched_query.return_value = {"namespaces": []}
+    mocker.patch("reconcile.utils.gql.merge_queries", side_effect=GqlBatchError("nope"))
+    gql_api = GqlApi("test_url", "test_token")
+    results = gql_api.query_batch([namespaces_minimal.query] * 2)
+    assert patched_query.call_count == 2
+    assert [r.namespaces for r in results] == [[], []]
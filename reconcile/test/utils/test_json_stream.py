@@ -0,0 +1,77 @@
+import io
+import json
+
+import pytest
+
+from reconcile.utils.json_stream import (
+    JSONStreamError,
+    load_selected,
+)
+
+DOCUMENT = {
+    "format_version": "1.2",
+    "planned_values": {
+        "root_module": {
+            "resources": [
+                {"address": f"r.{i}", "values": {"tricky": '"]}{[', "n": -1.5e3}}
+                for i in range(100)
+            ]
+        }
+    },
+    "output_changes": {"out": {"actions": ["no-op"], "after": "ü"}},
+    "prior_state": {
+        "format_version": "1.0",
+        "values": {"outputs": {"out": {"value": 1}}, "root_module": {"x": [1]}},
+    },
+    "count": 12345678901234567890,
+    "flag": True,
+}
+
+SELECTION = {
+    "format_version": True,
+    "output_changes": True,
+    "prior_state": {"values": {"outputs": True}},
+    "count": True,
+    "flag": True,
+    "missing": True,
+}
+
+EXPECTED = {
+    "format_version": "1.2",
+    "output_changes": {"out": {"actions": ["no-op"], "after": "ü"}},
+    "prior_state": {"values": {"outputs": {"out": {"value": 1}}}},
+    "count": 12345678901234567890,
+    "flag": True,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1024 * 1024])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_load_selected(chunk_size: int, indent: int | None) -> None:
+    data = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False).encode("utf-8")
+
+    assert load_selected(io.BytesIO(data), SELECTION, chunk_size) == EXPECTED
+
+
+def test_load_selected_text_stream() -> None:
+    assert load_selected(io.StringIO(json.dumps(DOCUMENT)), SELECTION, 5) == EXPECTED
+
+
+def test_load_selected_empty_object() -> None:
+    assert load_selected(io.BytesIO(b" { } "), SELECTION) == {}
+
+
+def test_load_selected_non_object_member() -> None:
+    # a selection of members of a value that is not an object skips it
+    data = io.BytesIO(b'{"prior_state": null, "flag": false}')
+
+    assert load_selected(data, SELECTION) == {"flag": False}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"[]", b'{"flag": true', b'{"planned_values": [1, 2', b'{"flag" true}'],
+)
+def test_load_selected_invalid(data: bytes) -> None:
+    with pytest.raises(JSONStreamError):
+        load_selected(io.BytesIO(data), SELECTION, chunk_size=4)
@@ -282,3 +282,30 @@ def test_remove_prefix_from_path(path: str, prefix: str, expected: str | None):
 )
 def test_parse_jsonpath(path: str, rendered: str):
     assert str(parse_jsonpath(path)) == rendered
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "a.b[*].c",
+        "roles[*].'$ref'",
+        "a[0:2]",
+        "a..b",
+        "$",
+        "a.`parent`",
+        'a."b\\"c"',
+        "a[?(@.b > 3 & @.c == 'x')].d",
+    ],
+)
+def test_parse_jsonpath_matches_jsonpath_ng(path: str):
+    # the parser tables are reused across calls
+    assert parse_jsonpath(path) == parse(path)
+    assert repr(parse_jsonpath(path)) == repr(parse(path))
+
+
+@pytest.mark.parametrize("path", ['a."unterminated', "}", "a[?(@.b == 'x'"])
+def test_parse_jsonpath_invalid(path: str):
+    with pytest.raises(Exception):
+        parse_jsonpath(path)
+    # a failed parse doesn't break subsequent ones
+    assert str(parse_jsonpath("a.b")) == "a.b"
@@ -1,7 +1,10 @@
+import io
 import os
+import subprocess
 import tempfile
 from subprocess import CompletedProcess
 
+import pytest
 from pytest_mock import MockerFixture
 
 from reconcile.utils import lean_terraform_client
@@ -36,6 +39,93 @@ def test_init(mocker: MockerFixture) -> None:
     )
 
 
+def test_init_with_plugin_cache_and_lock_file(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "reconcile.utils.lean_terraform_client.os.environ.copy"
+    ).return_value = {}
+    mocked_subprocess = mocker.patch("reconcile.utils.lean_terraform_client.subprocess")
+    mocked_subprocess.run.return_value = CompletedProcess(
+        args=[], returncode=0, stdout=b"", stderr=b""
+    )
+
+    with (
+        tempfile.TemporaryDirectory() as source_dir,
+        tempfile.TemporaryDirectory() as working_dir,
+    ):
+        lock_file = os.path.join(source_dir, lean_terraform_client.LOCK_FILE_NAME)
+        with open(lock_file, "w", encoding="utf-8") as f:
+            f.write("lock")
+
+        return_code, _, _ = lean_terraform_client.init(
+            working_dir,
+            env={"TF_LOG": "INFO"},
+            plugin_cache_dir="/plugin-cache",
+            lock_file=lock_file,
+        )
+
+        assert return_code == 0
+        assert lean_terraform_client.dependency_lock_file(working_dir) == (
+            os.path.join(working_dir, lean_terraform_client.LOCK_FILE_NAME)
+        )
+    mocked_subprocess.run.assert_called_once_with(
+        ["terraform", "init", "-input=false", "-no-color"],
+        capture_output=True,
+        check=False,
+        cwd=working_dir,
+        env={
+            "TF_LOG": "INFO",
+            "TF_PLUGIN_CACHE_DIR": "/plugin-cache",
+        },
+    )
+
+
+def test_init_drops_reused_lock_file_on_failure(mocker: MockerFixture) -> None:
+    mocked_subprocess = mocker.patch("reconcile.utils.lean_terraform_client.subprocess")
+    mocked_subprocess.run.return_value = CompletedProcess(
+        args=[], returncode=1, stdout=b"", stderr=b"locked"
+    )
+
+    with (
+        tempfile.TemporaryDirectory() as source_dir,
+        tempfile.TemporaryDirectory() as working_dir,
+    ):
+        lock_file = os.path.join(source_dir, lean_terraform_client.LOCK_FILE_NAME)
+        with open(lock_file, "w", encoding="utf-8") as f:
+            f.write("lock")
+
+        return_code, _, _ = lean_terraform_client.init(working_dir, lock_file=lock_file)
+
+        assert return_code == 1
+        mocked_subprocess.run.assert_called_once()
+        assert lean_terraform_client.dependency_lock_file(working_dir) is None
+
+
+def test_required_providers(tmp_path) -> None:
+    (tmp_path / "config.tf.json").write_text(
+        '{"terraform": {"required_providers": {"aws": {"version": "1"}}}}'
+    )
+    (tmp_path / "other.tf.json").write_text('{"resource": {}}')
+
+    assert (
+        lean_terraform_client.required_providers(str(tmp_path))
+        == '{"aws": {"version": "1"}}'
+    )
+
+
+def test_required_providers_unknown(tmp_path) -> None:
+    assert lean_terraform_client.required_providers(str(tmp_path)) is None
+    assert lean_terraform_client.required_providers(str(tmp_path / "missing")) is None
+
+
+def test_plugin_cache_dir(mocker: MockerFixture) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = os.path.join(tmp_dir, "plugin-cache")
+        mocker.patch.object(lean_terraform_client, "TF_PLUGIN_CACHE_DIR", cache_dir)
+
+        assert lean_terraform_client.plugin_cache_dir() == cache_dir
+        assert os.path.isdir(cache_dir)
+
+
 def test_output(mocker: MockerFixture) -> None:
     mocker.patch(
         "reconcile.utils.lean_terraform_client.os"
@@ -170,6 +260,51 @@ def test_show_json(mocker: MockerFixture) -> None:
     )
 
 
+def test_show_json_with_selection(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "reconcile.utils.lean_terraform_client.os.environ.copy"
+    ).return_value = {}
+    mocked_popen = mocker.patch(
+        "reconcile.utils.lean_terraform_client.subprocess.Popen"
+    )
+    process = mocked_popen.return_value.__enter__.return_value
+    process.stdout = io.BytesIO(
+        b'{"format_version": "1.2", "planned_values": {"a": [1]}, "b": 2}\n'
+    )
+    process.wait.return_value = 0
+
+    result = lean_terraform_client.show_json(
+        working_dir="working_dir",
+        path="tfplan",
+        selection={"format_version": True, "b": True},
+    )
+
+    assert result == {"format_version": "1.2", "b": 2}
+    mocked_popen.assert_called_once_with(
+        ["terraform", "show", "-no-color", "-json", "tfplan"],
+        stdout=subprocess.PIPE,
+        stderr=mocker.ANY,
+        cwd="working_dir",
+        env={},
+    )
+
+
+def test_show_json_with_selection_failed(mocker: MockerFixture) -> None:
+    mocked_popen = mocker.patch(
+        "reconcile.utils.lean_terraform_client.subprocess.Popen"
+    )
+    process = mocked_popen.return_value.__enter__.return_value
+    process.stdout = io.BytesIO(b"")
+    process.wait.return_value = 1
+
+    with pytest.raises(Exception, match="terraform show failed"):
+        lean_terraform_client.show_json(
+            working_dir="working_dir",
+            path="tfplan",
+            selection={"format_version": True},
+        )
+
+
 def test_terraform_component() -> None:
     with tempfile.TemporaryDirectory() as working_dir:
         with open(os.path.join(working_dir, "main.tf"), "w", encoding="locale"):
@@ -1,11 +1,20 @@
+import json
 import logging
 import os
+from typing import Any
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import (
+    MagicMock,
+    call,
+    patch,
+)
 
 import pytest
 from kubernetes.dynamic import Resource
-from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from kubernetes.dynamic.exceptions import (
+    NotFoundError,
+    ResourceNotFoundError,
+)
 
 import reconcile.utils.oc
 from reconcile.utils.oc import (
@@ -1058,6 +1067,22 @@ def test_oc_native_get_items_with_resource_names(oc_native: OCNative) -> None:
     )
 
 
+def test_oc_native_get_items_with_many_resource_names(oc_native: OCNative) -> None:
+    obj_client_get = oc_native.client.resources.get.return_value.get
+
+    def get(name: str, **kwargs: Any) -> MagicMock | None:
+        if name == "missing":
+            raise NotFoundError(MagicMock())
+        return MagicMock(to_dict=MagicMock(return_value={"name": name}))
+
+    obj_client_get.side_effect = get
+    names = [f"name{i}" for i in range(20)]
+
+    items = oc_native.get_items("kind1", resource_names=[*names, "missing"])
+
+    assert items == [{"name": name} for name in names]
+
+
 def test_oc_native_get_all(oc_native: OCNative) -> None:
     oc_native.get_all("kind1")
 
@@ -1068,3 +1093,77 @@ def test_oc_native_get_all(oc_native: OCNative) -> None:
     oc_native.client.resources.get.return_value.get.assert_called_once_with(
         _request_timeout=60,
     )
+
+
+def test_oc_native_iter_items(oc_native: OCNative) -> None:
+    obj_client_get = oc_native.client.resources.get.return_value.get
+    obj_client_get.side_effect = [
+        MagicMock(
+            data=b'{"items": [{"a": 1}, {"a": 2}], "metadata": {"continue": "t"}}'
+        ),
+        MagicMock(data=b'{"items": [{"a": 3}], "metadata": {}}'),
+    ]
+
+    items = oc_native.iter_items("kind1", labels={"label1": "value1"}, chunk_size=2)
+
+    assert list(items) == [{"a": 1}, {"a": 2}, {"a": 3}]
+    obj_client_get.assert_has_calls([
+        call(
+            namespace="",
+            label_selector="label1=value1",
+            limit=2,
+            _continue=None,
+            serialize=False,
+            _request_timeout=60,
+        ),
+        call(
+            namespace="",
+            label_selector="label1=value1",
+            limit=2,
+            _continue="t",
+            serialize=False,
+            _request_timeout=60,
+        ),
+    ])
+
+
+def test_oc_native_iter_items_with_resource_names(oc_native: OCNative) -> None:
+    list(oc_native.iter_items("kind1", resource_names=["name"]))
+
+    oc_native.client.resources.get.return_value.get.assert_called_once_with(
+        namespace="",
+        name="name",
+        label_selector="",
+        _request_timeout=60,
+    )
+
+
+def test_oc_native_iter_items_from_informer(oc_native: OCNative, mocker) -> None:
+    get_informer = mocker.patch("reconcile.utils.oc.get_informer", autospec=True)
+    get_informer.return_value.items.return_value = iter([{"a": 1}])
+    oc_native.use_informers = True
+
+    assert list(oc_native.iter_items("kind1", namespace="cluster")) == [{"a": 1}]
+    get_informer.return_value.items.assert_called_once_with()
+    assert get_informer.call_args.args[3] is None
+    oc_native.client.resources.get.return_value.get.assert_not_called()
+
+
+def test_oc_native_iter_items_informer_backoff(oc_native: OCNative, mocker) -> None:
+    get_informer = mocker.patch("reconcile.utils.oc.get_informer", autospec=True)
+    get_informer.return_value = None
+    oc_native.use_informers = True
+    obj_client = oc_native.client.resources.get.return_value
+    obj_client.get.return_value.data = json.dumps({
+        "items": [{"a": 1}],
+        "metadata": {},
+    }).encode()
+
+    assert list(oc_native.iter_items("kind1", namespace="cluster")) == [{"a": 1}]
+    obj_client.get.assert_called_once()
+
+
+def test_oc_cli_get_items_all_namespaces(oc_cli: OCCli, mocker) -> None:
+    run_json = mocker.patch.object(oc_cli, "_run_json", return_value={"items": []})
+    oc_cli.get_items("Kind", all_namespaces=True, namespace="ignored")
+    run_json.assert_called_once_with(["get", "Kind", "-o", "json", "--all-namespaces"])
@@ -0,0 +1,154 @@
+import json
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from reconcile.utils import oc_informer
+from reconcile.utils.oc_informer import (
+    InformerSyncError,
+    ResourceInformer,
+    get_informer,
+    stop_informers,
+)
+
+
+def obj(namespace: str, name: str, resource_version: str) -> dict[str, Any]:
+    return {
+        "metadata": {
+            "namespace": namespace,
+            "name": name,
+            "resourceVersion": resource_version,
+        }
+    }
+
+
+@pytest.fixture
+def obj_client() -> MagicMock:
+    client = MagicMock()
+    client.get.side_effect = [
+        MagicMock(
+            data=json.dumps({
+                "items": [obj("ns1", "a", "1")],
+                "metadata": {"continue": "token"},
+            }).encode()
+        ),
+        MagicMock(
+            data=json.dumps({
+                "items": [obj("ns2", "b", "2")],
+                "metadata": {"resourceVersion": "3"},
+            }).encode()
+        ),
+    ]
+    return client
+
+
+def test_informer_relist(obj_client: MagicMock) -> None:
+    informer = ResourceInformer(obj_client)
+    informer.relist()
+    informer._synced.set()
+
+    assert informer.resource_version == "3"
+    assert list(informer.items()) == [obj("ns1", "a", "1"), obj("ns2", "b", "2")]
+    assert obj_client.get.call_args_list[1].kwargs["_continue"] == "token"
+    assert obj_client.get.call_args_list[1].kwargs["namespace"] is None
+
+
+def test_informer_namespaced(obj_client: MagicMock) -> None:
+    informer = ResourceInformer(obj_client, namespace="ns1")
+    informer.relist()
+
+    assert obj_client.get.call_args.kwargs["namespace"] == "ns1"
+
+
+def test_informer_apply_events(obj_client: MagicMock) -> None:
+    informer = ResourceInformer(obj_client)
+    informer.relist()
+    informer._synced.set()
+
+    informer.apply_event("ADDED", obj("ns1", "c", "4"))
+    informer.apply_event("MODIFIED", obj("ns1", "a", "5"))
+    informer.apply_event("DELETED", obj("ns2", "b", "6"))
+    informer.apply_event("BOOKMARK", {"metadata": {"resourceVersion": "7"}})
+
+    assert informer.resource_version == "7"
+    assert list(informer.items()) == [obj("ns1", "a", "5"), obj("ns1", "c", "4")]
+
+
+def test_informer_items_are_copies(obj_client: MagicMock) -> None:
+    informer = ResourceInformer(obj_client)
+    informer.relist()
+    informer._synced.set()
+
+    next(informer.items())["metadata"]["name"] = "changed"
+    assert next(informer.items())["metadata"]["name"] == "a"
+
+
+def test_informer_stale_store(obj_client: MagicMock) -> None:
+    informer = ResourceInformer(obj_client)
+    informer.relist()
+    informer._synced.set()
+    assert not informer.is_stale()
+
+    assert informer._last_sync is not None
+    informer._last_sync -= oc_informer.MAX_STALENESS_SECONDS + 1
+
+    assert informer.is_stale()
+    with pytest.raises(InformerSyncError):
+        list(informer.items())
+
+    informer.apply_event("BOOKMARK", {"metadata": {"resourceVersion": "4"}})
+    assert list(informer.items()) == [obj("ns1", "a", "1"), obj("ns2", "b", "2")]
+
+
+def test_informer_failed_initial_sync(mocker: MockerFixture) -> None:
+    obj_client = MagicMock()
+    obj_client.get.side_effect = Exception("forbidden")
+    informer = get_informer("server", "token", "Kind", None, lambda: obj_client)
+
+    with pytest.raises(InformerSyncError):
+        list(informer.items(timeout=5))
+    assert informer._thread is not None
+    informer._thread.join(timeout=5)
+
+    # readers fall back to direct LISTs until the backoff expired
+    assert get_informer("server", "token", "Kind", None, lambda: obj_client) is None
+    monotonic = mocker.patch.object(oc_informer.time, "monotonic")
+    monotonic.return_value = 10**9
+    retried = get_informer("server", "token", "Kind", None, lambda: obj_client)
+    assert retried is not None
+    assert retried is not informer
+    stop_informers()
+
+
+def test_get_informer_limit(mocker: MockerFixture) -> None:
+    mocker.patch.object(oc_informer, "MAX_INFORMERS", 1)
+    release = threading.Event()
+    obj_client = MagicMock()
+    obj_client.get.side_effect = lambda **_: release.wait()
+    try:
+        assert get_informer("server", "token", "Kind", "ns1", lambda: obj_client)
+        assert (
+            get_informer("server", "token", "Kind", "ns2", lambda: obj_client) is None
+        )
+    finally:
+        stop_informers()
+        release.set()
+
+
+def test_get_informer_per_identity() -> None:
+    # keep the informers busy with their initial sync
+    release = threading.Event()
+    obj_client = MagicMock()
+    obj_client.get.side_effect = lambda **_: release.wait()
+    try:
+        a = get_informer("server", "token-a", "Kind", None, lambda: obj_client)
+        assert get_informer("server", "token-a", "Kind", None, lambda: obj_client) is a
+        assert (
+            get_informer("server", "token-b", "Kind", None, lambda: obj_client) is not a
+        )
+    finally:
+        stop_informers()
+        release.set()
@@ -0,0 +1,156 @@
+import json
+import os
+import re
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from reconcile.test.fixtures import Fixtures
+from reconcile.utils import oc
+from reconcile.utils.oc import (
+    StatusCodeError,
+    oc_process,
+)
+from reconcile.utils.openshift_template import (
+    TemplateProcessingError,
+    generate_expression_value,
+    process_template,
+)
+
+fxt = Fixtures("openshift_template")
+
+CORPUS = sorted(
+    f for f in os.listdir(os.path.dirname(fxt.path("x"))) if f.endswith(".yml")
+)
+
+
+def template(
+    parameters: list[dict[str, Any]], objects: list[dict[str, Any]] | None = None
+) -> dict[str, Any]:
+    return {
+        "apiVersion": "template.openshift.io/v1",
+        "kind": "Template",
+        "metadata": {"name": "test"},
+        "parameters": parameters,
+        "objects": objects
+        or [{"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "cm"}}],
+    }
+
+
+@pytest.mark.parametrize("case", CORPUS)
+def test_process_template_conformance(case: str) -> None:
+    """
+    the expected results of the corpus are the output of `oc process`
+    """
+    data = fxt.get_anymarkup(case)
+    items = process_template(data["template"], data["parameters"])
+    # oc returns the keys of all objects sorted
+    assert json.dumps(items) == json.dumps(data["expected"], sort_keys=True)
+
+
+def test_process_template_does_not_modify_template() -> None:
+    data = fxt.get_anymarkup("namespaces.yml")
+    before = json.dumps(data["template"])
+    process_template(data["template"], data["parameters"])
+    assert json.dumps(data["template"]) == before
+
+
+def test_process_template_required_parameter() -> None:
+    with pytest.raises(TemplateProcessingError, match="parameter A is required"):
+        process_template(template([{"name": "A", "required": True}]))
+
+
+def test_process_template_required_parameter_supplied_empty() -> None:
+    with pytest.raises(TemplateProcessingError, match="parameter A is required"):
+        process_template(
+            template([{"name": "A", "value": "x", "required": True}]), {"A": ""}
+        )
+
+
+def test_process_template_generate_expression() -> None:
+    items = process_template(
+        template(
+            [
+                {
+                    "name": "PASSWORD",
+                    "generate": "expression",
+                    "from": "pw-[a-zA-Z0-9]{16}",
+                    "required": True,
+                }
+            ],
+            [
+                {
+                    "apiVersion": "v1",
+                    "kind": "Secret",
+                    "metadata": {"name": "s"},
+                    "stringData": {"password": "${PASSWORD}"},
+                }
+            ],
+        )
+    )
+    assert re.fullmatch(r"pw-[a-zA-Z0-9]{16}", items[0]["stringData"]["password"])
+
+
+def test_process_template_supplied_value_disables_generation() -> None:
+    items = process_template(
+        template(
+            [{"name": "A", "generate": "expression", "from": "[a-z]{8}"}],
+            [{"kind": "ConfigMap", "data": {"a": "${A}"}}],
+        ),
+        {"A": "given"},
+    )
+    assert items[0]["data"]["a"] == "given"
+
+
+def test_process_template_unknown_generator() -> None:
+    with pytest.raises(TemplateProcessingError, match="unknown generator"):
+        process_template(template([{"name": "A", "generate": "unknown"}]))
+
+
+def test_process_template_missing_kind() -> None:
+    with pytest.raises(TemplateProcessingError, match="Kind"):
+        process_template(template([], [{"metadata": {"name": "a"}}]))
+
+
+@pytest.mark.parametrize(
+    "expression, pattern",
+    [
+        ("[a-z]{10}", r"[a-z]{10}"),
+        ("[A-Z0-9]{5}", r"[A-Z0-9]{5}"),
+        ("[\\w]{12}", r"\w{12}"),
+        ("[\\d]{4}-[\\a]{4}", r"\d{4}-[a-zA-Z]{4}"),
+        ("static", r"static"),
+    ],
+)
+def test_generate_expression_value(expression: str, pattern: str) -> None:
+    assert re.fullmatch(pattern, generate_expression_value(expression))
+
+
+@pytest.mark.parametrize("expression", ["[a-z]{0}", "[a-z]{256}", "[z-a]{3}"])
+def test_generate_expression_value_invalid(expression: str) -> None:
+    with pytest.raises(TemplateProcessingError):
+        generate_expression_value(expression)
+
+
+def test_oc_process_native_error(mocker: MockerFixture) -> None:
+    mocker.patch.object(oc, "OC_PROCESS_ENGINE", "native")
+    with pytest.raises(StatusCodeError):
+        oc_process(template([{"name": "A", "required": True}]))
+
+
+def test_oc_process_falls_back_to_oc_for_template_labels(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(oc, "OC_PROCESS_ENGINE", "native")
+    process = mocker.patch.object(oc.OCLocal, "process", return_value=[])
+    t = template([]) | {"labels": {"app": "a"}}
+    oc_process(t, {"A": "b"})
+    process.assert_called_once_with(t, {"A": "b"})
+
+
+def test_oc_process_oc_engine(mocker: MockerFixture) -> None:
+    mocker.patch.object(oc, "OC_PROCESS_ENGINE", "oc")
+    process = mocker.patch.object(oc.OCLocal, "process", return_value=[])
+    oc_process(template([]))
+    process.assert_called_once()
@@ -259,3 +259,96 @@ def test_get_escalation_policy_users(mocker: Mock, pypd_escalation_policy: Mock)
         "username_get_user",
         "username_get_schedule_users",
     ])
+
+
+def test_get_pagerduty_users_cached(mocker: Mock, pypd_user: Mock):
+    clock = mocker.patch("time.monotonic", return_value=1000.0)
+    mock_get_schedule_users = mocker.patch(
+        "reconcile.utils.pagerduty_api.PagerDutyApi.get_schedule_users",
+        return_value=["user1"],
+    )
+    pd_api = pagerduty_api.PagerDutyApi(token="secret", init_users=False)
+
+    assert pd_api.get_pagerduty_users("schedule", "foobar") == ["user1"]
+    assert pd_api.get_pagerduty_users("schedule", "foobar") == ["user1"]
+    mock_get_schedule_users.assert_called_once()
+
+    clock.return_value += pagerduty_api.PagerDutyApi.ONCALL_CACHE_SECONDS
+    assert pd_api.get_pagerduty_users("schedule", "foobar") == ["user1"]
+    assert mock_get_schedule_users.call_count == 2
+
+
+def test_get_escalation_policy_users_uses_schedule_cache(
+    mocker: Mock, pypd_escalation_policy: Mock
+):
+    mocker.patch(
+        "reconcile.utils.pagerduty_api.PagerDutyApi.get_user",
+        return_value="username_get_user",
+    )
+    mock_get_schedule_users = mocker.patch(
+        "reconcile.utils.pagerduty_api.PagerDutyApi.get_schedule_users",
+        return_value=["username_get_schedule_users"],
+    )
+    pd_api = pagerduty_api.PagerDutyApi(token="secret", init_users=False)
+
+    pd_api.get_pagerduty_users("schedule", "id")
+    pd_api.get_pagerduty_users("escalationPolicy", "foo")
+
+    mock_get_schedule_users.assert_called_once()
+
+
+def test_get_pagerduty_resource(vault_secret: VaultSecret) -> None:
+    instance = PagerDutyInstance(name="redhat", token=vault_secret)
+    target = PagerDutyTarget(
+        name="t", instance=instance, schedule_id="S", escalation_policy_id=None
+    )
+    assert pagerduty_api.get_pagerduty_resource(target) == ("schedule", "S")
+    target.escalation_policy_id = "E"
+    assert pagerduty_api.get_pagerduty_resource(target) == ("escalationPolicy", "E")
+    target.schedule_id = target.escalation_policy_id = None
+    with pytest.raises(pagerduty_api.PagerDutyTargetException):
+        pagerduty_api.get_pagerduty_resource(target)
+
+
+def test_pagerduty_map_prefetch(vault_secret: VaultSecret) -> None:
+    pager_duty_api_class = create_autospec(pagerduty_api.PagerDutyApi)
+    pd_map = pagerduty_api.PagerDutyMap(
+        instances=[pagerduty_api.PagerDutyConfig(name="redhat", token="secret")],
+        pager_duty_api_class=pager_duty_api_class,
+    )
+    pd_api = pd_map.get("redhat")
+    pd_api.get_pagerduty_users.side_effect = [
+        pagerduty_api.PagerDutyApiException("error"),
+        ["user"],
+    ]
+    instance = PagerDutyInstance(name="redhat", token=vault_secret)
+    targets = [
+        PagerDutyTarget(
+            name="a", instance=instance, schedule_id="S", escalation_policy_id=None
+        ),
+        PagerDutyTarget(
+            name="b", instance=instance, schedule_id="S", escalation_policy_id=None
+        ),
+        PagerDutyTarget(
+            name="c", instance=instance, schedule_id=None, escalation_policy_id="E"
+        ),
+        PagerDutyTarget(
+            name="invalid",
+            instance=instance,
+            schedule_id=None,
+            escalation_policy_id=None,
+        ),
+        PagerDutyTarget(
+            name="unknown",
+            instance=PagerDutyInstance(name="unknown", token=vault_secret),
+            schedule_id="S",
+            escalation_policy_id=None,
+        ),
+    ]
+
+    pd_map.prefetch(targets, thread_pool_size=1)
+
+    assert sorted(c.args for c in pd_api.get_pagerduty_users.call_args_list) == [
+        ("escalationPolicy", "E"),
+        ("schedule", "S"),
+    ]
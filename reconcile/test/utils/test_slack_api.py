@@ -20,6 +20,7 @@ from reconcile.utils.slack_api import (
     TIMEOUT,
     SlackApi,
     SlackApiConfig,
+    SlackDirectory,
     UserNotFoundException,
 )
 
@@ -176,9 +177,10 @@ def test__get_uses_cache(slack_api: SlackApiMock) -> None:
     # Reset the mock to clear any calls during __init__
     slack_api.mock_slack_client.return_value.api_call.reset_mock()
 
-    slack_api.client._results["channels"] = ["some", "data"]
+    channels = {"C1": {"id": "C1", "name": "some"}}
+    slack_api.client._directory.set("channels", channels)
 
-    assert slack_api.client._get("channels") == ["some", "data"]
+    assert slack_api.client._get("channels") == channels
     slack_api.mock_slack_client.return_value.api_call.assert_not_called()
 
 
@@ -440,6 +442,143 @@ def test_get_flat_conversation_history(
     assert len(messages) == len(fixture_messages) - 1
 
 
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_slack_directory_ttl() -> None:
+    clock = FakeClock()
+    directory = SlackDirectory(ttl=60, clock=clock)
+
+    assert directory.get("users") is None
+    directory.set("users", {"U1": {"id": "U1", "name": "user"}})
+    clock.now += 59
+    assert directory.get("users") == {"U1": {"id": "U1", "name": "user"}}
+    clock.now += 1
+    assert directory.get("users") is None
+
+
+def test_slack_directory_indexes() -> None:
+    directory = SlackDirectory()
+    directory.set(
+        "users",
+        {
+            "U1": {
+                "id": "U1",
+                "name": "user",
+                "profile": {"email": "User@example.com"},
+                "enterprise_user": {"id": "E1"},
+            }
+        },
+    )
+    directory.set("usergroups", {"G1": {"id": "G1", "handle": "old"}})
+    directory.put("usergroups", {"id": "G1", "handle": "new"})
+
+    assert directory.ids_by("users", "name", "user") == ["U1"]
+    assert directory.user_id_by_email("user@example.com") == "U1"
+    assert directory.translate_user_id("E1") == "U1"
+    assert directory.ids_by("usergroups", "handle", "old") == []
+    assert directory.ids_by("usergroups", "handle", "new") == ["G1"]
+
+
+def test_slack_directory_shared(slack_api: SlackApiMock) -> None:
+    slack_api.mock_slack_client.return_value.api_call.return_value = new_slack_response({
+        "members": [{"id": "U1", "name": "user", "deleted": False}],
+        "response_metadata": {"next_cursor": ""},
+    })
+
+    other = SlackApi("some-workspace", "token", init_usergroups=False)
+    assert slack_api.client.get_active_users_by_names(["user"]) == {"U1": "user"}
+    assert other.get_active_users_by_names(["user", "missing"]) == {"U1": "user"}
+    slack_api.mock_slack_client.return_value.api_call.assert_called_once()
+
+    different_token = SlackApi("some-workspace", "other", init_usergroups=False)
+    different_token.get_active_users_by_names(["user"])
+    assert slack_api.mock_slack_client.return_value.api_call.call_count == 2
+
+
+def test_get_users_by_ids_looks_up_new_users(slack_api: SlackApiMock) -> None:
+    client = slack_api.mock_slack_client.return_value
+    client.api_call.return_value = new_slack_response({
+        "members": [{"id": "U1", "name": "user"}],
+        "response_metadata": {"next_cursor": ""},
+    })
+    assert slack_api.client.get_users_by_ids(["U1", "U2"]) == {"U1": "user"}
+    client.users_info.assert_not_called()
+
+    def users_info(user: str) -> dict[str, Any]:
+        if user == "U2":
+            return {"user": {"id": "U2", "name": "new"}}
+        raise SlackApiError("", {"error": "user_not_found"})
+
+    client.users_info.side_effect = users_info
+
+    assert slack_api.client.get_users_by_ids(["U1", "U2", "U3"]) == {
+        "U1": "user",
+        "U2": "new",
+    }
+    assert slack_api.client.get_users_by_ids(["U2", "U3"]) == {"U2": "new"}
+    assert client.users_info.call_count == 2
+    client.api_call.assert_called_once()
+
+
+def test_update_usergroup_users_updates_cache(slack_api: SlackApiMock) -> None:
+    client = slack_api.mock_slack_client.return_value
+    client.usergroups_list.return_value = {
+        "usergroups": [{"id": "G1", "handle": "group", "users": ["U1"]}]
+    }
+    # drop the usergroups fetched by the fixture
+    slack_api.client._directory.invalidate("usergroups")
+    client.usergroups_list.reset_mock()
+    assert slack_api.client.get_usergroup("group")["users"] == ["U1"]
+    client.usergroups_users_update.return_value = new_slack_response({
+        "usergroup": {"id": "G1", "handle": "group", "users": ["U1", "U2"]}
+    })
+
+    slack_api.client.update_usergroup_users("G1", ["U1", "U2"])
+
+    assert slack_api.client.get_usergroup("group")["users"] == ["U1", "U2"]
+    client.usergroups_list.assert_called_once()
+
+
+def test_update_usergroup_keeps_cached_users(slack_api: SlackApiMock) -> None:
+    client = slack_api.mock_slack_client.return_value
+    client.usergroups_list.return_value = {
+        "usergroups": [{"id": "G1", "handle": "group", "users": ["U1"]}]
+    }
+    slack_api.client._directory.invalidate("usergroups")
+    assert slack_api.client.get_usergroup("group")["users"] == ["U1"]
+    # usergroups.update responses only carry the user_count
+    client.usergroups_update.return_value = new_slack_response({
+        "usergroup": {
+            "id": "G1",
+            "handle": "group",
+            "description": "new",
+            "user_count": 1,
+        }
+    })
+
+    slack_api.client.update_usergroup("G1", ["C1"], "new")
+
+    usergroup = slack_api.client.get_usergroup("group")
+    assert usergroup["users"] == ["U1"]
+    assert usergroup["description"] == "new"
+
+
+def test_get_user_id_by_name_from_directory(slack_api: SlackApiMock) -> None:
+    slack_api.client._directory.set(
+        "users",
+        {"U1": {"id": "U1", "name": "user", "profile": {"email": "user@example.com"}}},
+    )
+
+    assert slack_api.client.get_user_id_by_name("user", "example.com") == "U1"
+    slack_api.mock_slack_client.return_value.users_lookupByEmail.assert_not_called()
+
+
 #
 # Slack WebClient retry tests
 #
@@ -1,3 +1,4 @@
+import json
 from collections.abc import Generator
 from typing import TYPE_CHECKING
 
@@ -212,6 +213,110 @@ def test_add_with_metadata(integration_state: State) -> None:
     assert integration_state.get("k") == "v"
 
 
+def test_add_many(integration_state: State) -> None:
+    integration_state.add_many({"a": 1, "b": {"c": 2}})
+
+    assert integration_state.get_many(["a", "b", "missing"]) == {"a": 1, "b": {"c": 2}}
+
+
+def test_add_many_existing_key(integration_state: State) -> None:
+    integration_state.add("a", 1)
+
+    with pytest.raises(KeyError):
+        integration_state.add_many({"a": 1, "b": 2})
+    assert not integration_state.exists("b")
+
+    integration_state.add_many({"a": 3, "b": 2}, force=True)
+    assert integration_state.get_many(["a", "b"]) == {"a": 3, "b": 2}
+
+
+def test_get_all(integration_state: State, s3_client: S3Client) -> None:
+    for key in ["path/a", "path/b", "other/c"]:
+        s3_client.put_object(
+            Bucket=integration_state.bucket,
+            Key=f"state/integration-name/{key}",
+            Body=json.dumps(key),
+        )
+
+    assert integration_state.get_all("path") == {"a": "path/a", "b": "path/b"}
+
+
+def test_prefetch_serves_reads_locally(
+    integration_state: State, s3_client: S3Client, mocker: MockerFixture
+) -> None:
+    s3_client.put_object(
+        Bucket=integration_state.bucket,
+        Key="state/integration-name/path/a",
+        Body=json.dumps({"a": 1}),
+    )
+
+    assert integration_state.prefetch("path") == ["path/a"]
+
+    get_object = mocker.spy(s3_client, "get_object")
+    head_object = mocker.spy(s3_client, "head_object")
+    value = integration_state["path/a"]
+    assert value == {"a": 1}
+    # every read returns a fresh object
+    value["a"] = 2
+    assert integration_state["path/a"] == {"a": 1}
+    assert integration_state.exists("path/a")
+    assert not integration_state.exists("path/b")
+    get_object.assert_not_called()
+    head_object.assert_not_called()
+
+
+def test_prefetch_only_downloads_changed_keys(
+    integration_state: State, s3_client: S3Client, mocker: MockerFixture
+) -> None:
+    integration_state.add_many({"a": 1, "b": 2})
+    integration_state.prefetch()
+
+    s3_client.put_object(
+        Bucket=integration_state.bucket,
+        Key="state/integration-name/b",
+        Body=json.dumps(3),
+    )
+    get_object = mocker.spy(s3_client, "get_object")
+    integration_state.prefetch()
+
+    assert get_object.call_count == 1
+    assert integration_state.get_many(["a", "b"]) == {"a": 1, "b": 3}
+
+
+def test_add_after_prefetch(integration_state: State) -> None:
+    integration_state.get_all("x")
+
+    integration_state.add("x/new", 1)
+
+    assert integration_state.exists("x/new")
+    with pytest.raises(KeyError):
+        integration_state.add("x/new", 2)
+    assert integration_state.get("x/new") == 1
+
+
+def test_prefetch_respects_path_components(
+    integration_state: State, s3_client: S3Client
+) -> None:
+    integration_state.prefetch("a/b")
+    s3_client.put_object(
+        Bucket=integration_state.bucket,
+        Key="state/integration-name/a/bc",
+        Body=json.dumps(1),
+    )
+
+    assert integration_state.exists("a/bc")
+    assert not integration_state.exists("a/b/c")
+
+
+def test_rm_invalidates_cache(integration_state: State) -> None:
+    integration_state.add("a", 1)
+    integration_state.prefetch()
+
+    integration_state.rm("a")
+
+    assert integration_state.get("a", None) is None
+
+
 #
 # aquire settings
 #
@@ -3,7 +3,12 @@ import tempfile
 from collections.abc import Callable
 from logging import DEBUG
 from operator import itemgetter
-from unittest.mock import create_autospec
+from typing import Any
+from unittest.mock import (
+    ANY,
+    call,
+    create_autospec,
+)
 
 import pytest
 from botocore.errorfactory import ClientError
@@ -15,6 +20,7 @@ from reconcile.utils.external_resource_spec import (
     ExternalResourceSpec,
     ExternalResourceUniqueKey,
 )
+from reconcile.utils.terraform_plan_cache import PlanCache
 
 
 @pytest.fixture
@@ -910,12 +916,93 @@ def test_terraform_init(
             "TF_LOG": "TRACE",
             "TF_LOG_PATH": "temp-name",
         },
+        plugin_cache_dir=None,
     )
     mocked_logging.warning.assert_called_once_with(
         f"[{ACCOUNT_NAME} - init] {warning_log}"
     )
 
 
+@pytest.fixture
+def init_specs_mocks(mocker: MockerFixture, tmp_path) -> dict[str, Any]:
+    working_dirs = {}
+    for name in ["a1", "a2", "a3"]:
+        (tmp_path / name).mkdir()
+        working_dirs[name] = str(tmp_path / name)
+    mocked_lean_tf = mocker.patch("reconcile.utils.terraform_client.lean_tf")
+    mocked_lean_tf.plugin_cache_dir.return_value = "/plugin-cache"
+    # a1 and a2 require the same providers
+    mocked_lean_tf.required_providers.side_effect = lambda wd: (
+        "aws-v2" if wd == working_dirs["a3"] else "aws-v1"
+    )
+    mocked_lean_tf.dependency_lock_file.side_effect = lambda wd: f"{wd}/lock"
+    mocked_lean_tf.init.return_value = (0, "", "")
+    mocker.patch.object(tfclient.TerraformClient, "terraform_output").return_value = (
+        "a1",
+        {},
+    )
+    return {
+        "working_dirs": working_dirs,
+        "lean_tf": mocked_lean_tf,
+        "terraform_init": mocker.patch.object(
+            tfclient.TerraformClient, "terraform_init"
+        ),
+    }
+
+
+def _init_specs_client(aws_api: AWSApi, working_dirs: dict[str, str]):
+    return tfclient.TerraformClient(
+        "integ",
+        "v1",
+        "integ_pfx",
+        [{"name": name} for name in working_dirs],
+        working_dirs,
+        10,
+        aws_api,
+    )
+
+
+def test_init_specs_seeds_plugin_cache_per_provider_set(
+    aws_api: AWSApi, init_specs_mocks: dict[str, Any]
+) -> None:
+    working_dirs = init_specs_mocks["working_dirs"]
+
+    _init_specs_client(aws_api, working_dirs)
+
+    # the seeds populate the plugin cache one after another
+    assert init_specs_mocks["terraform_init"].call_args_list == [
+        call(
+            tfclient.TerraformSpec(name="a1", working_dir=working_dirs["a1"]),
+            plugin_cache_dir="/plugin-cache",
+        ),
+        call(
+            tfclient.TerraformSpec(name="a3", working_dir=working_dirs["a3"]),
+            plugin_cache_dir="/plugin-cache",
+        ),
+    ]
+    init_specs_mocks["lean_tf"].init.assert_called_once_with(
+        working_dirs["a2"],
+        env=ANY,
+        plugin_cache_dir="/plugin-cache",
+        lock_file=f"{working_dirs['a1']}/lock",
+    )
+
+
+def test_init_specs_retries_without_lock_file_serially(
+    aws_api: AWSApi, init_specs_mocks: dict[str, Any]
+) -> None:
+    working_dirs = init_specs_mocks["working_dirs"]
+    init_specs_mocks["lean_tf"].init.return_value = (1, "", "checksum mismatch")
+
+    _init_specs_client(aws_api, working_dirs)
+
+    init_specs_mocks["terraform_init"].assert_called_with(
+        tfclient.TerraformSpec(name="a2", working_dir=working_dirs["a2"]),
+        plugin_cache_dir="/plugin-cache",
+    )
+    assert init_specs_mocks["terraform_init"].call_count == 3
+
+
 def test_terraform_output(
     tf: tfclient.TerraformClient,
     mocker: MockerFixture,
@@ -949,6 +1036,24 @@ def test_terraform_output(
     )
 
 
+def test_terraform_output_from_state(
+    tf: tfclient.TerraformClient,
+    mocker: MockerFixture,
+    terraform_spec_builder: Callable[..., tfclient.TerraformSpec],
+) -> None:
+    mocked_lean_tf = mocker.patch("reconcile.utils.terraform_client.lean_tf")
+    outputs = {"out": {"sensitive": False, "type": "string", "value": "v"}}
+    mocked_state_outputs = mocker.patch(
+        "reconcile.utils.terraform_client.s3_state_outputs", return_value=outputs
+    )
+    spec = terraform_spec_builder(ACCOUNT_NAME, "/wd")
+
+    assert tf.terraform_output(spec) == (ACCOUNT_NAME, outputs)
+
+    mocked_state_outputs.assert_called_once_with("/wd")
+    mocked_lean_tf.output.assert_not_called()
+
+
 def test_terraform_plan(
     tf: tfclient.TerraformClient,
     mocker: MockerFixture,
@@ -1019,6 +1124,93 @@ def test_terraform_plan_with_error(
     mocked_lean_tf.show_json.assert_not_called()
 
 
+def test_terraform_plan_skipped_if_unchanged(
+    tf: tfclient.TerraformClient,
+    mocker: MockerFixture,
+    terraform_spec_builder: Callable[..., tfclient.TerraformSpec],
+) -> None:
+    mocked_lean_tf = mocker.patch("reconcile.utils.terraform_client.lean_tf")
+    mocked_lean_tf.show_json.return_value = {
+        "format_version": "1.2",
+        "resource_changes": [
+            {
+                "type": "aws_s3_bucket",
+                "name": "b",
+                "address": "aws_s3_bucket.b",
+                "change": {"actions": ["no-op"]},
+            }
+        ],
+    }
+    mocked_lean_tf.plan.return_value = (0, "", "")
+    mocker.patch("reconcile.utils.terraform_client.tempfile")
+    tf._plan_cache = PlanCache(state_fingerprint=lambda _: "etag")
+
+    with tempfile.TemporaryDirectory() as working_dir:
+        with open(f"{working_dir}/config.tf.json", "w", encoding="utf-8") as f:
+            f.write("{}")
+        spec = terraform_spec_builder(ACCOUNT_NAME, working_dir)
+
+        assert tf.terraform_plan(spec, False) == (False, [], False)
+        assert tf.terraform_plan(spec, False) == (False, [], False)
+
+    mocked_lean_tf.plan.assert_called_once()
+    assert tf.skipped_plans == {ACCOUNT_NAME}
+
+
+def test_terraform_plan_with_changes_not_skipped(
+    tf: tfclient.TerraformClient,
+    mocker: MockerFixture,
+    terraform_spec_builder: Callable[..., tfclient.TerraformSpec],
+) -> None:
+    mocked_lean_tf = mocker.patch("reconcile.utils.terraform_client.lean_tf")
+    mocked_lean_tf.show_json.return_value = {
+        "format_version": "1.2",
+        "resource_changes": [
+            {
+                "type": "aws_s3_bucket",
+                "name": "b",
+                "address": "aws_s3_bucket.b",
+                "change": {"actions": ["create"]},
+            }
+        ],
+    }
+    mocked_lean_tf.plan.return_value = (0, "", "")
+    mocker.patch("reconcile.utils.terraform_client.tempfile")
+    tf._plan_cache = PlanCache(state_fingerprint=lambda _: "etag")
+
+    with tempfile.TemporaryDirectory() as working_dir:
+        with open(f"{working_dir}/config.tf.json", "w", encoding="utf-8") as f:
+            f.write("{}")
+        spec = terraform_spec_builder(ACCOUNT_NAME, working_dir)
+
+        tf.terraform_plan(spec, False)
+        tf.terraform_plan(spec, False)
+
+    assert mocked_lean_tf.plan.call_count == 2
+    assert tf.skipped_plans == set()
+
+
+def test_terraform_apply_excludes_skipped_plans(
+    tf: tfclient.TerraformClient,
+    mocker: MockerFixture,
+) -> None:
+    mocked_threaded_run = mocker.patch("reconcile.utils.terraform_client.threaded.run")
+    mocked_threaded_run.return_value = [False]
+    tf.specs = [
+        tfclient.TerraformSpec(name="a1", working_dir="/a1"),
+        tfclient.TerraformSpec(name="a2", working_dir="/a2"),
+    ]
+    tf.skipped_plans = {"a1"}
+
+    assert tf.apply() is False
+
+    mocked_threaded_run.assert_called_once_with(
+        tf.terraform_apply,
+        [tfclient.TerraformSpec(name="a2", working_dir="/a2")],
+        tf.thread_pool_size,
+    )
+
+
 def test_terraform_safe_plan_raises_errors(
     tf: tfclient.TerraformClient,
     mocker: MockerFixture,
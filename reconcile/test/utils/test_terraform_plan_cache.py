@@ -0,0 +1,78 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from reconcile.utils.disk_cache import DiskCache
+from reconcile.utils.terraform_plan_cache import PlanCache
+
+BACKEND = {
+    "bucket": "state-bucket",
+    "key": "account.tfstate",
+    "region": "us-east-1",
+    "access_key": "access",
+    "secret_key": "secret",
+}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def working_dir(tmp_path: Path) -> Path:
+    config = {"terraform": {"backend": {"s3": BACKEND}}, "resource": {}}
+    (tmp_path / "config.tf.json").write_text(json.dumps(config), encoding="utf-8")
+    (tmp_path / ".terraform.lock.hcl").write_text("aws 5.0.0", encoding="utf-8")
+    return tmp_path
+
+
+def test_plan_cache_key(working_dir: Path) -> None:
+    cache = PlanCache(state_fingerprint=lambda _: "etag")
+    key = cache.key(str(working_dir), "integ")
+
+    assert key
+    assert cache.key(str(working_dir), "integ") == key
+    assert cache.key(str(working_dir), "other") != key
+
+    (working_dir / ".terraform.lock.hcl").write_text("aws 5.1.0", encoding="utf-8")
+    assert cache.key(str(working_dir), "integ") != key
+
+
+def test_plan_cache_key_state_changed(working_dir: Path) -> None:
+    states = iter(["etag-1", "etag-2"])
+    cache = PlanCache(state_fingerprint=lambda _: next(states))
+
+    assert cache.key(str(working_dir)) != cache.key(str(working_dir))
+
+
+def test_plan_cache_key_not_cacheable(working_dir: Path, tmp_path: Path) -> None:
+    assert PlanCache(state_fingerprint=lambda _: None).key(str(working_dir)) is None
+    assert PlanCache(max_age_seconds=0).key(str(working_dir)) is None
+    assert (
+        PlanCache(state_fingerprint=lambda _: "etag").key(str(tmp_path / "missing"))
+        is None
+    )
+
+
+def test_plan_cache_expires() -> None:
+    clock = FakeClock()
+    cache = PlanCache(max_age_seconds=60, clock=clock)
+
+    assert not cache.is_unchanged("key")
+    cache.set_unchanged("key")
+    clock.now += 59
+    assert cache.is_unchanged("key")
+    clock.now += 1
+    assert not cache.is_unchanged("key")
+
+
+def test_plan_cache_persisted(tmp_path: Path) -> None:
+    disk_cache = DiskCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    PlanCache(disk_cache=disk_cache).set_unchanged("key")
+
+    assert PlanCache(disk_cache=disk_cache).is_unchanged("key")
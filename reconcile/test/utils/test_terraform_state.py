@@ -0,0 +1,94 @@
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import boto3
+import pytest
+from moto import mock_s3
+
+from reconcile.utils.terraform_state import (
+    read_config,
+    s3_backend,
+    s3_state_fingerprint,
+    s3_state_outputs,
+)
+
+BACKEND = {
+    "bucket": "state-bucket",
+    "key": "account.tfstate",
+    "region": "us-east-1",
+    "access_key": "access",
+    "secret_key": "secret",
+}
+CONFIG = {"terraform": {"backend": {"s3": BACKEND}}}
+
+
+@pytest.fixture
+def s3_client() -> Iterator[Any]:
+    with mock_s3():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="state-bucket")
+        yield client
+
+
+@pytest.fixture
+def working_dir(tmp_path: Path) -> Path:
+    (tmp_path / "config.tf.json").write_text(json.dumps(CONFIG), encoding="utf-8")
+    return tmp_path
+
+
+def test_read_config(working_dir: Path, tmp_path: Path) -> None:
+    assert read_config(str(working_dir)) == (json.dumps(CONFIG), CONFIG)
+    assert read_config(str(tmp_path / "missing")) is None
+
+
+def test_s3_backend() -> None:
+    assert s3_backend(CONFIG) == BACKEND
+    assert s3_backend({"terraform": {"backend": [{"s3": BACKEND}]}}) == BACKEND
+    assert s3_backend({"terraform": {"backend": {"local": {}}}}) is None
+    assert s3_backend({}) is None
+
+
+def test_s3_state_fingerprint(s3_client: Any) -> None:
+    assert s3_state_fingerprint(CONFIG) is None
+
+    s3_client.put_object(Bucket="state-bucket", Key="account.tfstate", Body=b"1")
+    first = s3_state_fingerprint(CONFIG)
+    s3_client.put_object(Bucket="state-bucket", Key="account.tfstate", Body=b"2")
+    second = s3_state_fingerprint(CONFIG)
+
+    assert first
+    assert second
+    assert first != second
+
+
+def test_s3_state_outputs(s3_client: Any, working_dir: Path) -> None:
+    state = {
+        "version": 4,
+        "serial": 3,
+        "outputs": {
+            "password": {"value": "secret", "type": "string", "sensitive": True},
+            "url": {"value": "https://example.com", "type": "string"},
+        },
+        "resources": [{"type": "aws_iam_user", "instances": [{}]}],
+    }
+    s3_client.put_object(
+        Bucket="state-bucket", Key="account.tfstate", Body=json.dumps(state)
+    )
+
+    assert s3_state_outputs(str(working_dir)) == {
+        "password": {"sensitive": True, "type": "string", "value": "secret"},
+        "url": {"sensitive": False, "type": "string", "value": "https://example.com"},
+    }
+
+
+def test_s3_state_outputs_no_state(s3_client: Any, working_dir: Path) -> None:
+    assert s3_state_outputs(str(working_dir)) == {}
+
+
+def test_s3_state_outputs_unreadable(working_dir: Path, tmp_path: Path) -> None:
+    with mock_s3():
+        # the bucket doesn't exist
+        assert s3_state_outputs(str(working_dir)) is None
+    assert s3_state_outputs(str(tmp_path / "missing")) is None
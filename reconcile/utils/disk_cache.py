@@ -0,0 +1,125 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any
+
+CACHE_FILE_SUFFIX = ".json"
+# rescan the cache directory at least this often to account for entries
+# written by other processes
+EVICT_INTERVAL_WRITES = 100
+# evict down to this share of the budget, so that the next writes don't
+# trigger another scan right away
+EVICT_TARGET_RATIO = 0.9
+
+
+def cache_key(*parts: Any) -> str:
+    """Build a stable content address out of json serializable parts."""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """
+    A size bounded key/value store of JSON documents on local disk.
+
+    Entries are written atomically (write to a temporary file and rename),
+    so multiple processes can share the same cache directory without
+    locking: readers either see a complete entry or no entry at all.
+    Eviction is least-recently-used based on the file modification time,
+    which is refreshed on every hit. Scanning the cache directory is
+    expensive, so writes only keep an estimate of the cache size and the
+    directory is scanned when the estimate exceeds the budget or every
+    EVICT_INTERVAL_WRITES writes.
+    """
+
+    def __init__(self, cache_dir: str, max_size_bytes: int) -> None:
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self._evict_lock = threading.Lock()
+        # None until the first scan of the cache directory
+        self._size_estimate: int | None = None
+        self._writes_since_evict = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        # spread entries over subdirectories to keep directory listings small
+        return os.path.join(self.cache_dir, key[:2], key + CACHE_FILE_SUFFIX)
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            # a corrupted entry is just a miss
+            logging.debug(f"ignoring unreadable cache entry {path}: {e}")
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        try:
+            data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            # caching is best effort, never fail the caller
+            logging.debug(f"unable to write cache entry {path}: {e}")
+            return
+        with self._evict_lock:
+            self._writes_since_evict += 1
+            if self._size_estimate is not None:
+                self._size_estimate += len(data)
+            evict = (
+                self._size_estimate is None
+                or self._size_estimate > self.max_size_bytes
+                or self._writes_since_evict >= EVICT_INTERVAL_WRITES
+            )
+        if evict:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits its budget."""
+        with self._evict_lock:
+            entries = []
+            total_size = 0
+            for root, _, files in os.walk(self.cache_dir):
+                for name in files:
+                    if not name.endswith(CACHE_FILE_SUFFIX):
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        # removed by a concurrent process
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+                    total_size += stat.st_size
+            self._writes_since_evict = 0
+            if total_size > self.max_size_bytes:
+                target_size = self.max_size_bytes * EVICT_TARGET_RATIO
+                entries.sort()
+                for _, size, path in entries:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(path)
+                    total_size -= size
+                    if total_size <= target_size:
+                        break
+            self._size_estimate = total_size
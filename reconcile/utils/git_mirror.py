@@ -0,0 +1,193 @@
+import atexit
+import fcntl
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import (
+    ExitStack,
+    contextmanager,
+)
+
+from reconcile.utils.disk_cache import cache_key
+from reconcile.utils.git import GitError
+
+# keep mirrors and checkouts across runs if set
+GIT_MIRROR_DIR = os.environ.get("GIT_MIRROR_DIR")
+GIT_MIRROR_MAX_CHECKOUTS = int(os.environ.get("GIT_MIRROR_MAX_CHECKOUTS") or 50)
+GIT_MIRROR_MAX_MIRRORS = int(os.environ.get("GIT_MIRROR_MAX_MIRRORS") or 20)
+
+COMMIT_SHA_EXP = re.compile(r"^[0-9a-f]{40}$")
+TMP_PREFIX = ".tmp-"
+
+
+class GitMirror:
+    """
+    A local store of bare repository mirrors, keyed by repository URL.
+
+    Refs are fetched incrementally into the mirror of their repository,
+    commits that are already present are not fetched again. Every commit
+    is checked out once and the checkout is shared by all callers using
+    that commit, so callers must treat it as read-only. Least recently used
+    checkouts and mirrors are removed once there are more than
+    `max_checkouts` and `max_mirrors` respectively, unless they are in use.
+
+    The store may be shared by several processes. File locks serialize the
+    fetches into a mirror (exclusive) and protect checkouts in use
+    (shared) from eviction.
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        max_checkouts: int = GIT_MIRROR_MAX_CHECKOUTS,
+        max_mirrors: int = GIT_MIRROR_MAX_MIRRORS,
+    ) -> None:
+        self.mirrors_dir = os.path.join(base_dir, "mirrors")
+        self.checkouts_dir = os.path.join(base_dir, "checkouts")
+        # lock files are kept, removing them would race with their users
+        self.locks_dir = os.path.join(base_dir, "locks")
+        self.max_checkouts = max_checkouts
+        self.max_mirrors = max_mirrors
+        os.makedirs(self.mirrors_dir, exist_ok=True)
+        os.makedirs(self.checkouts_dir, exist_ok=True)
+        os.makedirs(self.locks_dir, exist_ok=True)
+
+    @staticmethod
+    def _git(
+        args: list[str], git_dir: str, verify: bool = True, env: dict | None = None
+    ) -> str:
+        cmd = ["git"]
+        if not verify:
+            cmd += ["-c", "http.sslVerify=false"]
+        cmd += ["--git-dir", git_dir, *args]
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, check=False, env=env
+        )
+        if result.returncode != 0:
+            raise GitError(f"git {args[0]} failed: {result.stderr}")
+        return result.stdout.strip()
+
+    @contextmanager
+    def _file_lock(
+        self, name: str, operation: int, blocking: bool = True
+    ) -> Iterator[bool]:
+        """
+        Holds a flock on the lock file of a mirror or checkout. Yields
+        False if the lock is taken and `blocking` is False.
+        """
+        path = os.path.join(self.locks_dir, f"{name}.lock")
+        with open(path, "a", encoding="utf-8") as f:
+            try:
+                fcntl.flock(f, operation if blocking else operation | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            yield True
+
+    def _mirror(self, repo_key: str) -> str:
+        git_dir = os.path.join(self.mirrors_dir, f"{repo_key}.git")
+        if os.path.isdir(git_dir):
+            os.utime(git_dir)
+        else:
+            # the url is not stored in the mirror, it may contain credentials
+            result = subprocess.run(
+                ["git", "init", "--bare", "--quiet", git_dir],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            if result.returncode != 0:
+                raise GitError(f"git init failed: {result.stderr}")
+        return git_dir
+
+    def _resolve(self, url: str, ref: str, git_dir: str, verify: bool) -> str:
+        if COMMIT_SHA_EXP.match(ref):
+            try:
+                self._git(["cat-file", "-e", f"{ref}^{{commit}}"], git_dir)
+                return ref
+            except GitError:
+                pass
+        self._git(["fetch", "--quiet", "--depth", "1", url, ref], git_dir, verify)
+        return self._git(["rev-parse", "FETCH_HEAD^{commit}"], git_dir)
+
+    def _checkout(self, git_dir: str, commit: str, path: str) -> None:
+        if os.path.isdir(path):
+            os.utime(path)
+            return
+        tmp_dir = tempfile.mkdtemp(dir=self.checkouts_dir, prefix=TMP_PREFIX)
+        try:
+            work_tree = os.path.join(tmp_dir, "tree")
+            os.mkdir(work_tree)
+            # a private index keeps the mirror untouched
+            env = {**os.environ, "GIT_INDEX_FILE": os.path.join(tmp_dir, "index")}
+            self._git(
+                ["--work-tree", work_tree, "checkout", commit, "--", "."],
+                git_dir,
+                env=env,
+            )
+            os.rename(work_tree, path)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _evict_lru(self, directory: str, max_entries: int) -> None:
+        entries = []
+        for name in os.listdir(directory):
+            if name.startswith(TMP_PREFIX):
+                continue
+            try:
+                entries.append((os.path.getmtime(os.path.join(directory, name)), name))
+            except FileNotFoundError:
+                # evicted by another process
+                continue
+        entries.sort()
+        for _, name in entries[: max(len(entries) - max_entries, 0)]:
+            with self._file_lock(name, fcntl.LOCK_EX, blocking=False) as locked:
+                if locked:
+                    shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+    def _evict(self) -> None:
+        self._evict_lru(self.checkouts_dir, self.max_checkouts)
+        self._evict_lru(self.mirrors_dir, self.max_mirrors)
+
+    @contextmanager
+    def checkout(self, url: str, ref: str, verify: bool = True) -> Iterator[str]:
+        """
+        Yields the path of a read-only checkout of `ref` in the repository
+        at `url`.
+        """
+        repo_key = cache_key(url)
+        mirror_name = f"{repo_key}.git"
+        try:
+            with ExitStack() as stack:
+                with self._file_lock(mirror_name, fcntl.LOCK_EX):
+                    git_dir = self._mirror(repo_key)
+                    commit = self._resolve(url, ref, git_dir, verify)
+                    checkout_name = f"{repo_key}-{commit}"
+                    # held until the caller is done with the checkout
+                    stack.enter_context(self._file_lock(checkout_name, fcntl.LOCK_SH))
+                    path = os.path.join(self.checkouts_dir, checkout_name)
+                    self._checkout(git_dir, commit, path)
+                yield path
+        finally:
+            self._evict()
+
+
+_git_mirror: GitMirror | None = None
+_git_mirror_lock = threading.Lock()
+
+
+def get_git_mirror() -> GitMirror:
+    """Return the process wide git mirror store."""
+    global _git_mirror  # noqa: PLW0603
+    with _git_mirror_lock:
+        if _git_mirror is None:
+            base_dir = GIT_MIRROR_DIR
+            if not base_dir:
+                base_dir = tempfile.mkdtemp(prefix="git-mirror-")
+                atexit.register(shutil.rmtree, base_dir, ignore_errors=True)
+            _git_mirror = GitMirror(base_dir)
+        return _git_mirror
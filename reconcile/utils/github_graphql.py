@@ -0,0 +1,320 @@
+import logging
+import os
+import time
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterator,
+    Mapping,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Any
+
+import requests
+
+GH_BASE_URL = os.environ.get("GITHUB_API", "https://api.github.com")
+
+
+def graphql_url(base_url: str) -> str:
+    """
+    Return the GraphQL endpoint of a GitHub REST API base url.
+
+    GitHub Enterprise serves the REST API on /api/v3 and GraphQL on
+    /api/graphql, github.com serves both on api.github.com.
+    """
+    base_url = base_url.rstrip("/")
+    if base_url.endswith("/api/v3"):
+        return base_url.removesuffix("/v3") + "/graphql"
+    return base_url + "/graphql"
+
+
+ORG_MEMBERS_QUERY = """
+query OrgMembers($org: String!, $cursor: String) {
+  organization(login: $org) {
+    membersWithRole(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { login }
+    }
+  }
+}
+"""
+
+ORG_PENDING_MEMBERS_QUERY = """
+query OrgPendingMembers($org: String!, $cursor: String) {
+  organization(login: $org) {
+    pendingMembers(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { login }
+    }
+  }
+}
+"""
+
+ORG_TEAMS_QUERY = """
+query OrgTeams($org: String!, $cursor: String) {
+  organization(login: $org) {
+    teams(first: 25, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        slug
+        members(first: 100) {
+          pageInfo { hasNextPage endCursor }
+          nodes { login }
+        }
+        invitations(first: 100) {
+          pageInfo { hasNextPage endCursor }
+          nodes { invitee { login } }
+        }
+      }
+    }
+  }
+}
+"""
+
+TEAM_MEMBERS_QUERY = """
+query TeamMembers($org: String!, $slug: String!, $cursor: String) {
+  organization(login: $org) {
+    team(slug: $slug) {
+      members(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { login }
+      }
+    }
+  }
+}
+"""
+
+TEAM_INVITATIONS_QUERY = """
+query TeamInvitations($org: String!, $slug: String!, $cursor: String) {
+  organization(login: $org) {
+    team(slug: $slug) {
+      invitations(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { invitee { login } }
+      }
+    }
+  }
+}
+"""
+
+
+class GithubGraphQLError(Exception):
+    pass
+
+
+@dataclass
+class OrgMembership:
+    """
+    Logins of the members of an org and of its teams, pending invitations
+    included. `members` is None if the org members were not requested.
+    """
+
+    members: list[str] | None = None
+    teams: dict[str, list[str]] = field(default_factory=dict)
+
+
+class GithubGraphQLApi:
+    """
+    GitHub GraphQL v4 client to read the membership of orgs and teams in a
+    few paginated queries instead of a REST call chain per team.
+
+    The client keeps an eye on the rate limit headers of every response.
+    Once the remaining points drop below RATE_LIMIT_RESERVE, requests are
+    spread evenly until the limit resets. Rate limited requests (primary or
+    secondary limit) and server errors are retried with a backoff that
+    honours Retry-After and X-RateLimit-Reset.
+    """
+
+    MAX_ATTEMPTS = 6
+    BACKOFF_SECONDS = 2.0
+    MAX_BACKOFF_SECONDS = 300.0
+    RATE_LIMIT_RESERVE = 200
+
+    def __init__(
+        self,
+        token: str,
+        url: str | None = None,
+        timeout: int = 60,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.url = url or graphql_url(GH_BASE_URL)
+        self._session = requests.Session()
+        self._session.headers["Authorization"] = f"bearer {token}"
+        self._timeout = timeout
+        self._sleep = sleep
+        self._clock = clock
+
+    def _reset_delay(self, headers: Mapping[str, str]) -> float:
+        if reset := headers.get("X-RateLimit-Reset"):
+            return max(float(reset) - self._clock(), 0.0) + 1
+        return 0.0
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        if retry_after := response.headers.get("Retry-After"):
+            delay = float(retry_after)
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            delay = self._reset_delay(response.headers)
+        else:
+            delay = self._backoff_delay(attempt)
+        return min(delay, self.MAX_BACKOFF_SECONDS)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return min(self.BACKOFF_SECONDS * 2**attempt, self.MAX_BACKOFF_SECONDS)
+
+    def _throttle(self, headers: Mapping[str, str]) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None or int(remaining) > self.RATE_LIMIT_RESERVE:
+            return
+        delay = self._reset_delay(headers) / max(int(remaining), 1)
+        if delay > 0:
+            logging.debug(
+                f"github rate limit almost exhausted ({remaining} left), "
+                f"waiting {delay:.1f}s"
+            )
+            self._sleep(min(delay, self.MAX_BACKOFF_SECONDS))
+
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        if response.status_code == 429:
+            return True
+        if response.status_code == 403:
+            # secondary rate limits don't necessarily come with headers
+            return (
+                "Retry-After" in response.headers
+                or response.headers.get("X-RateLimit-Remaining") == "0"
+                or "rate limit" in response.text.lower()
+            )
+        if response.status_code != 200:
+            return False
+        errors = response.json().get("errors") or []
+        return any(e.get("type") == "RATE_LIMITED" for e in errors)
+
+    def query(self, query: str, variables: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Run a GraphQL query and return its data.
+
+        :raises GithubGraphQLError: if the query returns errors
+        :raises HTTPError: if the request still fails after all retries
+        :raises RequestException: if the connection still fails after all retries
+        """
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                response = self._session.post(
+                    self.url,
+                    json={"query": query, "variables": variables},
+                    timeout=self._timeout,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.MAX_ATTEMPTS - 1:
+                    raise
+                delay = self._backoff_delay(attempt)
+                logging.warning(
+                    f"github graphql request failed with {e!r}, "
+                    f"retrying in {delay:.1f}s"
+                )
+                self._sleep(delay)
+                continue
+            retryable = self._is_rate_limited(response) or response.status_code >= 500
+            if not retryable or attempt == self.MAX_ATTEMPTS - 1:
+                break
+            delay = self._retry_delay(response, attempt)
+            logging.warning(
+                f"github graphql request failed with {response.status_code}, "
+                f"retrying in {delay:.1f}s"
+            )
+            self._sleep(delay)
+
+        response.raise_for_status()
+        self._throttle(response.headers)
+        body = response.json()
+        if errors := body.get("errors"):
+            raise GithubGraphQLError(errors)
+        return body["data"]
+
+    def _paginate(
+        self,
+        query: str,
+        variables: Mapping[str, Any],
+        path: Collection[str],
+        first_page: Mapping[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield the nodes of the connection found at `path` in the query result.
+        The query must accept a `cursor` variable. If the first page has
+        already been fetched as part of another query, pass it as `first_page`.
+        """
+        connection: Any = first_page
+        cursor = None
+        while True:
+            if connection is None:
+                connection = self.query(query, {**variables, "cursor": cursor})
+                for key in path:
+                    connection = connection[key]
+            yield from connection["nodes"]
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return
+            cursor = page_info["endCursor"]
+            connection = None
+
+    def _team_members(self, org_name: str, team: Mapping[str, Any]) -> list[str]:
+        variables = {"org": org_name, "slug": team["slug"]}
+        members = [
+            node["login"]
+            for node in self._paginate(
+                TEAM_MEMBERS_QUERY,
+                variables,
+                ("organization", "team", "members"),
+                first_page=team["members"],
+            )
+        ]
+        members.extend(
+            node["invitee"]["login"]
+            for node in self._paginate(
+                TEAM_INVITATIONS_QUERY,
+                variables,
+                ("organization", "team", "invitations"),
+                first_page=team["invitations"],
+            )
+            # invitations by email have no invitee yet
+            if node["invitee"]
+        )
+        return members
+
+    def org_membership(
+        self,
+        org_name: str,
+        teams: Collection[str] | None = None,
+        members: bool = True,
+    ) -> OrgMembership:
+        """
+        Fetch the members of an org and its teams, including pending
+        invitations.
+
+        :param org_name: The login of the org
+        :param teams: Names of the teams to fetch, all teams if None
+        :param members: Whether to fetch the members of the org itself
+        """
+        variables = {"org": org_name}
+        membership = OrgMembership()
+        if members:
+            membership.members = [
+                node["login"]
+                for q, connection in (
+                    (ORG_MEMBERS_QUERY, "membersWithRole"),
+                    (ORG_PENDING_MEMBERS_QUERY, "pendingMembers"),
+                )
+                for node in self._paginate(q, variables, ("organization", connection))
+            ]
+        for team in self._paginate(
+            ORG_TEAMS_QUERY, variables, ("organization", "teams")
+        ):
+            if teams is not None and team["name"] not in teams:
+                continue
+            membership.teams[team["name"]] = self._team_members(org_name, team)
+        return membership
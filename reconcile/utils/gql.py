@@ -1,7 +1,13 @@
 import contextlib
 import logging
+import os
 import textwrap
 import threading
+from collections.abc import (
+    Callable,
+    Sequence,
+)
+from copy import copy
 from datetime import (
     UTC,
     datetime,
@@ -17,6 +23,20 @@ from gql import (
 from gql.transport.exceptions import TransportQueryError
 from gql.transport.requests import RequestsHTTPTransport
 from gql.transport.requests import log as requests_logger
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    VariableNode,
+    Visitor,
+    parse,
+    print_ast,
+    visit,
+)
 from requests.auth import AuthBase
 from requests.cookies import RequestsCookieJar
 from sentry_sdk import capture_exception
@@ -24,6 +44,10 @@ from sretoolbox.utils import retry
 
 from reconcile.status import RunningState
 from reconcile.utils.config import get_config
+from reconcile.utils.disk_cache import (
+    DiskCache,
+    cache_key,
+)
 
 INTEGRATIONS_QUERY = """
 {
@@ -37,6 +61,21 @@ INTEGRATIONS_QUERY = """
 
 requests_logger.setLevel(logging.WARNING)
 
+GQL_RESPONSE_CACHE_DIR = os.environ.get("GQL_RESPONSE_CACHE_DIR")
+GQL_RESPONSE_CACHE_MAX_SIZE_MB = int(
+    os.environ.get("GQL_RESPONSE_CACHE_MAX_SIZE_MB") or 512
+)
+
+
+def init_response_cache() -> DiskCache | None:
+    """Return the on-disk response cache if GQL_RESPONSE_CACHE_DIR is set."""
+    if not GQL_RESPONSE_CACHE_DIR:
+        return None
+    return DiskCache(
+        GQL_RESPONSE_CACHE_DIR,
+        max_size_bytes=GQL_RESPONSE_CACHE_MAX_SIZE_MB * 1024 * 1024,
+    )
+
 
 def capture_and_forget(error):
     """fire-and-forget an exception to sentry
@@ -80,6 +119,121 @@ class GqlGetResourceError(Exception):
         super().__init__(f"Error getting resource from path {path}: {msg!s}")
 
 
+class GqlBatchError(Exception):
+    """The queries of a batch can't be merged into a single request."""
+
+
+class _RecordedQuery(Exception):
+    def __init__(
+        self, query: str, variables: dict[str, Any] | None, skip_validation: bool
+    ):
+        super().__init__()
+        self.query = query
+        self.variables = variables
+        self.skip_validation = skip_validation
+
+
+def _record_query(query: str, variables=None, skip_validation=False) -> None:
+    """A query_func that captures the query of a generated query function."""
+    raise _RecordedQuery(query, variables, skip_validation)
+
+
+class _VariableRenamer(Visitor):
+    def __init__(self, prefix: str) -> None:
+        super().__init__()
+        self.prefix = prefix
+
+    def enter_variable(self, node: VariableNode, *_: Any) -> VariableNode:
+        return VariableNode(name=NameNode(value=self.prefix + node.name.value))
+
+
+class _VariableFinder(Visitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.found = False
+
+    def enter_variable(self, *_: Any) -> None:
+        self.found = True
+
+
+def _batch_prefix(index: int) -> str:
+    return f"q{index}_"
+
+
+def merge_queries(
+    queries: Sequence[tuple[str, dict[str, Any] | None]],
+) -> tuple[str, dict[str, Any]]:
+    """
+    Merge several GraphQL query documents into a single aliased document.
+
+    The top level fields and the variables of the n-th query are prefixed
+    with `q<n>_`, fragments are shared between all queries. Use
+    `split_batch_result` to get the per query data back.
+    """
+    selections: list[FieldNode] = []
+    variable_definitions = []
+    variables: dict[str, Any] = {}
+    fragments: dict[str, FragmentDefinitionNode] = {}
+    for index, (query, query_variables) in enumerate(queries):
+        prefix = _batch_prefix(index)
+        operations = []
+        for definition in parse(query).definitions:
+            if isinstance(definition, FragmentDefinitionNode):
+                finder = _VariableFinder()
+                visit(definition, finder)
+                if finder.found:
+                    raise GqlBatchError(
+                        f"fragment {definition.name.value} uses variables"
+                    )
+                known = fragments.get(definition.name.value)
+                if known and print_ast(known) != print_ast(definition):
+                    raise GqlBatchError(
+                        f"conflicting definitions of fragment {definition.name.value}"
+                    )
+                fragments[definition.name.value] = definition
+            elif isinstance(definition, OperationDefinitionNode):
+                operations.append(definition)
+            else:
+                raise GqlBatchError(f"unsupported definition {definition.kind}")
+        if len(operations) != 1 or operations[0].operation != OperationType.QUERY:
+            raise GqlBatchError("each query must contain exactly one query operation")
+        operation = visit(operations[0], _VariableRenamer(prefix))
+        variable_definitions.extend(operation.variable_definitions or [])
+        for selection in operation.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                raise GqlBatchError("only fields are supported at the top level")
+            field = copy(selection)
+            field.alias = NameNode(
+                value=prefix + (selection.alias or selection.name).value
+            )
+            selections.append(field)
+        for name, value in (query_variables or {}).items():
+            variables[prefix + name] = value
+
+    document = DocumentNode(
+        definitions=(
+            OperationDefinitionNode(
+                operation=OperationType.QUERY,
+                name=NameNode(value="Batch"),
+                variable_definitions=tuple(variable_definitions),
+                directives=(),
+                selection_set=SelectionSetNode(selections=tuple(selections)),
+            ),
+            *fragments.values(),
+        )
+    )
+    return print_ast(document), variables
+
+
+def split_batch_result(data: dict[str, Any], count: int) -> list[dict[str, Any]]:
+    """Split the data of a merged query back into the data of each query."""
+    results: list[dict[str, Any]] = [{} for _ in range(count)]
+    for key, value in data.items():
+        index, _, name = key.partition("_")
+        results[int(index.removeprefix("q"))][name] = value
+    return results
+
+
 class GqlApi:
     _valid_schemas: list[str] = []
     _queried_schemas: set[Any] = set()
@@ -92,6 +246,7 @@ class GqlApi:
         validate_schemas=False,
         commit: str | None = None,
         commit_timestamp: str | None = None,
+        response_cache: DiskCache | None = None,
     ) -> None:
         self.url = url
         self.token = token
@@ -99,6 +254,10 @@ class GqlApi:
         self.validate_schemas = validate_schemas
         self.commit = commit
         self.commit_timestamp = commit_timestamp
+        # responses are only cacheable if they belong to an immutable bundle
+        self.response_cache = (
+            (response_cache or init_response_cache()) if commit else None
+        )
         self.client = self._init_gql_client()
 
         if validate_schemas and not int_name:
@@ -132,10 +291,7 @@ class GqlApi:
         if self.client.transport.session:
             self.client.transport.session.close()
 
-    @retry(exceptions=GqlApiError, max_attempts=5, hook=capture_and_forget)
-    def query(
-        self, query: str, variables=None, skip_validation=False
-    ) -> dict[str, Any] | None:
+    def _execute(self, query: str, variables=None) -> dict[str, Any]:
         try:
             result = self.client.execute(
                 gql(query), variables, get_execution_result=True
@@ -150,6 +306,32 @@ class GqlApi:
             ) from None
         except Exception as e:
             raise GqlApiError("Unexpected error occurred") from e
+        return result
+
+    def _cached_execute(self, query: str, variables=None) -> dict[str, Any]:
+        """
+        Execute a query, serving it from the response cache if possible.
+
+        The cache key contains the bundle commit, so cached responses never
+        become stale. The whole formatted response is cached (not only
+        `data`) so schema validation works the same for cache hits.
+        """
+        if not self.response_cache:
+            return self._execute(query, variables)
+        key = cache_key(self.url, self.commit, query, variables)
+        result = self.response_cache.get(key)
+        if result is not None:
+            return result
+        result = self._execute(query, variables)
+        if result.get("data") is not None:
+            self.response_cache.set(key, result)
+        return result
+
+    @retry(exceptions=GqlApiError, max_attempts=5, hook=capture_and_forget)
+    def query(
+        self, query: str, variables=None, skip_validation=False
+    ) -> dict[str, Any] | None:
+        result = self._cached_execute(query, variables)
 
         # show schemas if log level is debug
         query_schemas = result.get("extensions", {}).get("schemas", [])
@@ -172,6 +354,42 @@ class GqlApi:
 
         return result["data"]
 
+    def query_batch(self, query_funcs: Sequence[Callable[..., Any]]) -> list[Any]:
+        """
+        Run several generated query functions with a single request.
+
+        Each item is a generated `query` function from
+        reconcile.gql_definitions (use functools.partial to pass variables)
+        which is called with the `query_func` keyword argument. The parsed
+        `*QueryData` objects are returned in the same order. If the queries
+        can't be merged, they are executed one after another.
+        """
+        recorded: list[_RecordedQuery] = []
+        for query_func in query_funcs:
+            try:
+                query_func(query_func=_record_query)
+            except _RecordedQuery as r:
+                recorded.append(r)
+            else:
+                raise GqlBatchError(f"{query_func} did not run a query")
+
+        try:
+            query, variables = merge_queries([(r.query, r.variables) for r in recorded])
+        except GqlBatchError as e:
+            logging.debug(f"unable to batch queries, running them one by one: {e}")
+            return [query_func(query_func=self.query) for query_func in query_funcs]
+
+        data = self.query(
+            query,
+            variables,
+            skip_validation=all(r.skip_validation for r in recorded),
+        )
+        results = split_batch_result(data or {}, len(recorded))
+        return [
+            query_func(query_func=lambda *_, result=result, **__: result)
+            for query_func, result in zip(query_funcs, results, strict=True)
+        ]
+
     def get_template(self, path: str) -> dict[str, str]:
         query = """
         query Template($path: String) {
@@ -300,6 +518,10 @@ def get_resource(path: str) -> dict[str, Any]:
     return get_api().get_resource(path)
 
 
+def query_batch(query_funcs: Sequence[Callable[..., Any]]) -> list[Any]:
+    return get_api().query_batch(query_funcs)
+
+
 class PersistentRequestsHTTPTransport(RequestsHTTPTransport):
     """A transport for the GQL Client that uses an existing.
     Is a reduced version of the RequestsHTTPTransport class from gql library
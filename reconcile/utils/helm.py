@@ -1,5 +1,6 @@
 import json
 import os
+import shutil
 import tempfile
 from collections.abc import Iterable, Mapping
 from subprocess import (
@@ -10,7 +11,7 @@ from typing import Any
 
 import yaml
 
-from reconcile.utils import git
+from reconcile.utils.git_mirror import get_git_mirror
 from reconcile.utils.runtime.sharding import ShardSpec
 
 
@@ -25,6 +26,12 @@ class JSONEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+def chart_dependencies(path: str) -> list[dict[str, Any]]:
+    with open(os.path.join(path, "Chart.yaml"), encoding="locale") as chart_file:
+        chart = yaml.safe_load(chart_file)
+    return chart.get("dependencies") or []
+
+
 def do_template(
     values: Mapping[str, Any],
     path: str,
@@ -37,36 +44,32 @@ def do_template(
             ) as repository_config_file,
             tempfile.TemporaryDirectory() as repository_cache_dir,
         ):
-            with open(
-                os.path.join(path, "Chart.yaml"), encoding="locale"
-            ) as chart_file:
-                chart = yaml.safe_load(chart_file)
-                if dependencies := chart.get("dependencies"):
-                    for dep in dependencies:
-                        if repo := dep.get("repository"):
-                            cmd = [
-                                "helm",
-                                "repo",
-                                "add",
-                                dep["name"],
-                                repo,
-                                "--repository-config",
-                                repository_config_file.name,
-                                "--repository-cache",
-                                repository_cache_dir,
-                            ]
-                            run(cmd, capture_output=True, check=True)
-                    cmd = [
-                        "helm",
-                        "dependency",
-                        "build",
-                        path,
-                        "--repository-config",
-                        repository_config_file.name,
-                        "--repository-cache",
-                        repository_cache_dir,
-                    ]
-                    run(cmd, capture_output=True, check=True)
+            if dependencies := chart_dependencies(path):
+                for dep in dependencies:
+                    if repo := dep.get("repository"):
+                        cmd = [
+                            "helm",
+                            "repo",
+                            "add",
+                            dep["name"],
+                            repo,
+                            "--repository-config",
+                            repository_config_file.name,
+                            "--repository-cache",
+                            repository_cache_dir,
+                        ]
+                        run(cmd, capture_output=True, check=True)
+                cmd = [
+                    "helm",
+                    "dependency",
+                    "build",
+                    path,
+                    "--repository-config",
+                    repository_config_file.name,
+                    "--repository-cache",
+                    repository_cache_dir,
+                ]
+                run(cmd, capture_output=True, check=True)
             with tempfile.NamedTemporaryFile(
                 mode="w+", encoding="locale"
             ) as values_file:
@@ -113,9 +116,18 @@ def template_all(
     values: Mapping[str, Any],
     ssl_verify: bool = True,
 ) -> Iterable[Mapping[str, Any]]:
-    with tempfile.TemporaryDirectory() as wd:
-        git.clone(url, wd, depth=1, verify=ssl_verify)
-        git.checkout(ref, wd, verify=ssl_verify)
+    with get_git_mirror().checkout(url, ref, verify=ssl_verify) as checkout:
+        chart_path = f"{checkout}{path}"
+        if os.path.isfile(os.path.join(chart_path, "Chart.yaml")) and (
+            chart_dependencies(chart_path)
+        ):
+            # building dependencies writes to the chart directory, which must
+            # not happen in the shared checkout
+            with tempfile.TemporaryDirectory() as wd:
+                shutil.copytree(checkout, wd, symlinks=True, dirs_exist_ok=True)
+                return yaml.safe_load_all(
+                    do_template(values=values, path=f"{wd}{path}", namespace=namespace)
+                )
         return yaml.safe_load_all(
-            do_template(values=values, path=f"{wd}{path}", namespace=namespace)
+            do_template(values=values, path=chart_path, namespace=namespace)
         )
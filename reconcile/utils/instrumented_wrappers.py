@@ -30,7 +30,7 @@ class InstrumentedImage(Image):
             shard_id=SHARD_ID,
             registry=self.registry,
         ).inc()
-        super()._get_manifest()
+        return super()._get_manifest()
 
 
 class InstrumentedSkopeo(Skopeo):
@@ -1,7 +1,18 @@
 import logging
+import threading
 import time
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Protocol, TextIO
+from typing import (
+    Any,
+    Protocol,
+    TextIO,
+    runtime_checkable,
+)
 
 from kubernetes.client import (  # type: ignore[attr-defined]
     ApiClient,
@@ -19,7 +30,11 @@ from reconcile.utils.jobcontroller.models import (
     JobValidationError,
     K8sJob,
 )
-from reconcile.utils.oc import OCCli
+from reconcile.utils.jobcontroller.watch import JobWatch
+from reconcile.utils.oc import (
+    OCCli,
+    OCNative,
+)
 from reconcile.utils.oc_map import init_oc_map_from_clusters
 from reconcile.utils.openshift_resource import OpenshiftResource
 from reconcile.utils.secret_reader import SecretReaderBase
@@ -68,6 +83,41 @@ class TimeProtocol(Protocol):
     def sleep(self, seconds: float) -> None: ...
 
 
+@runtime_checkable
+class WaitingTimeProtocol(TimeProtocol, Protocol):
+    """
+    A time module that can also wait on a condition, the timeout is
+    measured with its own clock. Required to watch jobs, otherwise jobs
+    are polled with sleep().
+    """
+
+    def wait_for(
+        self,
+        condition: threading.Condition,
+        predicate: Callable[[], bool],
+        timeout: float,
+    ) -> bool: ...
+
+
+class SystemTime:
+    def time(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def wait_for(
+        self,
+        condition: threading.Condition,
+        predicate: Callable[[], bool],
+        timeout: float,
+    ) -> bool:
+        return condition.wait_for(predicate, timeout)
+
+
+SYSTEM_TIME = SystemTime()
+
+
 class K8sJobController:
     def __init__(
         self,
@@ -77,7 +127,7 @@ class K8sJobController:
         integration: str,
         integration_version: str,
         dry_run: bool = False,
-        time_module: TimeProtocol = time,
+        time_module: TimeProtocol = SYSTEM_TIME,
     ) -> None:
         self.cluster = cluster
         self.namespace = namespace
@@ -87,6 +137,16 @@ class K8sJobController:
         self.dry_run = dry_run
         self.time_module = time_module
         self._cache: dict[str, OpenshiftResource] | None = None
+        self._job_watch: JobWatch | None = None
+        if isinstance(oc, OCNative) and isinstance(time_module, WaitingTimeProtocol):
+            # the native client can watch the jobs we wait for
+            native_oc = oc
+            self._job_watch = JobWatch(
+                stream=lambda: native_oc.watch_items("Job", namespace=namespace),
+                sync=self.update_cache,
+                on_event=self._apply_job_event,
+                wait_for=time_module.wait_for,
+            )
 
     @property
     def cache(self) -> dict[str, OpenshiftResource]:
@@ -112,6 +172,59 @@ class K8sJobController:
         self._cache = new_cache
         return self._cache
 
+    def _apply_job_event(self, event_type: str, item: dict[str, Any]) -> None:
+        if self._cache is None:
+            return
+        name = item["metadata"]["name"]
+        if event_type == "DELETED":
+            self._cache.pop(name, None)
+        elif event_type in {"ADDED", "MODIFIED"}:
+            self._cache[name] = OpenshiftResource(
+                body=item,
+                integration=self.integration,
+                integration_version=self.integration_version,
+            )
+
+    @contextmanager
+    def _job_events(self) -> Iterator[JobWatch | None]:
+        """
+        Joins the shared job watch. Yields None if jobs can't be watched,
+        then the waiters poll.
+        """
+        if self._job_watch is None:
+            yield None
+            return
+        with self._job_watch as job_watch:
+            yield job_watch
+
+    def _wait_for_job_changes(
+        self,
+        job_watch: JobWatch | None,
+        generation: int,
+        elapsed_time: float,
+        timeout_seconds: float,
+        check_interval_seconds: float,
+    ) -> None:
+        if job_watch is None or job_watch.failed:
+            self._sleep_until_timeout(
+                elapsed_time, timeout_seconds, check_interval_seconds
+            )
+            return
+        job_watch.wait(
+            generation,
+            self._wait_interval(elapsed_time, timeout_seconds, check_interval_seconds),
+        )
+
+    def _refresh(self, job_watch: JobWatch | None) -> int:
+        """
+        Makes the cache current before the job statuses are evaluated.
+        Returns the watch generation the cache reflects.
+        """
+        if job_watch is None or job_watch.failed:
+            self.update_cache()
+            return 0
+        return job_watch.current_generation()
+
     def get_job_generation(self, job_name: str) -> str | None:
         """
         Returns the generation annotation for a job.
@@ -176,6 +289,9 @@ class K8sJobController:
         The check_interval_seconds parameter is the time to wait between checks for job completion.
         The timeout_seconds parameter is the maximum time to wait for all jobs to complete. If set to -1,
         the function will wait indefinitely.  If a timeout occures, a TimeoutError will be raised.
+
+        With the native client, the jobs are watched instead: the statuses are rechecked as soon
+        as a job changes and check_interval_seconds only bounds the time between checks.
         """
         jobs_left = job_names.copy()
         job_statuses: dict[str, JobStatus] = dict.fromkeys(
@@ -183,26 +299,31 @@ class K8sJobController:
         )
 
         start_time = self.time_module.time()
-        while jobs_left:
-            self.update_cache()
-            for job_name in list(jobs_left):
-                status = self.get_job_status(job_name)
-                job_statuses[job_name] = status
-                if status in {JobStatus.SUCCESS, JobStatus.ERROR}:
-                    jobs_left.remove(job_name)
-            if jobs_left:
-                elapsed_time = self.time_module.time() - start_time
-                if timeout_seconds >= 0 and elapsed_time >= timeout_seconds:
-                    logging.warning(
-                        f"Timeout waiting for jobs to complete: {jobs_left}"
+        with self._job_events() as job_watch:
+            while jobs_left:
+                generation = self._refresh(job_watch)
+                for job_name in list(jobs_left):
+                    status = self.get_job_status(job_name)
+                    job_statuses[job_name] = status
+                    if status in {JobStatus.SUCCESS, JobStatus.ERROR}:
+                        jobs_left.remove(job_name)
+                if jobs_left:
+                    elapsed_time = self.time_module.time() - start_time
+                    if timeout_seconds >= 0 and elapsed_time >= timeout_seconds:
+                        logging.warning(
+                            f"Timeout waiting for jobs to complete: {jobs_left}"
+                        )
+                        break
+                    logging.info(
+                        f"Waiting for {jobs_left} to complete. Rechecking in {check_interval_seconds} seconds"
+                    )
+                    self._wait_for_job_changes(
+                        job_watch,
+                        generation,
+                        elapsed_time,
+                        timeout_seconds,
+                        check_interval_seconds,
                     )
-                    break
-                logging.info(
-                    f"Waiting for {jobs_left} to complete. Rechecking in {check_interval_seconds} seconds"
-                )
-                self._sleep_until_timeout(
-                    elapsed_time, timeout_seconds, check_interval_seconds
-                )
         return job_statuses
 
     def enqueue_job_and_wait_for_completion(
@@ -360,22 +481,41 @@ class K8sJobController:
         The check_interval_seconds parameter is the time to wait between checks for job completion.
         The timeout_seconds parameter is the maximum time to wait for all jobs to complete. If set to -1,
         the function will wait indefinitely. If a timeout occures, a TimeoutError will be raised.
+
+        With the native client, the job is watched, see wait_for_job_list_completion.
         """
         start_time = self.time_module.time()
-        while True:
-            self.update_cache()
-            status = self.get_job_status(job_name)
-            match status:
-                case JobStatus.SUCCESS:
-                    return True
-                case JobStatus.ERROR:
-                    return False
-            elapsed_time = self.time_module.time() - start_time
-            if timeout_seconds >= 0 and elapsed_time >= timeout_seconds:
-                raise TimeoutError(f"Timeout waiting for job {job_name} to complete")
-            self._sleep_until_timeout(
-                elapsed_time, timeout_seconds, check_interval_seconds
-            )
+        with self._job_events() as job_watch:
+            while True:
+                generation = self._refresh(job_watch)
+                status = self.get_job_status(job_name)
+                match status:
+                    case JobStatus.SUCCESS:
+                        return True
+                    case JobStatus.ERROR:
+                        return False
+                elapsed_time = self.time_module.time() - start_time
+                if timeout_seconds >= 0 and elapsed_time >= timeout_seconds:
+                    raise TimeoutError(
+                        f"Timeout waiting for job {job_name} to complete"
+                    )
+                self._wait_for_job_changes(
+                    job_watch,
+                    generation,
+                    elapsed_time,
+                    timeout_seconds,
+                    check_interval_seconds,
+                )
+
+    @staticmethod
+    def _wait_interval(
+        elapsed_time: float,
+        timeout_seconds: float,
+        default_sleep_interval_seconds: float,
+    ) -> float:
+        if timeout_seconds >= 0:
+            return min(default_sleep_interval_seconds, timeout_seconds - elapsed_time)
+        return default_sleep_interval_seconds
 
     def _sleep_until_timeout(
         self,
@@ -383,11 +523,9 @@ class K8sJobController:
         timeout_seconds: float,
         default_sleep_interval_seconds: float,
     ) -> None:
-        sleep_interval_seconds = default_sleep_interval_seconds
-        if timeout_seconds >= 0:
-            sleep_interval_seconds = min(
-                default_sleep_interval_seconds, timeout_seconds - elapsed_time
-            )
+        sleep_interval_seconds = self._wait_interval(
+            elapsed_time, timeout_seconds, default_sleep_interval_seconds
+        )
         if sleep_interval_seconds > 0:
             self.time_module.sleep(sleep_interval_seconds)
 
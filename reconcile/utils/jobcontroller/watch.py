@@ -0,0 +1,124 @@
+import logging
+import threading
+import time
+from collections.abc import (
+    Callable,
+    Iterable,
+)
+from types import TracebackType
+from typing import Any
+
+JobEvent = tuple[str, dict[str, Any]]
+# waits on a condition like threading.Condition.wait_for
+WaitFor = Callable[[threading.Condition, Callable[[], bool], float], bool]
+
+# streams that end faster than this are restarted with a delay
+MIN_STREAM_SECONDS = 1.0
+
+
+class JobWatch:
+    """
+    Shares one WATCH on the Jobs of a namespace between all waiters.
+
+    The first waiter syncs the job cache with a LIST and starts the watch
+    thread. Every event is handed to `on_event` and wakes up the waiters,
+    which re-evaluate the status of their jobs from the cache. The watch
+    stops after the last waiter left. If the watch fails, `failed` is set
+    and the waiters fall back to polling.
+
+    The stream is started without a resourceVersion, so it begins with an
+    ADDED event for every existing job and no change between the LIST and
+    the WATCH gets lost. Streams closed by the API server are restarted.
+
+    `wait_for` measures the wait timeouts, it lets waiters use the same
+    clock as their caller.
+    """
+
+    def __init__(
+        self,
+        stream: Callable[[], Iterable[JobEvent]],
+        sync: Callable[[], Any],
+        on_event: Callable[[str, dict[str, Any]], None],
+        wait_for: WaitFor = threading.Condition.wait_for,
+    ) -> None:
+        self._stream = stream
+        self._sync = sync
+        self._on_event = on_event
+        self._wait_for = wait_for
+        self._cond = threading.Condition()
+        self._waiters = 0
+        self._thread: threading.Thread | None = None
+        self.generation = 0
+        self.failed = False
+
+    def __enter__(self) -> "JobWatch":
+        with self._cond:
+            self._waiters += 1
+            if self._thread is None:
+                try:
+                    self._sync()
+                except Exception:
+                    self._waiters -= 1
+                    raise
+                self.failed = False
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        with self._cond:
+            self._waiters -= 1
+
+    def current_generation(self) -> int:
+        with self._cond:
+            return self.generation
+
+    def wait(self, generation: int, timeout: float) -> bool:
+        """
+        Waits up to `timeout` seconds for an event after `generation`.
+        Returns True if there was one (or the watch failed).
+        """
+        with self._cond:
+            return self._wait_for(
+                self._cond,
+                lambda: self.generation != generation or self.failed,
+                timeout,
+            )
+
+    def _done(self) -> bool:
+        # called with the lock held
+        if self._waiters:
+            return False
+        self._thread = None
+        return True
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    if self._done():
+                        return
+                started = time.monotonic()
+                for event_type, obj in self._stream():
+                    if event_type == "ERROR":
+                        logging.debug(f"job watch error event, restarting: {obj}")
+                        break
+                    self._on_event(event_type, obj)
+                    with self._cond:
+                        self.generation += 1
+                        self._cond.notify_all()
+                        if self._done():
+                            return
+                if (delay := MIN_STREAM_SECONDS - time.monotonic() + started) > 0:
+                    time.sleep(delay)
+        except Exception as e:
+            logging.warning(f"job watch failed, falling back to polling: {e}")
+            with self._cond:
+                self.failed = True
+                self._thread = None
+                self._cond.notify_all()
@@ -0,0 +1,183 @@
+"""
+Selective decoding of large JSON documents from a stream.
+
+`load_selected` decodes only the selected members of a JSON object. The
+values of all other members are skipped and the skipped parts of the
+document are not kept in memory, so the memory usage depends on the size of
+the selected values and of the read chunks only.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import Mapping
+from typing import (
+    IO,
+    Any,
+)
+
+CHUNK_SIZE = 1024 * 1024
+
+WHITESPACE_EXP = re.compile(r"[ \t\n\r]*")
+STRING_EXP = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+SCALAR_DELIMITERS = " \t\n\r,:]}"
+DECODER = json.JSONDecoder()
+
+# a selection maps member names to True (decode the value) or to the
+# selection of the members of the value
+Selection = Mapping[str, "bool | Selection"]
+
+
+class JSONStreamError(ValueError):
+    pass
+
+
+class _Reader:
+    def __init__(self, stream: IO[bytes] | IO[str], chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int = 0) -> None:
+        """Read at least one chunk or `size` characters from the stream."""
+        if self.eof:
+            raise JSONStreamError("unexpected end of JSON document")
+        chunks = [self.buf]
+        read = 0
+        while not self.eof and (read == 0 or read < size):
+            chunk = self._stream.read(self._chunk_size)
+            if isinstance(chunk, bytes):
+                text = self._decoder.decode(chunk, final=not chunk)
+            else:
+                text = chunk
+            self.eof = not chunk
+            chunks.append(text)
+            read += len(text)
+        self.buf = "".join(chunks)
+
+    def compact(self) -> None:
+        # dropping the consumed part copies the buffer, do it once per chunk
+        if self.pos >= self._chunk_size:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+
+    def peek(self) -> str:
+        while True:
+            self.pos = WHITESPACE_EXP.match(self.buf, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            self.compact()
+            self.fill()
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise JSONStreamError(
+                f"expected {char!r}, got {self.buf[self.pos]!r} in JSON document"
+            )
+        self.pos += 1
+
+    def string(self) -> str:
+        self.peek()
+        while not (match := STRING_EXP.match(self.buf, self.pos)):
+            self.fill()
+        self.pos = match.end()
+        return json.loads(match.group())
+
+    def _decode_buffered(self) -> tuple[Any, int] | None:
+        """Decode the next value if it is complete in the buffer."""
+        try:
+            value, end = DECODER.raw_decode(self.buf, self.pos)
+        except json.JSONDecodeError:
+            return None
+        # a number or literal at the end of the buffer may continue
+        if (
+            self.buf[self.pos] not in '"[{'
+            and not self.eof
+            and (end == len(self.buf) or self.buf[end] not in SCALAR_DELIMITERS)
+        ):
+            return None
+        return value, end
+
+    def value(self) -> Any:
+        self.peek()
+        while (decoded := self._decode_buffered()) is None:
+            if self.eof:
+                raise JSONStreamError("invalid JSON document")
+            # grow the buffer exponentially to limit the number of retries
+            self.fill(size=len(self.buf) - self.pos)
+        value, self.pos = decoded
+        return value
+
+    def skip_value(self) -> None:
+        """
+        Moves past the next value. Values that are complete in the buffer
+        are skipped by the C decoder, larger containers are walked member
+        by member, dropping the skipped part of the buffer.
+        """
+        char = self.peek()
+        if char not in "{[":
+            self.value()
+            return
+        if decoded := self._decode_buffered():
+            self.pos = decoded[1]
+            return
+
+        closing = "}" if char == "{" else "]"
+        self.pos += 1
+        if self.peek() == closing:
+            self.pos += 1
+            return
+        while True:
+            if char == "{":
+                self.string()
+                self.expect(":")
+            self.skip_value()
+            self.compact()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect(closing)
+            return
+
+    def selected(self, selection: Selection) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return result
+        while True:
+            key = self.string()
+            self.expect(":")
+            member = selection.get(key)
+            if member is True:
+                result[key] = self.value()
+            elif member and self.peek() == "{":
+                result[key] = self.selected(member)  # type: ignore[arg-type]
+            else:
+                self.skip_value()
+            self.compact()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return result
+
+
+def load_selected(
+    stream: IO[bytes] | IO[str],
+    selection: Selection,
+    chunk_size: int = CHUNK_SIZE,
+) -> dict[str, Any]:
+    """
+    Decode the selected members of the JSON object read from `stream`.
+
+    :param stream: A binary (UTF-8) or text stream of a JSON object
+    :param selection: e.g. {"a": True, "b": {"c": True}} decodes the member
+        a and the member c of the object b. Members of b other than c are
+        skipped.
+    :return: The selected members that are present in the document
+    """
+    return _Reader(stream, chunk_size).selected(selection)
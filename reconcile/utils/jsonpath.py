@@ -1,15 +1,88 @@
 import logging
+import os
+import threading
+from collections.abc import Iterator
 from functools import (
     lru_cache,
     reduce,
 )
 from itertools import zip_longest
+from typing import Any
 
 import jsonpath_ng
 import jsonpath_ng.ext.filter
+import jsonpath_ng.ext.parser
+import jsonpath_ng.lexer
+import jsonpath_ng.parser
+import ply.lex
+import ply.yacc
 
 
-@lru_cache(maxsize=256)
+class _PrebuiltTablesMixin:
+    """
+    jsonpath_ng builds the PLY lexer and LALR parser tables on every parse,
+    which takes a lot longer than the parsing itself. Build them once per
+    parser instance and reuse them.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()  # type: ignore[call-arg]
+        self._lock = threading.Lock()
+        self._lexer: Any = None
+        self._parser: Any = None
+
+    def _tokenize(self, string: str) -> Iterator[Any]:
+        # same as JsonPathLexer.tokenize, but with a clone of a prebuilt lexer
+        if self._lexer is None:
+            self._lexer = ply.lex.lex(
+                module=self.lexer_class(),  # type: ignore[attr-defined]
+                errorlog=jsonpath_ng.lexer.logger,
+            )
+        lexer = self._lexer.clone()
+        lexer.lexstatestack = []
+        lexer.latest_newline = 0
+        lexer.string_value = None
+        lexer.input(string)
+        while (t := lexer.token()) is not None:
+            t.col = t.lexpos - lexer.latest_newline
+            yield t
+        if lexer.string_value is not None:
+            raise jsonpath_ng.lexer.JsonPathLexerError(
+                "Unexpected EOF in string literal or identifier"
+            )
+
+    def parse(self, string: str, lexer: Any = None) -> jsonpath_ng.JSONPath:
+        with self._lock:
+            if self._parser is None:
+                self._parser = ply.yacc.yacc(
+                    module=self,
+                    debug=False,
+                    tabmodule="parser_jsonpath_parsetab",
+                    outputdir=os.path.dirname(jsonpath_ng.parser.__file__),
+                    write_tables=0,
+                    start="jsonpath",
+                    errorlog=jsonpath_ng.parser.logger,
+                )
+            return self._parser.parse(
+                lexer=jsonpath_ng.parser.IteratorToTokenStream(self._tokenize(string))
+            )
+
+
+class _JsonPathParser(_PrebuiltTablesMixin, jsonpath_ng.parser.JsonPathParser):
+    """JsonPathParser with prebuilt tables (PLY requires a docstring)"""
+
+
+class _ExtendedJsonPathParser(
+    _PrebuiltTablesMixin, jsonpath_ng.ext.parser.ExtentedJsonPathParser
+):
+    """ExtentedJsonPathParser with prebuilt tables (PLY requires a docstring)"""
+
+
+_parser = _JsonPathParser()
+_ext_parser = _ExtendedJsonPathParser()
+
+
+@lru_cache(maxsize=4096)
 def parse_jsonpath(jsonpath_expression: str) -> jsonpath_ng.JSONPath:
     """
     parses a JSONPath expression and returns a JSONPath object.
@@ -19,7 +92,7 @@ def parse_jsonpath(jsonpath_expression: str) -> jsonpath_ng.JSONPath:
         try:
             # the regular parser is faster, but does not support filters
             # we will success in this branch most of the time
-            return jsonpath_ng.parse(jsonpath_expression)
+            return _parser.parse(jsonpath_expression)
         except Exception:
             # something we did not cover in our prechecks prevented the use of the
             # regular parser. we will try the extended parser, which supports filters
@@ -28,7 +101,7 @@ def parse_jsonpath(jsonpath_expression: str) -> jsonpath_ng.JSONPath:
                 f"Unable to parse '{jsonpath_expression}' with the regular parser"
             )
 
-    return jsonpath_ng.ext.parse(jsonpath_expression)
+    return _ext_parser.parse(jsonpath_expression)
 
 
 def narrow_jsonpath_node(
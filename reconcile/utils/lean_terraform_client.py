@@ -1,10 +1,25 @@
 import json
 import logging
 import os
+import shutil
 import subprocess
+import tempfile
 from collections.abc import Mapping
 from typing import Any
 
+from reconcile.utils.json_stream import (
+    CHUNK_SIZE,
+    JSONStreamError,
+    Selection,
+    load_selected,
+)
+
+# provider plugins are shared by all working directories on a node
+TF_PLUGIN_CACHE_DIR = os.environ.get("TF_PLUGIN_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".terraform.d", "plugin-cache"
+)
+LOCK_FILE_NAME = ".terraform.lock.hcl"
+
 
 def state_rm_access_key(working_dirs, account, user):
     wd = working_dirs[account]
@@ -41,41 +56,146 @@ def _terraform_command(
     return return_code, stdout, stderr
 
 
-def show_json(working_dir: str, path: str) -> dict[str, Any]:
+def show_json(
+    working_dir: str,
+    path: str,
+    selection: Selection | None = None,
+) -> dict[str, Any]:
     """
     Run terraform show -no-color -json <path>.
 
     :param working_dir: The directory where the terraform files are located
     :param path: The path to the plan file
+    :param selection: Decode only these members of the output, see
+        json_stream.load_selected. The output is streamed, so large plans
+        are never fully loaded into memory.
     :return: Deserialized JSON from the terraform show command
     """
-    return_code, stdout, stderr = _terraform_command(
-        args=["terraform", "show", "-no-color", "-json", path],
-        working_dir=working_dir,
-    )
-    if return_code != 0:
+    args = ["terraform", "show", "-no-color", "-json", path]
+    if selection is None:
+        return_code, stdout, stderr = _terraform_command(
+            args=args,
+            working_dir=working_dir,
+        )
+        if return_code != 0:
+            msg = f"[{path}] terraform show failed: {stderr}"
+            logging.warning(msg)
+            raise Exception(msg)
+        return json.loads(stdout)
+
+    with (
+        tempfile.TemporaryFile() as stderr_file,
+        subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            cwd=working_dir,
+            env=_compute_terraform_env(),
+        ) as process,
+    ):
+        try:
+            output = load_selected(process.stdout, selection)  # type: ignore[arg-type]
+        except JSONStreamError:
+            output = None
+        # terraform exits once all of its output is consumed
+        while process.stdout.read(CHUNK_SIZE):  # type: ignore[union-attr]
+            pass
+        return_code = process.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode("utf-8")
+    if return_code != 0 or output is None:
         msg = f"[{path}] terraform show failed: {stderr}"
         logging.warning(msg)
         raise Exception(msg)
-    return json.loads(stdout)
+    return output
+
+
+def plugin_cache_dir() -> str | None:
+    """
+    Return the shared provider plugin cache directory, creating it if needed.
+
+    :return: The directory or None if it can't be created
+    """
+    try:
+        os.makedirs(TF_PLUGIN_CACHE_DIR, exist_ok=True)
+    except OSError as e:
+        logging.warning(f"unable to use terraform plugin cache: {e}")
+        return None
+    return TF_PLUGIN_CACHE_DIR
+
+
+def dependency_lock_file(working_dir: str) -> str | None:
+    """
+    Return the dependency lock file of an initialized working directory.
+
+    :param working_dir: The directory where the terraform files are located
+    :return: The path to the lock file or None if there is none
+    """
+    path = os.path.join(working_dir, LOCK_FILE_NAME)
+    return path if os.path.isfile(path) else None
+
+
+def required_providers(working_dir: str) -> str | None:
+    """
+    Return the providers required by the JSON configuration of a working
+    directory. Working directories with the same required providers
+    install the same provider versions.
+
+    :param working_dir: The directory where the terraform files are located
+    :return: A canonical JSON representation of the required providers or
+        None if they can't be determined
+    """
+    providers: dict[str, Any] = {}
+    try:
+        for name in os.listdir(working_dir):
+            if not name.endswith(".tf.json"):
+                continue
+            with open(os.path.join(working_dir, name), encoding="utf-8") as f:
+                config = json.load(f)
+            providers.update(config.get("terraform", {}).get("required_providers", {}))
+    except (OSError, ValueError, AttributeError) as e:
+        logging.debug(f"[{working_dir}] unable to read required providers: {e}")
+        return None
+    return json.dumps(providers, sort_keys=True) if providers else None
 
 
 def init(
     working_dir: str,
     env: Mapping[str, str] | None = None,
+    plugin_cache_dir: str | None = None,
+    lock_file: str | None = None,
 ) -> tuple[int, str, str]:
     """
     Run terraform init -input=false -no-color.
 
+    Terraform only links providers from the plugin cache if their checksums
+    are recorded in the dependency lock file, otherwise it downloads them
+    and writes them to the cache.
+
     :param working_dir: The directory where the terraform files are located
     :param env: Environment variables to pass to the terraform command
+    :param plugin_cache_dir: Install providers from/to this plugin cache
+    :param lock_file: Dependency lock file to reuse if the working directory
+        has none. It is removed again if init fails with it.
     :return: (return_code, stdout, stderr)
     """
-    return _terraform_command(
+    if plugin_cache_dir:
+        env = {**(env or {}), "TF_PLUGIN_CACHE_DIR": plugin_cache_dir}
+    target_lock_file = os.path.join(working_dir, LOCK_FILE_NAME)
+    reused_lock_file = False
+    if lock_file and not os.path.exists(target_lock_file):
+        shutil.copyfile(lock_file, target_lock_file)
+        reused_lock_file = True
+
+    return_code, stdout, stderr = _terraform_command(
         args=["terraform", "init", "-input=false", "-no-color"],
         working_dir=working_dir,
         env=env,
     )
+    if return_code != 0 and reused_lock_file:
+        # e.g. the working directory requires other provider versions
+        os.remove(target_lock_file)
+    return return_code, stdout, stderr
 
 
 def output(
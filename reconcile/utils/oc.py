@@ -9,6 +9,7 @@ import threading
 import time
 from collections.abc import (
     Iterable,
+    Iterator,
     Mapping,
 )
 from contextlib import suppress
@@ -38,6 +39,7 @@ from kubernetes.dynamic.exceptions import (
     ServerTimeoutError,
 )
 from kubernetes.dynamic.resource import ResourceList
+from kubernetes.watch import Watch
 from prometheus_client import Counter
 from sretoolbox.utils import (
     retry,
@@ -51,7 +53,16 @@ from reconcile.utils.jump_host import (
 )
 from reconcile.utils.metrics import reconcile_time
 from reconcile.utils.oc_connection_parameters import OCConnectionParameters
+from reconcile.utils.oc_informer import (
+    InformerSyncError,
+    get_informer,
+)
 from reconcile.utils.openshift_resource import OpenshiftResource as OR
+from reconcile.utils.openshift_template import (
+    TemplateProcessingError,
+    UnsupportedTemplateError,
+    process_template,
+)
 from reconcile.utils.secret_reader import (
     SecretNotFound,
     SecretReader,
@@ -61,6 +72,8 @@ from reconcile.utils.unleash import get_feature_toggle_state
 urllib3.disable_warnings()
 
 GET_REPLICASET_MAX_ATTEMPTS = 20
+# engine used to process OpenShift Templates: "native" or "oc"
+OC_PROCESS_ENGINE = os.environ.get("OC_PROCESS_ENGINE", "native")
 
 
 oc_run_execution_counter = Counter(
@@ -230,6 +243,17 @@ class OCProcessReconcileTimeDecoratorMsg:
 
 
 def oc_process(template, parameters=None):
+    """
+    Process an OpenShift Template. The native engine processes the template
+    in-process, the oc engine runs `oc process`.
+    """
+    if OC_PROCESS_ENGINE == "native":
+        try:
+            return process_template(template, parameters)
+        except UnsupportedTemplateError as e:
+            logging.debug(f"falling back to oc process: {e}")
+        except TemplateProcessingError as e:
+            raise StatusCodeError(str(e)) from e
     oc = OCLocal(cluster_name="cluster", server=None, token=None, local=True)
     return oc.process(template, parameters)
 
@@ -473,7 +497,9 @@ class OCCli:  # pylint: disable=too-many-public-methods
     def get_items(self, kind, **kwargs):
         cmd = ["get", kind, "-o", "json"]
 
-        if "namespace" in kwargs:
+        if kwargs.get("all_namespaces"):
+            cmd.append("--all-namespaces")
+        elif "namespace" in kwargs:
             namespace = kwargs["namespace"]
             # for cluster scoped integrations
             # currently only openshift-clusterrolebindings
@@ -490,13 +516,14 @@ class OCCli:  # pylint: disable=too-many-public-methods
 
         resource_names = kwargs.get("resource_names")
         if resource_names:
-            items = []
-            for resource_name in resource_names:
-                resource_cmd = cmd + [resource_name]
-                item = self._run_json(resource_cmd, allow_not_found=True)
-                if item:
-                    items.append(item)
-            items_list = {"items": items}
+            items = threaded.run(
+                lambda resource_name: self._run_json(
+                    cmd + [resource_name], allow_not_found=True
+                ),
+                resource_names,
+                RESOURCE_NAMES_THREAD_POOL_SIZE,
+            )
+            items_list = {"items": [item for item in items if item]}
         else:
             items_list = self._run_json(cmd)
 
@@ -506,6 +533,10 @@ class OCCli:  # pylint: disable=too-many-public-methods
 
         return items
 
+    def iter_items(self, kind, **kwargs) -> Iterator[dict[str, Any]]:
+        """Iterate over the items returned by get_items."""
+        yield from self.get_items(kind, **kwargs)
+
     def get(self, namespace, kind, name=None, allow_not_found=False):
         cmd = ["get", "-o", "json", kind]
         if name:
@@ -1223,6 +1254,14 @@ class OCCli:  # pylint: disable=too-many-public-methods
 
 
 REQUEST_TIMEOUT = 60
+# number of items fetched per request by OCNative.iter_items
+LIST_CHUNK_SIZE = int(os.environ.get("OC_LIST_CHUNK_SIZE") or 500)
+# number of parallel GETs when fetching specific resource_names
+RESOURCE_NAMES_THREAD_POOL_SIZE = 10
+# the API server closes watches after a while anyways, restart them regularly
+WATCH_TIMEOUT_SECONDS = 60
+# serve OCNative.iter_items from watch based informers (for daemon mode)
+USE_INFORMERS = os.environ.get("USE_OC_INFORMERS", "").lower() in {"true", "yes"}
 
 
 class OCNative(OCCli):
@@ -1261,6 +1300,10 @@ class OCNative(OCCli):
         if server:
             self.client = self._get_client(server, token)
             self.api_resources = self.get_api_resources()
+            # informers outlive this client, they can't use a jump host tunnel
+            self.use_informers = USE_INFORMERS and not self.jump_host
+            self._informer_server = server
+            self._informer_token = token
 
         else:
             raise Exception("A method relies on client/api_kind_version to be set")
@@ -1347,8 +1390,8 @@ class OCNative(OCCli):
 
         resource_names = kwargs.get("resource_names")
         if resource_names:
-            items = []
-            for resource_name in resource_names:
+
+            def get_item(resource_name: str) -> dict[str, Any] | None:
                 try:
                     item = obj_client.get(
                         name=resource_name,
@@ -1356,11 +1399,14 @@ class OCNative(OCCli):
                         label_selector=labels,
                         _request_timeout=REQUEST_TIMEOUT,
                     )
-                    if item:
-                        items.append(item.to_dict())
                 except NotFoundError:
-                    pass
-            items_list = {"items": items}
+                    return None
+                return item.to_dict() if item else None
+
+            items = threaded.run(
+                get_item, resource_names, RESOURCE_NAMES_THREAD_POOL_SIZE
+            )
+            items_list = {"items": [item for item in items if item]}
         else:
             items_list = obj_client.get(
                 namespace=namespace,
@@ -1373,6 +1419,104 @@ class OCNative(OCCli):
             raise Exception("Expecting items")
         return items
 
+    @retry(max_attempts=5, exceptions=(ServerTimeoutError))
+    def _list_chunk(
+        self,
+        obj_client,
+        namespace: str,
+        labels: str,
+        limit: int,
+        _continue: str | None,
+    ) -> dict[str, Any]:
+        # skip the ResourceInstance serialization, we only need plain dicts
+        response = obj_client.get(
+            namespace=namespace,
+            label_selector=labels,
+            limit=limit,
+            _continue=_continue,
+            serialize=False,
+            _request_timeout=REQUEST_TIMEOUT,
+        )
+        return json.loads(response.data)
+
+    def iter_items(
+        self, kind, chunk_size: int = LIST_CHUNK_SIZE, **kwargs
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over the items of a kind using chunked LIST requests.
+
+        Only `chunk_size` items are held in memory at any time. Fetching
+        specific resource_names is delegated to get_items.
+        """
+        if kwargs.get("resource_names"):
+            yield from self.get_items(kind, **kwargs)
+            return
+
+        k, group_version = self._parse_kind(kind)
+        obj_client = self._get_obj_client(group_version=group_version, kind=k)
+
+        namespace = ""
+        if "namespace" in kwargs:
+            namespace = kwargs["namespace"]
+            # for cluster scoped integrations
+            # currently only openshift-clusterrolebindings
+            if namespace != "cluster":
+                if not self.project_exists(namespace):
+                    return
+
+        labels = ""
+        if "labels" in kwargs:
+            labels = ",".join(f"{k}={v}" for k, v in kwargs["labels"].items())
+
+        if self.use_informers and not labels:
+            informer = get_informer(
+                self._informer_server,
+                self._informer_token,
+                kind,
+                None if namespace in {"", "cluster"} else namespace,
+                lambda: self._get_client(
+                    self._informer_server, self._informer_token
+                ).resources.get(api_version=group_version, kind=k),
+            )
+            if informer:
+                try:
+                    yield from informer.items()
+                    return
+                except InformerSyncError as e:
+                    logging.debug(f"[{self.cluster_name}] informer for {kind}: {e}")
+
+        _continue = None
+        while True:
+            chunk = self._list_chunk(
+                obj_client, namespace, labels, chunk_size, _continue
+            )
+            items = chunk.get("items")
+            if items is None:
+                raise Exception("Expecting items")
+            yield from items
+            _continue = chunk.get("metadata", {}).get("continue")
+            if not _continue:
+                return
+
+    def watch_items(
+        self, kind, namespace: str = "", timeout_seconds: int = WATCH_TIMEOUT_SECONDS
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Watch the items of a kind. The stream starts with an ADDED event for
+        every existing item and ends after `timeout_seconds`.
+
+        :return: (event type, item) tuples
+        """
+        k, group_version = self._parse_kind(kind)
+        obj_client = self._get_obj_client(group_version=group_version, kind=k)
+        for event in Watch().stream(
+            obj_client.get,
+            namespace=namespace,
+            serialize=False,
+            timeout_seconds=timeout_seconds,
+        ):
+            yield event["type"], event["raw_object"]
+
     @retry(max_attempts=5, exceptions=(ServerTimeoutError, ForbiddenError))
     def get(self, namespace, kind, name=None, allow_not_found=False):
         k, group_version = self._parse_kind(kind)
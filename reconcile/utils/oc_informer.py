@@ -0,0 +1,260 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+from typing import Any
+
+from kubernetes.client.rest import ApiException
+from kubernetes.watch import Watch
+
+HTTP_STATUS_GONE = 410
+# the API server closes watches after a while anyways, restart them regularly
+WATCH_TIMEOUT_SECONDS = 300
+LIST_CHUNK_SIZE = 500
+INITIAL_SYNC_TIMEOUT_SECONDS = 300
+ERROR_BACKOFF_SECONDS = 10
+# readers fall back to direct LISTs if the store was not confirmed by a
+# successful LIST or WATCH for longer than this
+MAX_STALENESS_SECONDS = 2 * WATCH_TIMEOUT_SECONDS
+# read other kinds and namespaces with direct LISTs once there are this many
+# informers, each one holds a WATCH connection and a thread
+MAX_INFORMERS = 500
+# don't start another informer for a kind whose initial sync failed, e.g.
+# because the identity may not list it, for this long
+FAILED_INFORMER_BACKOFF_SECONDS = 600
+
+
+class InformerSyncError(Exception):
+    pass
+
+
+class ResourceInformer:
+    """
+    Keeps a local copy of the objects of one kind in one namespace of a
+    cluster, or in all namespaces if `namespace` is None.
+
+    An initial LIST fills the store, afterwards a WATCH (with bookmarks)
+    started from the resourceVersion of the LIST applies changes as they
+    happen. If the resourceVersion expired, the store is listed again.
+    The informer runs in a daemon thread, so the store survives across
+    integration loop iterations and reads don't hit the API server.
+
+    Reads fail with InformerSyncError if the initial sync failed or if the
+    store is stale, i.e. the WATCH kept failing for MAX_STALENESS_SECONDS.
+    Callers are expected to fall back to a direct LIST then.
+
+    Objects are stored JSON encoded, which takes a fraction of the memory
+    of the decoded objects. Every read decodes fresh objects, just like a
+    direct LIST, so callers may modify them.
+    """
+
+    def __init__(
+        self,
+        obj_client: Any,
+        namespace: str | None = None,
+        watch_timeout_seconds: int = WATCH_TIMEOUT_SECONDS,
+    ) -> None:
+        self._obj_client = obj_client
+        self._namespace = namespace
+        self._watch_timeout_seconds = watch_timeout_seconds
+        self._lock = threading.Lock()
+        # (namespace, name) -> JSON encoded object
+        self._items: dict[tuple[str, str], str] = {}
+        self._resource_version: str | None = None
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._sync_error: Exception | None = None
+        # monotonic time the store was last confirmed by the API server
+        self._last_sync: float | None = None
+        self._watcher: Watch | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def resource_version(self) -> str | None:
+        return self._resource_version
+
+    @property
+    def failed(self) -> bool:
+        return self._sync_error is not None
+
+    def is_stale(self) -> bool:
+        last_sync = self._last_sync
+        return last_sync is None or time.monotonic() - last_sync > MAX_STALENESS_SECONDS
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._watcher:
+            self._watcher.stop()
+
+    def items(
+        self, timeout: float = INITIAL_SYNC_TIMEOUT_SECONDS
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over copies of the stored objects."""
+        if not self._synced.wait(timeout):
+            raise InformerSyncError("informer did not sync in time")
+        if self._sync_error:
+            raise InformerSyncError(str(self._sync_error))
+        if self.is_stale():
+            raise InformerSyncError("informer store is stale")
+        with self._lock:
+            items = list(self._items.values())
+        for item in items:
+            yield json.loads(item)
+
+    @staticmethod
+    def _store_key(obj: dict[str, Any]) -> tuple[str, str]:
+        metadata = obj["metadata"]
+        return metadata.get("namespace", ""), metadata["name"]
+
+    @staticmethod
+    def _encode(obj: dict[str, Any]) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def relist(self) -> None:
+        items: dict[tuple[str, str], str] = {}
+        _continue = None
+        while True:
+            response = self._obj_client.get(
+                namespace=self._namespace,
+                limit=LIST_CHUNK_SIZE,
+                _continue=_continue,
+                serialize=False,
+            )
+            chunk = json.loads(response.data)
+            for item in chunk.get("items") or []:
+                items[self._store_key(item)] = self._encode(item)
+            _continue = chunk["metadata"].get("continue")
+            if not _continue:
+                break
+        with self._lock:
+            self._items = items
+            self._resource_version = chunk["metadata"].get("resourceVersion")
+            self._last_sync = time.monotonic()
+
+    def apply_event(self, event_type: str, obj: dict[str, Any]) -> None:
+        metadata = obj.get("metadata") or {}
+        with self._lock:
+            self._last_sync = time.monotonic()
+            if resource_version := metadata.get("resourceVersion"):
+                self._resource_version = resource_version
+            if event_type == "BOOKMARK":
+                return
+            if event_type == "DELETED":
+                self._items.pop(self._store_key(obj), None)
+            elif event_type in {"ADDED", "MODIFIED"}:
+                self._items[self._store_key(obj)] = self._encode(obj)
+
+    def watch(self) -> None:
+        self._watcher = Watch()
+        for event in self._watcher.stream(
+            self._obj_client.get,
+            namespace=self._namespace,
+            resource_version=self._resource_version,
+            serialize=False,
+            timeout_seconds=self._watch_timeout_seconds,
+            query_params=[("allowWatchBookmarks", "true")],
+        ):
+            self.apply_event(event["type"], event["raw_object"])
+            if self._stopped.is_set():
+                return
+        # the server closed the watch after the timeout, nothing was missed
+        self._last_sync = time.monotonic()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                if self._resource_version is None:
+                    self.relist()
+                    self._synced.set()
+                self.watch()
+            except ApiException as e:
+                if e.status == HTTP_STATUS_GONE:
+                    logging.debug("informer resourceVersion expired, relisting")
+                    self._resource_version = None
+                    continue
+                if self._handle_error(e):
+                    break
+            except Exception as e:
+                if self._handle_error(e):
+                    break
+        if self.failed:
+            # readers fall back to direct LISTs until the backoff expired
+            _discard_informer(self)
+
+    def _handle_error(self, error: Exception) -> bool:
+        """Returns True if the informer gave up."""
+        if not self._synced.is_set():
+            # the initial sync failed, e.g. because of missing permissions
+            # to list the kind cluster wide. Readers must fall back.
+            self._sync_error = error
+            self._synced.set()
+            return True
+        logging.warning(f"informer watch failed, retrying: {error}")
+        self._stopped.wait(ERROR_BACKOFF_SECONDS)
+        return False
+
+
+InformerKey = tuple[str, str, str, str | None]
+
+_informers: dict[InformerKey, ResourceInformer] = {}
+# key -> monotonic time the initial sync of its informer failed
+_failed_informers: dict[InformerKey, float] = {}
+_informers_lock = threading.Lock()
+
+
+def get_informer(
+    server: str,
+    token: str,
+    kind: str,
+    namespace: str | None,
+    obj_client_factory: Callable[[], Any],
+) -> ResourceInformer | None:
+    """
+    Return the process wide informer of a kind in a namespace of a cluster,
+    in all namespaces if `namespace` is None. Only the namespaces that are
+    read are kept in memory. Informers are not shared between identities,
+    as they may see different objects.
+
+    Returns None if there are MAX_INFORMERS informers already or while the
+    last informer of the kind failed its initial sync less than
+    FAILED_INFORMER_BACKOFF_SECONDS ago.
+    """
+    identity = hashlib.sha256(token.encode()).hexdigest()
+    with _informers_lock:
+        key = (server, identity, kind, namespace)
+        if (failed_at := _failed_informers.get(key)) is not None:
+            if time.monotonic() - failed_at < FAILED_INFORMER_BACKOFF_SECONDS:
+                return None
+            del _failed_informers[key]
+        if key not in _informers:
+            if len(_informers) >= MAX_INFORMERS:
+                return None
+            informer = ResourceInformer(obj_client_factory(), namespace)
+            informer.start()
+            _informers[key] = informer
+        return _informers[key]
+
+
+def _discard_informer(informer: ResourceInformer) -> None:
+    with _informers_lock:
+        for key, value in list(_informers.items()):
+            if value is informer:
+                del _informers[key]
+                _failed_informers[key] = time.monotonic()
+
+
+def stop_informers() -> None:
+    with _informers_lock:
+        for informer in _informers.values():
+            informer.stop()
+        _informers.clear()
+        _failed_informers.clear()
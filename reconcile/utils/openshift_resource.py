@@ -72,6 +72,17 @@ QONTRACT_ANNOTATIONS = {
 
 # pylint: disable=R0904
 class OpenshiftResource:
+    # there are lots of these objects in fleet wide runs, avoid the per
+    # instance __dict__
+    __slots__ = (
+        "_body",
+        "_sha256sum",
+        "caller_name",
+        "error_details",
+        "integration",
+        "integration_version",
+    )
+
     def __init__(
         self,
         body,
@@ -81,6 +92,7 @@ class OpenshiftResource:
         caller_name=None,
         validate_k8s_object=True,
     ):
+        self._sha256sum: str | None = None
         self.body = body
         self.integration = integration
         self.integration_version = integration_version
@@ -130,9 +142,11 @@ class OpenshiftResource:
                     if diff or not self.obj_intersect_equal(obj1_v, obj2_v, depth + 1):
                         return False
                 elif obj1_k == "env":
-                    for v in obj2_v or []:
-                        if "name" in v and len(v) == 1:
-                            v["value"] = ""
+                    if obj2_v:
+                        obj2_v = [
+                            {**v, "value": ""} if "name" in v and len(v) == 1 else v
+                            for v in obj2_v
+                        ]
                     if not self.obj_intersect_equal(obj1_v, obj2_v, depth + 1):
                         return False
                 elif obj1_k == "cpu":
@@ -204,6 +218,15 @@ class OpenshiftResource:
             return True
         return val1 == val2
 
+    @property
+    def body(self):
+        return self._body
+
+    @body.setter
+    def body(self, body):
+        self._body = body
+        self._sha256sum = None
+
     @property
     def name(self):
         # PipelineRun name can be empty when creating
@@ -344,9 +367,10 @@ class OpenshiftResource:
             openshift_resource: new OpenshiftResource object with
                 annotations.
         """
-        body = self.canonicalize(self.body) if canonicalize else self.body
-
-        sha256sum = self.calculate_sha256sum(self.serialize(body))
+        if canonicalize:
+            sha256sum = self.sha256sum()
+        else:
+            sha256sum = self.calculate_sha256sum(self.serialize(self.body))
 
         # create new body object
         body = copy.deepcopy(self.body)
@@ -370,42 +394,61 @@ class OpenshiftResource:
         return OpenshiftResource(body, self.integration, self.integration_version)
 
     def sha256sum(self):
-        body = self.annotate().body
+        """
+        The digest of the canonical form of the body.
 
-        annotations = body["metadata"]["annotations"]
-        return annotations["qontract.sha256sum"]
+        The digest is cached until the body is replaced. Assign a new body
+        instead of changing it in place once the digest was calculated.
+        """
+        if self._sha256sum is None:
+            self._sha256sum = self.calculate_sha256sum(
+                self.serialize(self._canonical_view(self.body))
+            )
+        return self._sha256sum
 
     def toJSON(self):
         return self.serialize(self.body)
 
     @staticmethod
     def canonicalize(body):
-        body = copy.deepcopy(body)
+        return copy.deepcopy(OpenshiftResource._canonical_view(body))
+
+    @staticmethod
+    def _canonical_view(body):
+        """
+        Returns the canonical form of body without deep copying it.
+
+        Only the containers that need changes are (shallow) copied, everything
+        else is shared with body. The result must therefore be treated as
+        read-only, use canonicalize() to get an independent copy.
+        """
+        body = dict(body)
+        metadata = body["metadata"] = dict(body["metadata"])
 
         # create annotations if not present
-        body["metadata"].setdefault("annotations", {})
-        if body["metadata"]["annotations"] is None:
-            body["metadata"]["annotations"] = {}
-        annotations = body["metadata"]["annotations"]
+        annotations = metadata["annotations"] = dict(metadata.get("annotations") or {})
 
         # remove openshift specific params
-        body["metadata"].pop("creationTimestamp", None)
-        body["metadata"].pop("resourceVersion", None)
-        body["metadata"].pop("generation", None)
-        body["metadata"].pop("selfLink", None)
-        body["metadata"].pop("uid", None)
-        body["metadata"].pop("namespace", None)
-        body["metadata"].pop("managedFields", None)
+        metadata.pop("creationTimestamp", None)
+        metadata.pop("resourceVersion", None)
+        metadata.pop("generation", None)
+        metadata.pop("selfLink", None)
+        metadata.pop("uid", None)
+        metadata.pop("namespace", None)
+        metadata.pop("managedFields", None)
         annotations.pop("kubectl.kubernetes.io/last-applied-configuration", None)
 
         # remove status
         body.pop("status", None)
 
         # remove controller managed labels
-        labels = body["metadata"].get("labels", {})
-        for label in set(labels.keys()):
-            if OpenshiftResource.is_controller_managed_label(body["kind"], label):
-                labels.pop(label)
+        labels = metadata.get("labels")
+        if labels:
+            metadata["labels"] = {
+                k: v
+                for k, v in labels.items()
+                if not OpenshiftResource.is_controller_managed_label(body["kind"], k)
+            }
 
         # Default fields for specific resource types
         # ConfigMaps and Secrets are by default Opaque
@@ -415,17 +458,17 @@ class OpenshiftResource:
         if body["kind"] == "Secret":
             string_data = body.pop("stringData", None)
             if string_data:
-                body.setdefault("data", {})
+                data = body["data"] = dict(body.get("data", {}))
                 for k, v in string_data.items():
-                    v = base64_encode_secret_field_value(str(v))
-                    body["data"][k] = v
+                    data[k] = base64_encode_secret_field_value(str(v))
 
         if body["kind"] == "Deployment":
             annotations.pop("deployment.kubernetes.io/revision", None)
 
         if body["kind"] == "Route":
-            if body["spec"].get("wildcardPolicy") == "None":
-                body["spec"].pop("wildcardPolicy")
+            spec = body["spec"] = dict(body["spec"])
+            if spec.get("wildcardPolicy") == "None":
+                spec.pop("wildcardPolicy")
             # remove tls-acme specific params from Route
             if "kubernetes.io/tls-acme" in annotations:
                 annotations.pop(
@@ -434,13 +477,13 @@ class OpenshiftResource:
                 annotations.pop(
                     "kubernetes.io/tls-acme-awaiting-authorization-at-url", None
                 )
-                if "tls" in body["spec"]:
-                    tls = body["spec"]["tls"]
+                if "tls" in spec:
+                    tls = spec["tls"] = dict(spec["tls"])
                     tls.pop("key", None)
                     tls.pop("certificate", None)
-            subdomain = body["spec"].get("subdomain", None)
+            subdomain = spec.get("subdomain")
             if not subdomain:
-                body["spec"].pop("subdomain", None)
+                spec.pop("subdomain", None)
 
         if body["kind"] == "ServiceAccount":
             if "imagePullSecrets" in body:
@@ -456,18 +499,22 @@ class OpenshiftResource:
                 body.pop("secrets")
 
         if body["kind"] == "Role":
+            rules = []
             for rule in body["rules"]:
+                rule = dict(rule)
                 if "resources" in rule:
-                    rule["resources"].sort()
+                    rule["resources"] = sorted(rule["resources"])
 
                 if "verbs" in rule:
-                    rule["verbs"].sort()
+                    rule["verbs"] = sorted(rule["verbs"])
 
                 if (
                     "attributeRestrictions" in rule
                     and not rule["attributeRestrictions"]
                 ):
                     rule.pop("attributeRestrictions")
+                rules.append(rule)
+            body["rules"] = rules
 
         if body["kind"] == "OperatorGroup":
             annotations.pop("olm.providedAPIs", None)
@@ -478,26 +525,30 @@ class OpenshiftResource:
             if "userNames" in body:
                 body.pop("userNames")
             if "roleRef" in body:
-                roleRef = body["roleRef"]
+                roleRef = body["roleRef"] = dict(body["roleRef"])
                 if "namespace" in roleRef:
                     roleRef.pop("namespace")
                 if "apiGroup" in roleRef and roleRef["apiGroup"] in body["apiVersion"]:
                     roleRef.pop("apiGroup")
                 if "kind" in roleRef:
                     roleRef.pop("kind")
+            subjects = []
             for subject in body["subjects"]:
+                subject = dict(subject)
                 if "namespace" in subject:
                     subject.pop("namespace")
                 if "apiGroup" in subject and (
                     not subject["apiGroup"] or subject["apiGroup"] in body["apiVersion"]
                 ):
                     subject.pop("apiGroup")
+                subjects.append(subject)
+            body["subjects"] = subjects
 
         if body["kind"] == "ClusterRoleBinding":
             if "userNames" in body:
                 body.pop("userNames")
             if "roleRef" in body:
-                roleRef = body["roleRef"]
+                roleRef = body["roleRef"] = dict(body["roleRef"])
                 if "apiGroup" in roleRef and roleRef["apiGroup"] in body["apiVersion"]:
                     roleRef.pop("apiGroup")
                 if "kind" in roleRef:
@@ -505,7 +556,7 @@ class OpenshiftResource:
             if "groupNames" in body:
                 body.pop("groupNames")
         if body["kind"] == "Service":
-            spec = body["spec"]
+            spec = body["spec"] = dict(body["spec"])
             if spec.get("sessionAffinity") == "None":
                 spec.pop("sessionAffinity")
             if spec.get("type") == "ClusterIP":
@@ -561,7 +612,19 @@ class ResourceInventory:
         self._clusters = {}
         self._error_registered = False
         self._error_registered_clusters = {}
+        # guards the creation of the per namespace locks. resources of
+        # different namespaces never conflict, so workers adding current
+        # and desired state of different namespaces don't contend.
         self._lock = Lock()
+        self._namespace_locks: dict[tuple[str, str], Lock] = {}
+
+    def _namespace_lock(self, cluster: str, namespace: str) -> Lock:
+        key = (cluster, namespace)
+        lock = self._namespace_locks.get(key)
+        if lock is None:
+            with self._lock:
+                lock = self._namespace_locks.setdefault(key, Lock())
+        return lock
 
     def initialize_resource_type(
         self,
@@ -614,7 +677,7 @@ class ResourceInventory:
         # state-specs that lead up to add_desired calls. while this is a
         # mismatch between schema and implementation for now, it will enable
         # us to implement per-resource configuration in the future
-        with self._lock:
+        with self._namespace_lock(cluster, namespace):
             # fail if the name of the resource is not within the managed names if they are defined
             managed_names = self._clusters[cluster][namespace][resource_type][
                 "managed_names"
@@ -650,7 +713,7 @@ class ResourceInventory:
             return None
 
     def add_current(self, cluster, namespace, resource_type, name, value):
-        with self._lock:
+        with self._namespace_lock(cluster, namespace):
             current = self._clusters[cluster][namespace][resource_type]["current"]
             current[name] = value
 
@@ -0,0 +1,242 @@
+"""
+In-process implementation of `oc process --local --ignore-unknown-parameters`.
+
+The processing follows the OpenShift template processor (library-go
+pkg/template/templateprocessing) so the results match the output of
+`oc process`:
+
+* `${NAME}` references are replaced by the parameter value within strings
+  (and mapping keys)
+* a string consisting only of a `${{NAME}}` reference is replaced by the
+  JSON decoded parameter value, e.g. a number or a boolean
+* hardcoded namespaces are removed from the objects' metadata, namespaces
+  referencing a parameter are kept
+* empty parameters with `generate: expression` get a random value generated
+  from their `from` expression
+* numbers are normalized the same way the JSON round trip through `oc` does
+"""
+
+import json
+import re
+import secrets
+import string
+from collections.abc import (
+    Callable,
+    Mapping,
+)
+from decimal import Decimal
+from typing import Any
+
+STRING_PARAMETER_EXP = re.compile(r"\$\{([a-zA-Z0-9\_]+?)\}")
+NON_STRING_PARAMETER_EXP = re.compile(r"^\$\{\{([a-zA-Z0-9\_]+)\}\}$")
+PARAMETER_EXP = re.compile(r"\$\{([a-zA-Z0-9\_]+)\}")
+
+GENERATOR_EXP = re.compile(r"\[([a-zA-Z0-9\-\\]+)\](\{(\w+)\})")
+RANGE_EXP = re.compile(r"([\\]?[a-zA-Z0-9]\-?[a-zA-Z0-9]?)")
+EXPRESSION_EXP = re.compile(r"\[(\\w|\\d|\\a|\\A)|([a-zA-Z0-9]\-[a-zA-Z0-9])+\]")
+SYMBOLS = "~!@#$%^&*()-_+={}[]\\|<,>.?/\"';:`"
+ASCII = string.ascii_uppercase + string.ascii_lowercase + string.digits + SYMBOLS
+EXPRESSION_CLASSES = {
+    "\\w": string.ascii_letters + string.digits + "_",
+    "\\d": string.digits,
+    "\\a": string.ascii_letters,
+    "\\A": SYMBOLS,
+}
+MAX_GENERATED_LENGTH = 255
+
+
+class TemplateProcessingError(Exception):
+    pass
+
+
+class UnsupportedTemplateError(TemplateProcessingError):
+    """Raised for templates using features only `oc process` supports."""
+
+
+def _go_number(value: str) -> int | float:
+    # oc decodes substituted values into float64 and encodes them with the
+    # shortest representation, e.g. 1.0 -> 1 and 2**64 -> 18446744073709552000
+    number = float(value)
+    if number.is_integer() and abs(number) < 1e21:
+        return int(Decimal(repr(number)))
+    return number
+
+
+def _sorted_object(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    obj = dict(pairs)
+    return {k: obj[k] for k in sorted(obj)}
+
+
+def _reject_constant(value: str) -> Any:
+    raise ValueError(f"invalid JSON value {value}")
+
+
+def _decode_non_string(value: str) -> Any:
+    try:
+        return json.loads(
+            value,
+            parse_int=_go_number,
+            parse_float=_go_number,
+            parse_constant=_reject_constant,
+            object_pairs_hook=_sorted_object,
+        )
+    except ValueError:
+        # e.g. an unquoted string value
+        return value
+
+
+def _normalize_float(value: float) -> int | float:
+    # integral floats are encoded without a fraction by oc
+    if value.is_integer() and abs(value) < 1e21:
+        return int(value)
+    return value
+
+
+def _alphabet_slice(start: str, end: str) -> str:
+    left = ASCII.find(start)
+    right = ASCII.rfind(end)
+    if left < 0 or right < 0 or left > right:
+        raise TemplateProcessingError(f"invalid range specified: {start}-{end}")
+    return ASCII[left : right + 1]
+
+
+def generate_expression_value(expression: str) -> str:
+    """
+    Replaces every `[ranges]{length}` part of an expression with random
+    characters of the ranges, e.g. `[a-zA-Z0-9]{16}` or `\\w{8}`.
+    """
+    while match := GENERATOR_EXP.search(expression):
+        part = match.group(0)
+        ranges = part[: part.rfind("{")]
+        if not EXPRESSION_EXP.search(ranges):
+            raise TemplateProcessingError(f"malformed expression syntax: {ranges}")
+        try:
+            length = int(match.group(3))
+        except ValueError:
+            length = 0
+        if not 0 < length <= MAX_GENERATED_LENGTH:
+            raise TemplateProcessingError(
+                f"range must be within [1-{MAX_GENERATED_LENGTH}] characters "
+                f"({length})"
+            )
+        alphabet = ""
+        for r in RANGE_EXP.findall(ranges):
+            if r in EXPRESSION_CLASSES:
+                alphabet += EXPRESSION_CLASSES[r]
+            elif len(r) == 3:
+                alphabet += _alphabet_slice(r[0], r[2])
+            else:
+                alphabet += r
+        alphabet = "".join(dict.fromkeys(alphabet))
+        generated = "".join(secrets.choice(alphabet) for _ in range(length))
+        expression = expression.replace(part, generated, 1)
+    return expression
+
+
+def _parameter_values(
+    template: Mapping[str, Any], parameters: Mapping[str, Any]
+) -> dict[str, str]:
+    values: dict[str, str] = {}
+    for i, param in enumerate(template.get("parameters") or []):
+        name = param.get("name")
+        value = param.get("value") or ""
+        generate = param.get("generate") or ""
+        if not isinstance(value, str):
+            raise TemplateProcessingError(
+                f"template.parameters[{i}]: value of parameter {name} is not a string"
+            )
+        if name in parameters:
+            # supplied values disable the generation of a value
+            value = str(parameters[name])
+            generate = ""
+        if not value and generate:
+            if generate != "expression":
+                raise TemplateProcessingError(
+                    f"template.parameters[{i}]: Not found: unknown generator "
+                    f"{generate} of parameter {name}"
+                )
+            value = generate_expression_value(param.get("from") or "")
+        if not value and param.get("required"):
+            raise TemplateProcessingError(
+                f"template.parameters[{i}]: Required value: template.parameters"
+                f"[{i}]: parameter {name} is required and must be specified"
+            )
+        values[name] = value
+    return values
+
+
+def _substitute(values: Mapping[str, str], value: str) -> tuple[str, bool]:
+    """
+    Returns the substituted value and whether it remains a string.
+
+    Like library-go's EvaluateParameterSubstitution, references are found
+    in the original value and each one replaces the first occurrence of the
+    reference in the partly substituted value. A reference that also
+    appears in an earlier parameter value can therefore replace that one.
+    """
+    out = value
+    for match in STRING_PARAMETER_EXP.finditer(value):
+        if (name := match.group(1)) in values:
+            out = out.replace(match.group(0), values[name], 1)
+    if match := NON_STRING_PARAMETER_EXP.match(value):
+        if (name := match.group(1)) in values:
+            return out.replace(match.group(0), values[name], 1), False
+    return out, True
+
+
+def _key(key: Any) -> str:
+    # keys are strings after the JSON round trip through oc
+    return key if isinstance(key, str) else json.dumps(key)
+
+
+def _visit(obj: Any, substitute: Callable[[str], tuple[str, bool]]) -> Any:
+    if isinstance(obj, str):
+        value, as_string = substitute(obj)
+        return value if as_string else _decode_non_string(value)
+    if isinstance(obj, Mapping):
+        # oc returns the mapping keys sorted
+        visited = {
+            substitute(_key(k))[0]: _visit(v, substitute) for k, v in obj.items()
+        }
+        return {k: visited[k] for k in sorted(visited)}
+    if isinstance(obj, list | tuple):
+        return [_visit(item, substitute) for item in obj]
+    if isinstance(obj, float):
+        return _normalize_float(obj)
+    return obj
+
+
+def _strip_namespace(obj: Mapping[str, Any]) -> dict[str, Any]:
+    metadata = obj.get("metadata")
+    if not isinstance(metadata, Mapping):
+        return dict(obj)
+    namespace = metadata.get("namespace")
+    if not namespace or PARAMETER_EXP.search(str(namespace)):
+        return dict(obj)
+    return {
+        **obj,
+        "metadata": {k: v for k, v in metadata.items() if k != "namespace"},
+    }
+
+
+def process_template(
+    template: Mapping[str, Any], parameters: Mapping[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """
+    Processes an OpenShift Template and returns the resulting objects, like
+    `oc process --local --ignore-unknown-parameters -f - KEY=VALUE ...`.
+    Unknown parameters are ignored.
+    """
+    if template.get("labels"):
+        raise UnsupportedTemplateError("template labels are not supported")
+    values = _parameter_values(template, parameters or {})
+
+    def substitute(value: str) -> tuple[str, bool]:
+        return _substitute(values, value)
+
+    items = []
+    for i, obj in enumerate(template.get("objects") or []):
+        if not isinstance(obj, Mapping) or not obj.get("kind"):
+            raise TemplateProcessingError(f"item[{i}]: Object 'Kind' is missing")
+        items.append(_visit(_strip_namespace(obj), substitute))
+    return items
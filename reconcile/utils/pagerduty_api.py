@@ -1,10 +1,13 @@
 import logging
+import threading
+import time
 from collections.abc import (
     Callable,
     Iterable,
 )
 from datetime import datetime as dt
 from datetime import timedelta
+from functools import partial
 from typing import (
     Protocol,
 )
@@ -12,7 +15,10 @@ from typing import (
 import pypd
 import requests
 from pydantic import BaseModel
-from sretoolbox.utils import retry
+from sretoolbox.utils import (
+    retry,
+    threaded,
+)
 
 from reconcile.utils.secret_reader import (
     HasSecret,
@@ -67,15 +73,22 @@ class PagerDutyConfig(BaseModel):
 class PagerDutyApi:
     """Wrapper around PagerDuty API calls"""
 
+    # on-call users are rendered for this window, so they are cached for it
+    ONCALL_CACHE_SECONDS = 60
+
     def __init__(self, token: str, init_users: bool = True) -> None:
         pypd.api_key = token
+        self._lock = threading.Lock()
+        self._oncall: dict[tuple[str, str], tuple[float, list[str]]] = {}
         if init_users:
             self.init_users()
         else:
             self.users: list[pypd.User] = []
+            self._users_by_id: dict[str, pypd.User] = {}
 
     def init_users(self) -> None:
         self.users = pypd.User.find(limit=100)
+        self._users_by_id = {user.id: user for user in self.users}
 
     def get_pagerduty_users(
         self, resource_type: str, resource_id: str
@@ -84,23 +97,47 @@ class PagerDutyApi:
 
         try:
             if resource_type == "schedule":
-                users = self.get_schedule_users(resource_id, now)
+                users = self._cached(
+                    resource_type,
+                    resource_id,
+                    partial(self.get_schedule_users, resource_id, now),
+                )
             elif resource_type == "escalationPolicy":
-                users = self.get_escalation_policy_users(resource_id, now)
+                users = self._cached(
+                    resource_type,
+                    resource_id,
+                    partial(self.get_escalation_policy_users, resource_id, now),
+                )
         except requests.exceptions.HTTPError as e:
             logging.error(str(e))
             raise PagerDutyApiException(str(e)) from e
 
         return users
 
-    def get_user(self, user_id: str) -> str:
-        for user in self.users:
-            if user.id == user_id:
-                return user.email.split("@")[0]
+    def _cached(
+        self, resource_type: str, resource_id: str, fetch: Callable[[], list[str]]
+    ) -> list[str]:
+        """Return the cached on-call users of a resource or fetch them."""
+        key = (resource_type, resource_id)
+        with self._lock:
+            cached = self._oncall.get(key)
+        if cached and time.monotonic() - cached[0] < self.ONCALL_CACHE_SECONDS:
+            return list(cached[1])
+        fetched_at = time.monotonic()
+        users = fetch()
+        with self._lock:
+            self._oncall[key] = (fetched_at, users)
+        return list(users)
 
-        # handle for users not initiated
-        user = pypd.User.fetch(user_id)
-        self.users.append(user)
+    def get_user(self, user_id: str) -> str:
+        with self._lock:
+            user = self._users_by_id.get(user_id)
+        if user is None:
+            # handle for users not initiated
+            user = pypd.User.fetch(user_id)
+            with self._lock:
+                self.users.append(user)
+                self._users_by_id[user_id] = user
         return user.email.split("@")[0]
 
     def get_schedule_users(self, schedule_id: str, now: dt) -> list[pypd.User]:
@@ -127,7 +164,12 @@ class PagerDutyApi:
             for target in targets:
                 target_type = target["type"]
                 if target_type == "schedule_reference":
-                    schedule_users = self.get_schedule_users(target["id"], now)
+                    schedule_id = target["id"]
+                    schedule_users = self._cached(
+                        "schedule",
+                        schedule_id,
+                        partial(self.get_schedule_users, schedule_id, now),
+                    )
                     users.extend(schedule_users)
                 elif target_type == "user_reference":
                     users.append(self.get_user(target["id"]))
@@ -162,6 +204,44 @@ class PagerDutyMap:
         """
         return self.pd_apis[name]
 
+    def _resolve(self, key: tuple[str, str, str]) -> None:
+        instance_name, resource_type, resource_id = key
+        self.get(instance_name).get_pagerduty_users(resource_type, resource_id)
+
+    def prefetch(
+        self, targets: Iterable[PagerDutyTarget], thread_pool_size: int = 10
+    ) -> None:
+        """Resolve the on-call users of many targets concurrently.
+
+        Every schedule and escalation policy is fetched once, even if many
+        targets reference it. The results are cached by the PagerDutyApi
+        instances, so resolving the targets afterwards doesn't call the API
+        again. Failures are not cached, they are raised when the target is
+        resolved again.
+
+        Args:
+            targets (Iterable[PagerDutyTarget]): targets to resolve
+            thread_pool_size (int): number of concurrent requests
+        """
+        keys = {
+            (target.instance.name, *get_pagerduty_resource(target))
+            for target in targets
+            if target.instance.name in self.pd_apis
+            and (target.schedule_id or target.escalation_policy_id)
+        }
+        threaded.run(self._resolve, keys, thread_pool_size, return_exceptions=True)
+
+
+def get_pagerduty_resource(target: PagerDutyTarget) -> tuple[str, str]:
+    """Return the resource type and id of a PagerDuty target."""
+    if target.escalation_policy_id is not None:
+        return "escalationPolicy", target.escalation_policy_id
+    if target.schedule_id is not None:
+        return "schedule", target.schedule_id
+    raise PagerDutyTargetException(
+        f"pagerduty {target.name}: Either schedule_id or escalation_policy_id must be set!"
+    )
+
 
 def get_pagerduty_map(
     secret_reader: SecretReader,
@@ -201,16 +281,7 @@ def get_usernames_from_pagerduty(
     all_output_usernames = []
     all_pagerduty_names = [get_pagerduty_name(u) for u in users]
     for pagerduty in pagerduties:
-        if pagerduty.schedule_id is None and pagerduty.escalation_policy_id is None:
-            raise PagerDutyTargetException(
-                f"pagerduty {pagerduty.name}: Either schedule_id or escalation_policy_id must be set!"
-            )
-        if pagerduty.schedule_id is not None:
-            pd_resource_type = "schedule"
-            pd_resource_id = pagerduty.schedule_id
-        if pagerduty.escalation_policy_id is not None:
-            pd_resource_type = "escalationPolicy"
-            pd_resource_id = pagerduty.escalation_policy_id
+        pd_resource_type, pd_resource_id = get_pagerduty_resource(pagerduty)
 
         pd = pagerduty_map.get(pagerduty.instance.name)
         pagerduty_names = pd.get_pagerduty_users(pd_resource_type, pd_resource_id)
@@ -1,10 +1,14 @@
+import hashlib
+import json
 import logging
 import multiprocessing
+import pickle
+import threading
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
+from multiprocessing.connection import Connection
 from typing import Any
 
-from deepdiff import DeepHash
 from jsonpath_ng.ext.parser import parse
 
 from reconcile.change_owners.diff import (
@@ -47,6 +51,78 @@ class DesiredStateDiff:
         return not self.diff_found
 
 
+@dataclass(frozen=True)
+class DigestTree:
+    """
+    Merkle tree of a desired state. Every mapping node keeps the digests of
+    its children, so unchanged subtrees of two states can be found by
+    comparing digests instead of walking the data.
+    """
+
+    digest: str
+    children: dict[Any, "DigestTree"] | None = None
+    """
+    The digest trees of the values of a mapping, None for other nodes.
+    """
+
+
+def _sha256(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def build_digest_tree(obj: Any) -> DigestTree:
+    """
+    Calculates a canonical JSON Merkle digest for a desired state. Mapping
+    keys are sorted and iterables are compared regardless of the order and
+    repetition of their items, which matches the equality semantics of
+    `deepdiff.DeepHash`.
+    """
+    if isinstance(obj, Mapping):
+        children = {key: build_digest_tree(value) for key, value in obj.items()}
+        entries = sorted(f"{_json(key)}={c.digest}" for key, c in children.items())
+        return DigestTree(digest=_sha256("dict", *entries), children=children)
+    if isinstance(obj, list | tuple | set | frozenset):
+        items = sorted({build_digest_tree(item).digest for item in obj})
+        return DigestTree(digest=_sha256("list", *items))
+    return DigestTree(digest=_sha256("value", _json(obj)))
+
+
+def prune_unchanged_subtrees(
+    previous: Any,
+    current: Any,
+    previous_tree: DigestTree,
+    current_tree: DigestTree,
+) -> tuple[Any, Any]:
+    """
+    Removes mapping entries that are equal in both states. Paths of the
+    remaining entries are kept as they are, so diffs extracted from the
+    pruned states are the same as diffs extracted from the full states.
+    """
+    if previous_tree.children is None or current_tree.children is None:
+        return previous, current
+    pruned_previous: dict[Any, Any] = {}
+    pruned_current: dict[Any, Any] = {}
+    for key, previous_child in previous_tree.children.items():
+        current_child = current_tree.children.get(key)
+        if current_child is None:
+            pruned_previous[key] = previous[key]
+        elif previous_child.digest != current_child.digest:
+            pruned_previous[key], pruned_current[key] = prune_unchanged_subtrees(
+                previous[key], current[key], previous_child, current_child
+            )
+    for key in current_tree.children.keys() - previous_tree.children.keys():
+        pruned_current[key] = current[key]
+    return pruned_previous, pruned_current
+
+
 def find_changed_shards(
     diffs: Iterable[Diff],
     previous_desired_state: Mapping[str, Any],
@@ -78,35 +154,133 @@ EXTRACT_TASK_RESULT_KEY_DIFFS = "diffs"
 EXTRACT_TASK_RESULT_KEY_ERROR = "error"
 
 
+class DiffDetectionTimeout(Exception):
+    """
+    Raised when the fine grained diff detection takes too long.
+    """
+
+
+class DiffDetectionFailure(Exception):
+    """
+    Raised when the fine grained diff detection fails.
+    """
+
+
 def _extract_diffs_task(
     extraction_function: Callable[
         [Mapping[str, Any], Mapping[str, Any]], Iterable[Diff]
     ],
     previous_desired_state: Mapping[str, Any],
     current_desired_state: Mapping[str, Any],
-    return_value: dict,
-) -> None:
+) -> tuple[str, Any]:
     """
-    A multiprocessing task that extracts diffs from two desired states
-    and stores them in a return value dictionary.
+    Extracts diffs from two desired states and returns them as a tagged
+    result, so errors can be handed back to the calling process.
     """
     try:
-        diffs = extraction_function(previous_desired_state, current_desired_state)
-        return_value[EXTRACT_TASK_RESULT_KEY_DIFFS] = diffs
+        diffs = list(extraction_function(previous_desired_state, current_desired_state))
+        return EXTRACT_TASK_RESULT_KEY_DIFFS, diffs
     except BaseException as e:
-        return_value[EXTRACT_TASK_RESULT_KEY_ERROR] = e
+        return EXTRACT_TASK_RESULT_KEY_ERROR, e
 
 
-class DiffDetectionTimeout(Exception):
+def _diff_worker_loop(conn: Connection) -> None:
     """
-    Raised when the fine grained diff detection takes too long.
+    Main loop of a diff worker process. Every request is a single pickled
+    buffer containing the extraction function and both desired states.
     """
+    while True:
+        try:
+            request = conn.recv_bytes()
+        except EOFError:
+            return
+        try:
+            result = _extract_diffs_task(*pickle.loads(request))
+        except Exception as e:
+            result = EXTRACT_TASK_RESULT_KEY_ERROR, e
+        try:
+            response = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            # e.g. an unpicklable exception raised by the extraction function
+            response = pickle.dumps((
+                EXTRACT_TASK_RESULT_KEY_ERROR,
+                DiffDetectionFailure(f"unable to return diff extraction result: {e}"),
+            ))
+        conn.send_bytes(response)
 
 
-class DiffDetectionFailure(Exception):
+class _DiffWorker:
     """
-    Raised when the fine grained diff detection fails.
+    A long running process that extracts diffs on request.
+    """
+
+    def __init__(self) -> None:
+        self._conn, worker_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_diff_worker_loop, args=(worker_conn,), daemon=True
+        )
+        self.process.start()
+        worker_conn.close()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def extract(self, request: bytes, timeout_seconds: int) -> tuple[str, Any]:
+        self._conn.send_bytes(request)
+        if not self._conn.poll(timeout_seconds):
+            raise DiffDetectionTimeout()
+        return pickle.loads(self._conn.recv_bytes())
+
+    def close(self) -> None:
+        self._conn.close()
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+
+
+class _DiffWorkerPool:
     """
+    Keeps diff workers warm between diff extractions. A worker is only
+    replaced when it timed out or died, so the process startup costs are
+    paid once instead of for every integration.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: list[_DiffWorker] = []
+
+    def _acquire(self) -> _DiffWorker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.is_alive():
+                    return worker
+                worker.close()
+        return _DiffWorker()
+
+    def _release(self, worker: _DiffWorker) -> None:
+        with self._lock:
+            self._idle.append(worker)
+
+    def extract(self, request: bytes, timeout_seconds: int) -> tuple[str, Any]:
+        worker = self._acquire()
+        try:
+            result = worker.extract(request, timeout_seconds)
+        except BaseException:
+            # the worker is stuck or died, it can't be reused
+            worker.close()
+            raise
+        self._release(worker)
+        return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.close()
+
+
+_diff_worker_pool = _DiffWorkerPool()
 
 
 def extract_diffs_with_timeout(
@@ -133,42 +307,38 @@ def extract_diffs_with_timeout(
         * experience has shown that the diff extraction process yields the most
           valueable results when it is fast. if it takes too long, the results
           yield contain too many diffs to be meaningful for followup processing
+
+    The worker processes are kept warm between calls and the desired states
+    are sent as a single pickled buffer over a pipe. A worker that reaches
+    the timeout is terminated and replaced on the next call.
     """
-    m = multiprocessing.Manager()
-    result_value = m.dict()
-
-    process = multiprocessing.Process(
-        target=_extract_diffs_task,
-        args=(
-            extraction_function,
-            previous_desired_state,
-            current_desired_state,
-            result_value,
-        ),
-    )
-    process.start()
-    process.join(timeout_seconds)
-    if process.is_alive():
+    try:
+        request = pickle.dumps(
+            (extraction_function, previous_desired_state, current_desired_state),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    except Exception as e:
+        raise DiffDetectionFailure("unable to serialize desired states") from e
+    try:
+        result_type, result = _diff_worker_pool.extract(request, timeout_seconds)
+    except DiffDetectionTimeout:
         logging.info(
             f"timeout {timeout_seconds}s reached to find fine grained diffs. "
             "no shard detection or sharded runs will be performed."
         )
-        process.terminate()
-        process.join()
-        raise DiffDetectionTimeout()
-
-    if EXTRACT_TASK_RESULT_KEY_DIFFS in result_value:
-        return result_value[EXTRACT_TASK_RESULT_KEY_DIFFS]
-
-    original_error = result_value.get(EXTRACT_TASK_RESULT_KEY_ERROR)
-    if original_error:
-        raise DiffDetectionFailure() from original_error
+        raise
+    except (EOFError, OSError) as e:
+        # not every error situation of the diff extraction process
+        # will result in an exception, e.g. the worker might get killed.
+        # in those cases, we raise at least a generic exception to
+        # indicate that something went wrong
+        raise DiffDetectionFailure(
+            "unknown error during fine grained diff detection"
+        ) from e
 
-    # not every error situation of the diff extraction process
-    # will result in an exception. the lack of a result is an error
-    # indicator as well. in those cases, we raise at least
-    # a generic exception to indicate that something went wrong
-    raise DiffDetectionFailure("unknown error during fine grained diff detection")
+    if result_type == EXTRACT_TASK_RESULT_KEY_DIFFS:
+        return result
+    raise DiffDetectionFailure() from result
 
 
 def build_desired_state_diff(
@@ -182,21 +352,30 @@ def build_desired_state_diff(
     shards introduced by the change between the two desired states.
     """
     # is there even a difference?
-    previous_hash = DeepHash(previous_desired_state)
-    current_hash = DeepHash(current_desired_state)
-    desired_state_diff_found = previous_hash.get(
-        previous_desired_state
-    ) != current_hash.get(current_desired_state)
+    previous_tree = build_digest_tree(previous_desired_state)
+    current_tree = build_digest_tree(current_desired_state)
+    desired_state_diff_found = previous_tree.digest != current_tree.digest
 
     shards = set()
     exract_diff_timeout_seconds = 10
     try:
         if desired_state_diff_found and sharding_config:
-            # detect shards based on fine grained diffs
+            # detect shards based on fine grained diffs. only the changed
+            # subtrees are handed to the (expensive) diff extraction
+            changed_previous, changed_current = prune_unchanged_subtrees(
+                previous_desired_state,
+                current_desired_state,
+                previous_tree,
+                current_tree,
+            )
+            if not changed_previous or not changed_current:
+                # an empty side would be treated as an added/removed file
+                changed_previous = previous_desired_state
+                changed_current = current_desired_state
             diffs = extract_diffs_with_timeout(
                 extraction_function=extract_diffs,
-                previous_desired_state=previous_desired_state,
-                current_desired_state=current_desired_state,
+                previous_desired_state=changed_previous,
+                current_desired_state=changed_current,
                 timeout_seconds=exract_diff_timeout_seconds,
             )
             changed_shards = find_changed_shards(
@@ -0,0 +1,79 @@
+import os
+import threading
+from collections.abc import Callable
+from typing import (
+    Any,
+    TypeVar,
+)
+
+from reconcile.utils.disk_cache import DiskCache
+
+# persist fetched repository contents across runs if set
+SAAS_CONTENT_CACHE_DIR = os.environ.get("SAAS_CONTENT_CACHE_DIR")
+SAAS_CONTENT_CACHE_MAX_SIZE_MB = int(
+    os.environ.get("SAAS_CONTENT_CACHE_MAX_SIZE_MB") or 512
+)
+
+T = TypeVar("T")
+
+
+def init_content_disk_cache() -> DiskCache | None:
+    """Return the on-disk content cache if SAAS_CONTENT_CACHE_DIR is set."""
+    if not SAAS_CONTENT_CACHE_DIR:
+        return None
+    return DiskCache(
+        SAAS_CONTENT_CACHE_DIR,
+        max_size_bytes=SAAS_CONTENT_CACHE_MAX_SIZE_MB * 1024 * 1024,
+    )
+
+
+class ContentCache:
+    """
+    Caches values fetched from git repositories for the duration of a run.
+
+    Concurrent requests for the same key are single-flighted: only the
+    first caller fetches the value, the others wait for its result. If the
+    fetch fails, the next waiting caller tries again. Values of immutable
+    keys (e.g. file contents of a commit sha) can be persisted in a
+    DiskCache to be reused by later runs.
+    """
+
+    def __init__(self, disk_cache: DiskCache | None = None) -> None:
+        self._disk_cache = disk_cache
+        self._lock = threading.Lock()
+        self._values: dict[str, Any] = {}
+        self._in_flight: dict[str, threading.Event] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_fetch(
+        self, key: str, fetch: Callable[[], T], persist: bool = False
+    ) -> T:
+        while True:
+            with self._lock:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+                in_flight = self._in_flight.get(key)
+                if in_flight is None:
+                    in_flight = self._in_flight[key] = threading.Event()
+                    break
+            in_flight.wait()
+
+        try:
+            value = None
+            if persist and self._disk_cache:
+                value = self._disk_cache.get(key)
+            if value is None:
+                with self._lock:
+                    self.misses += 1
+                value = fetch()
+                if persist and self._disk_cache:
+                    self._disk_cache.set(key, value)
+            with self._lock:
+                self._values[key] = value
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.set()
@@ -0,0 +1,155 @@
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from reconcile.utils import metrics
+from reconcile.utils.disk_cache import (
+    DiskCache,
+    cache_key,
+)
+from reconcile.utils.instrumented_wrappers import (
+    INTEGRATION_NAME,
+    SHARD_ID,
+    SHARDS,
+    InstrumentedImage,
+)
+
+# digests of mutable tags are only trusted for this long
+SAAS_IMAGE_DIGEST_CACHE_TTL_SECONDS = int(
+    os.environ.get("SAAS_IMAGE_DIGEST_CACHE_TTL_SECONDS") or 300
+)
+# persist resolved digests across runs if set
+SAAS_IMAGE_DIGEST_CACHE_DIR = os.environ.get("SAAS_IMAGE_DIGEST_CACHE_DIR")
+SAAS_IMAGE_DIGEST_CACHE_MAX_SIZE_MB = int(
+    os.environ.get("SAAS_IMAGE_DIGEST_CACHE_MAX_SIZE_MB") or 64
+)
+
+
+class ImageDigestCache:
+    """
+    Caches the digests of container images resolved from registries.
+
+    Entries are keyed by (registry, repository, reference). References by
+    tag expire after `ttl_seconds`, as tags can be moved to another image,
+    while references by digest are immutable and never expire. Only images
+    that exist are cached. Entries can be persisted in a DiskCache to be
+    reused by later runs.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = SAAS_IMAGE_DIGEST_CACHE_TTL_SECONDS,
+        disk_cache: DiskCache | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._disk_cache = disk_cache
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._hits = metrics.cache_hits.labels(
+            integration=INTEGRATION_NAME, shards=SHARDS, shard_id=SHARD_ID
+        )
+        self._misses = metrics.cache_misses.labels(
+            integration=INTEGRATION_NAME, shards=SHARDS, shard_id=SHARD_ID
+        )
+
+    @staticmethod
+    def key(image: InstrumentedImage) -> str:
+        # entries may have been added by a user with different permissions
+        return cache_key(
+            "image-digest",
+            image.registry,
+            image.repository,
+            image.image,
+            image.tag or image._cache_digest,
+            image.username,
+        )
+
+    def _get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self._disk_cache:
+            entry = self._disk_cache.get(key)
+        if entry is None:
+            return None
+        if entry["expires"] is not None and entry["expires"] <= self._clock():
+            return None
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def _set(self, key: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+        if self._disk_cache:
+            self._disk_cache.set(key, entry)
+
+    def resolve(self, image: InstrumentedImage) -> bool:
+        """
+        Returns whether the image exists and sets its digest, fetching the
+        manifest from the registry only if there is no valid entry.
+        """
+        key = self.key(image)
+        if entry := self._get(key):
+            self._hits.inc()
+            image._cache_digest = entry["digest"]
+            return True
+
+        self._misses.inc()
+        if image.manifest is None:
+            return False
+        if image._cache_digest is None:
+            # the registry didn't return a Docker-Content-Digest header
+            return True
+        expires = None if image.tag is None else self._clock() + self._ttl_seconds
+        self._set(key, {"digest": image._cache_digest, "expires": expires})
+        return True
+
+
+class CachedImage(InstrumentedImage):
+    """
+    Image that resolves its existence and digest through an
+    ImageDigestCache instead of asking the registry every time.
+    """
+
+    def __init__(
+        self, *args: Any, digest_cache: ImageDigestCache, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._digest_cache = digest_cache
+        self._exists: bool | None = None
+
+    def _resolve(self) -> bool:
+        if self._exists is None:
+            self._exists = self._digest_cache.resolve(self)
+        return self._exists
+
+    @property
+    def digest(self) -> str:
+        self._resolve()
+        return super().digest
+
+    def __bool__(self) -> bool:
+        return self._resolve()
+
+
+_image_digest_cache: ImageDigestCache | None = None
+_image_digest_cache_lock = threading.Lock()
+
+
+def get_image_digest_cache() -> ImageDigestCache:
+    """Return the process wide image digest cache."""
+    global _image_digest_cache  # noqa: PLW0603
+    with _image_digest_cache_lock:
+        if _image_digest_cache is None:
+            disk_cache = None
+            if SAAS_IMAGE_DIGEST_CACHE_DIR:
+                disk_cache = DiskCache(
+                    SAAS_IMAGE_DIGEST_CACHE_DIR,
+                    max_size_bytes=SAAS_IMAGE_DIGEST_CACHE_MAX_SIZE_MB * 1024 * 1024,
+                )
+            _image_digest_cache = ImageDigestCache(disk_cache=disk_cache)
+        return _image_digest_cache
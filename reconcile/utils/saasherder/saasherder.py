@@ -40,12 +40,13 @@ from sretoolbox.utils import (
 from reconcile.github_org import get_default_config
 from reconcile.status import RunningState
 from reconcile.utils import helm
+from reconcile.utils.disk_cache import cache_key
 from reconcile.utils.gitlab_api import GitLabApi
 from reconcile.utils.jenkins_api import JenkinsApi
 from reconcile.utils.jjb_client import JJB
 from reconcile.utils.oc import (
-    OCLocal,
     StatusCodeError,
+    oc_process,
 )
 from reconcile.utils.openshift_resource import OpenshiftResource as OR
 from reconcile.utils.openshift_resource import (
@@ -58,6 +59,14 @@ from reconcile.utils.promotion_state import (
     PromotionData,
     PromotionState,
 )
+from reconcile.utils.saasherder.content_cache import (
+    ContentCache,
+    init_content_disk_cache,
+)
+from reconcile.utils.saasherder.image_cache import (
+    CachedImage,
+    get_image_digest_cache,
+)
 from reconcile.utils.saasherder.interfaces import (
     SaasFile,
     SaasParentSaasPromotion,
@@ -102,6 +111,11 @@ Resource = dict[str, Any]
 Resources = list[Resource]
 
 
+def _as_text(content: str | bytes) -> str:
+    # cached contents must be JSON serializable
+    return content.decode("utf-8") if isinstance(content, bytes) else content
+
+
 class SaasHerder:  # pylint: disable=too-many-public-methods
     """Wrapper around SaaS deployment actions."""
 
@@ -122,6 +136,7 @@ class SaasHerder:  # pylint: disable=too-many-public-methods
         all_saas_files: Iterable[SaasFile] | None = None,
     ):
         self.error_registered = False
+        self._content_cache = ContentCache(init_content_disk_cache())
         self.saas_files = saas_files
         self.repo_urls = self._collect_repo_urls()
         self.image_patterns = self._collect_image_patterns()
@@ -755,28 +770,51 @@ class SaasHerder:  # pylint: disable=too-many-public-methods
         self, url: str, path: str, ref: str, github: Github
     ) -> tuple[Any, str]:
         commit_sha = self._get_commit_sha(url, ref, github)
+        # file contents of a commit never change, share them between targets
+        content = self._content_cache.get_or_fetch(
+            cache_key("file", url, path, commit_sha),
+            lambda: self._fetch_file_contents(url, path, commit_sha, github),
+            persist=True,
+        )
+        return yaml.safe_load(content), commit_sha
 
+    def _fetch_file_contents(
+        self, url: str, path: str, commit_sha: str, github: Github
+    ) -> str:
         if "github" in url:
             repo_name = url.rstrip("/").replace("https://github.com/", "")
             repo = github.get_repo(repo_name)
-            content = self._get_file_contents_github(repo, path, commit_sha)
-        elif "gitlab" in url:
+            return self._get_file_contents_github(repo, path, commit_sha)
+        if "gitlab" in url:
             if not self.gitlab:
                 raise Exception("gitlab is not initialized")
             project = self.gitlab.get_project(url)
             f = project.files.get(file_path=path.lstrip("/"), ref=commit_sha)
-            content = f.decode()
-        else:
-            raise Exception(f"Only GitHub and GitLab are supported: {url}")
-
-        return yaml.safe_load(content), commit_sha
+            return _as_text(f.decode())
+        raise Exception(f"Only GitHub and GitLab are supported: {url}")
 
     @retry()
     def _get_directory_contents(
         self, url: str, path: str, ref: str, github: Github
     ) -> tuple[list[Any], str]:
         commit_sha = self._get_commit_sha(url, ref, github)
+        contents = self._content_cache.get_or_fetch(
+            cache_key("directory", url, path, commit_sha),
+            lambda: self._fetch_directory_contents(url, path, commit_sha, github),
+            persist=True,
+        )
         resources: list[Any] = []
+        for content in contents:
+            if "github" in url:
+                resources.extend(yaml.safe_load_all(content))
+            else:
+                resources.append(yaml.safe_load(content))
+        return resources, commit_sha
+
+    def _fetch_directory_contents(
+        self, url: str, path: str, commit_sha: str, github: Github
+    ) -> list[str]:
+        contents: list[str] = []
         if "github" in url:
             repo_name = url.rstrip("/").replace("https://github.com/", "")
             repo = github.get_repo(repo_name)
@@ -785,11 +823,9 @@ class SaasHerder:  # pylint: disable=too-many-public-methods
                 raise Exception(f"Path {path} and sha {commit_sha} is a file!")
             for f in directory:
                 file_path = os.path.join(path, f.name)
-                file_contents_decoded = self._get_file_contents_github(
-                    repo, file_path, commit_sha
+                contents.append(
+                    self._get_file_contents_github(repo, file_path, commit_sha)
                 )
-                result_resources = yaml.safe_load_all(file_contents_decoded)
-                resources.extend(result_resources)
         elif "gitlab" in url:
             if not self.gitlab:
                 raise Exception("gitlab is not initialized")
@@ -800,15 +836,21 @@ class SaasHerder:  # pylint: disable=too-many-public-methods
                 file_contents = project.files.get(
                     file_path=item["path"], ref=commit_sha
                 )
-                resource = yaml.safe_load(file_contents.decode())
-                resources.append(resource)
+                contents.append(_as_text(file_contents.decode()))
         else:
             raise Exception(f"Only GitHub and GitLab are supported: {url}")
 
-        return resources, commit_sha
+        return contents
 
-    @retry()
     def _get_commit_sha(self, url: str, ref: str, github: Github) -> str:
+        # a ref is resolved once per run, so all targets use the same commit
+        return self._content_cache.get_or_fetch(
+            cache_key("commit_sha", url, ref),
+            lambda: self._fetch_commit_sha(url, ref, github),
+        )
+
+    @retry()
+    def _fetch_commit_sha(self, url: str, ref: str, github: Github) -> str:
         commit_sha = ""
         if "github" in url:
             repo_name = url.rstrip("/").replace("https://github.com/", "")
@@ -951,9 +993,8 @@ class SaasHerder:  # pylint: disable=too-many-public-methods
                 if need_image_digest:
                     consolidated_parameters["IMAGE_DIGEST"] = img.digest
 
-            oc = OCLocal("cluster", None, None, local=True)
             try:
-                resources = oc.process(template, consolidated_parameters)
+                resources = oc_process(template, consolidated_parameters)
             except StatusCodeError as e:
                 logging.error(f"{error_prefix} error processing template: {e!s}")
 
@@ -1102,6 +1143,9 @@ class SaasHerder:  # pylint: disable=too-many-public-methods
             logging.error(f"{error_prefix} Image is not in imagePatterns: {image}")
             return None
 
+        # image digests are shared by all threads and SaasHerder instances
+        digest_cache = get_image_digest_cache()
+
         # .dockerconfigjson
         if image_auth.docker_config:
             # we rely on the secret in vault being ordered
@@ -1113,22 +1157,24 @@ class SaasHerder:  # pylint: disable=too-many-public-methods
                     base64.b64decode(auth["auth"]).decode("utf-8").split(":")
                 )
                 with suppress(Exception):
-                    return Image(
+                    return CachedImage(
                         image,
                         username=username,
                         password=password,
                         auth_server=image_auth.auth_server,
                         timeout=REQUEST_TIMEOUT,
+                        digest_cache=digest_cache,
                     )
 
         # basic auth fallback for backwards compatibility
         try:
-            return Image(
+            return CachedImage(
                 image,
                 username=image_auth.username,
                 password=image_auth.password,
                 auth_server=image_auth.auth_server,
                 timeout=REQUEST_TIMEOUT,
+                digest_cache=digest_cache,
             )
         except Exception as e:
             logging.error(
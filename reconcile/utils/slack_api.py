@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import threading
+import time
+from collections import defaultdict
 from collections.abc import (
+    Callable,
     Iterable,
     Mapping,
     Sequence,
@@ -26,6 +32,12 @@ from reconcile.utils.metrics import slack_request
 
 MAX_RETRIES = 5
 TIMEOUT = 30
+DIRECTORY_CACHE_TTL_SECONDS = int(
+    os.environ.get("SLACK_DIRECTORY_CACHE_TTL_SECONDS", "300")
+)
+# unknown user ids are looked up one by one up to this number, beyond it the
+# whole user list is fetched again
+MAX_USER_LOOKUPS = 20
 
 
 class UserNotFoundException(Exception):
@@ -156,6 +168,127 @@ class SlackApiConfig:
         return config
 
 
+class SlackDirectory:
+    """
+    Process-wide cache of the users, channels and usergroups of a workspace,
+    shared by all SlackApi instances using the same token.
+
+    Each resource list expires `ttl` seconds after it was fetched. Changes
+    made through SlackApi are written to the cache, so they don't require
+    fetching the lists again. Items are indexed by the keys SlackApi looks
+    them up with.
+    """
+
+    INDEXED_KEYS = {
+        "users": ("name",),
+        "channels": ("name",),
+        "usergroups": ("handle",),
+    }
+
+    def __init__(
+        self,
+        ttl: float = DIRECTORY_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.lock = threading.RLock()
+        self._clock = clock
+        self._items: dict[str, dict[str, Any]] = {}
+        self._fetched_at: dict[str, float] = {}
+        self._indexes: dict[tuple[str, str], dict[Any, list[str]]] = {}
+        self._user_ids_by_email: dict[str, str] = {}
+        self._user_ids_by_enterprise_id: dict[str, str] = {}
+        self.unknown_user_ids: set[str] = set()
+
+    def get(self, resource: str) -> dict[str, Any] | None:
+        """Return the cached items of a resource by id, None if expired."""
+        with self.lock:
+            fetched_at = self._fetched_at.get(resource)
+            if fetched_at is None or self._clock() - fetched_at >= self.ttl:
+                return None
+            return self._items[resource]
+
+    def set(self, resource: str, items: dict[str, Any]) -> None:
+        with self.lock:
+            self._items[resource] = items
+            self._fetched_at[resource] = self._clock()
+            for key in self.INDEXED_KEYS.get(resource, ()):
+                self._indexes[resource, key] = defaultdict(list)
+            if resource == "users":
+                self._user_ids_by_email = {}
+                self._user_ids_by_enterprise_id = {}
+                self.unknown_user_ids = set()
+            for item in items.values():
+                self._index(resource, item)
+
+    def put(self, resource: str, item: Mapping[str, Any]) -> None:
+        """
+        Add an item to a resource that is already cached. The fields of an
+        item that is already cached are updated, API responses often carry
+        only part of an object (e.g. usergroups.update has no users).
+        """
+        with self.lock:
+            items = self._items.get(resource)
+            if items is None:
+                return
+            if old := items.get(item["id"]):
+                for key in self.INDEXED_KEYS.get(resource, ()):
+                    ids = self._indexes[resource, key].get(old.get(key))
+                    if ids and item["id"] in ids:
+                        ids.remove(item["id"])
+                item = {**old, **item}
+            items[item["id"]] = item
+            self._index(resource, item)
+
+    def invalidate(self, resource: str) -> None:
+        with self.lock:
+            self._fetched_at.pop(resource, None)
+
+    def _index(self, resource: str, item: Mapping[str, Any]) -> None:
+        for key in self.INDEXED_KEYS.get(resource, ()):
+            self._indexes[resource, key][item.get(key)].append(item["id"])
+        if resource == "users":
+            if email := item.get("profile", {}).get("email"):
+                self._user_ids_by_email[email.lower()] = item["id"]
+            if enterprise_user_id := item.get("enterprise_user", {}).get("id"):
+                self._user_ids_by_enterprise_id[enterprise_user_id] = item["id"]
+
+    def ids_by(self, resource: str, key: str, value: Any) -> list[str]:
+        with self.lock:
+            return list(self._indexes.get((resource, key), {}).get(value, []))
+
+    def user_id_by_email(self, email: str) -> str | None:
+        with self.lock:
+            return self._user_ids_by_email.get(email.lower())
+
+    def translate_user_id(self, user_id: str) -> str:
+        """Translate enterprise user id to user id"""
+        with self.lock:
+            return self._user_ids_by_enterprise_id.get(user_id, user_id)
+
+
+_directories: dict[tuple[str, str, str], SlackDirectory] = {}
+_directories_lock = threading.Lock()
+
+
+def get_directory(workspace_name: str, token: str, base_url: str) -> SlackDirectory:
+    """
+    Return the directory cache of a workspace. What a token can see differs,
+    so tokens don't share directories.
+    """
+    token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    with _directories_lock:
+        key = (base_url, workspace_name, token_hash)
+        if key not in _directories:
+            _directories[key] = SlackDirectory()
+        return _directories[key]
+
+
+def clear_directory_cache() -> None:
+    with _directories_lock:
+        _directories.clear()
+
+
 class SlackApi:
     """Wrapper around Slack API calls"""
 
@@ -188,22 +321,19 @@ class SlackApi:
         else:
             self.config = SlackApiConfig()
 
+        base_url = slack_url or WebClient.BASE_URL
         self._sc = WebClient(
             token=token,
             timeout=self.config.timeout,
-            base_url=slack_url or WebClient.BASE_URL,
+            base_url=base_url,
         )
         self._configure_client_retry()
 
-        self._results: dict[str, Any] = {}
-        self._enterprise_user_id_to_user_ids: dict[str, str] = {}
+        self._directory = get_directory(workspace_name, token, base_url)
 
         self.channel = channel
         self.chat_kwargs = chat_kwargs
 
-        self._user_groups_initialized = False
-        self.usergroups: list[dict] = []
-
         if init_usergroups:
             self._initiate_usergroups()
 
@@ -306,26 +436,38 @@ class SlackApi:
         :raises slack_sdk.errors.SlackApiError: if unsuccessful response from
         Slack API
         """
-        slack_request.labels("usergroups.list", "GET").inc()
+        with self._directory.lock:
+            if self._directory.get("usergroups") is not None:
+                return
+            slack_request.labels("usergroups.list", "GET").inc()
+
+            result = self._sc.usergroups_list(include_users=True)
+            self._directory.set(
+                "usergroups", {g["id"]: g for g in result["usergroups"]}
+            )
 
-        result = self._sc.usergroups_list(include_users=True)
-        self.usergroups = result["usergroups"]
-        self._user_groups_initialized = True
+    @property
+    def usergroups(self) -> list[dict[str, Any]]:
+        self._initiate_usergroups()
+        return list((self._directory.get("usergroups") or {}).values())
 
     def get_usergroup(self, handle: str) -> dict[str, Any]:
-        if not self._user_groups_initialized:
-            self._initiate_usergroups()
-        usergroup = [g for g in self.usergroups if g["handle"] == handle]
-        if len(usergroup) != 1:
+        self._initiate_usergroups()
+        usergroups = self._directory.get("usergroups") or {}
+        ids = self._directory.ids_by("usergroups", "handle", handle)
+        if len(ids) != 1:
             raise UsergroupNotFoundException(handle)
-        return usergroup[0]
+        return usergroups[ids[0]]
+
+    def _put_usergroup(self, response: Any) -> None:
+        if isinstance(usergroup := response.get("usergroup"), dict):
+            self._directory.put("usergroups", usergroup)
 
     def create_usergroup(self, handle: str) -> str:
         slack_request.labels("usergroups.create", "POST").inc()
 
         response = self._sc.usergroups_create(name=handle, handle=handle)
-        # Invalidate the usergroups list cache
-        self._user_groups_initialized = False
+        self._put_usergroup(response)
         return response["usergroup"]["id"]
 
     def update_usergroup(
@@ -343,9 +485,10 @@ class SlackApi:
         """
         slack_request.labels("usergroups.update", "POST").inc()
 
-        self._sc.usergroups_update(
+        response = self._sc.usergroups_update(
             usergroup=id, channels=channels_list, description=description
         )
+        self._put_usergroup(response)
 
     def update_usergroup_users(self, id: str, users_list: Sequence[str]) -> None:
         """
@@ -365,7 +508,8 @@ class SlackApi:
         try:
             slack_request.labels("usergroups.users.update", "POST").inc()
 
-            self._sc.usergroups_users_update(usergroup=id, users=users_list)
+            response = self._sc.usergroups_users_update(usergroup=id, users=users_list)
+            self._put_usergroup(response)
         except SlackApiError as e:
             # Slack can throw an invalid_users error when emptying groups, but
             # it will still empty the group (so this can be ignored).
@@ -392,10 +536,15 @@ class SlackApi:
         Slack API
         :raises UserNotFoundException: if the Slack user is not found
         """
+        email = f"{user_name}@{mail_address}"
+        if self._directory.get("users") is not None and (
+            user_id := self._directory.user_id_by_email(email)
+        ):
+            return user_id
         try:
             slack_request.labels("users.lookupByEmail", "GET").inc()
 
-            result = self._sc.users_lookupByEmail(email=f"{user_name}@{mail_address}")
+            result = self._sc.users_lookupByEmail(email=email)
         except SlackApiError as e:
             if e.response["error"] == "users_not_found":
                 raise UserNotFoundException(e.response["error"]) from None
@@ -404,85 +553,110 @@ class SlackApi:
         return result["user"]["id"]
 
     def get_channels_by_names(self, channels_names: Iterable[str]) -> dict[str, str]:
+        if isinstance(channels_names, str):
+            channels_names = [channels_names]
+        channels = self._get("channels")
         return {
-            k: v["name"]
-            for k, v in self._get("channels").items()
-            if v["name"] in channels_names
+            channel_id: channels[channel_id]["name"]
+            for name in set(channels_names)
+            for channel_id in self._directory.ids_by("channels", "name", name)
         }
 
     def get_channels_by_ids(self, channels_ids: Iterable[str]) -> dict[str, str]:
+        channels = self._get("channels")
         return {
-            k: v["name"] for k, v in self._get("channels").items() if k in channels_ids
+            channel_id: channel["name"]
+            for channel_id in channels_ids
+            if (channel := channels.get(channel_id))
         }
 
     def get_active_users_by_names(self, user_names: Iterable[str]) -> dict[str, str]:
+        users = self._get("users")
         return {
-            k: v["name"]
-            for k, v in self._get("users").items()
-            if v["name"] in user_names and not v["deleted"]
+            user_id: name
+            for name in set(user_names)
+            for user_id in self._directory.ids_by("users", "name", name)
+            if not users[user_id]["deleted"]
         }
 
     def get_users_by_ids(self, users_ids: Iterable[str]) -> dict[str, str]:
+        users_ids = set(users_ids)
+        cached = self._directory.get("users") is not None
         users = self._get("users")
-        translated_user_ids = (
-            self._translate_user_id(user_id) for user_id in users_ids
-        )
+        translated_user_ids = {self._translate_user_id(u) for u in users_ids}
+        if cached:
+            # users that joined after the user list was fetched
+            unknown = translated_user_ids - users.keys()
+            unknown -= self._directory.unknown_user_ids
+            if len(unknown) > MAX_USER_LOOKUPS:
+                self._directory.invalidate("users")
+                users = self._get("users")
+                translated_user_ids = {self._translate_user_id(u) for u in users_ids}
+            else:
+                for user_id in unknown:
+                    self._lookup_user(user_id)
         return {
             user_id: user["name"]
             for user_id in translated_user_ids
             if (user := users.get(user_id))
         }
 
+    def _lookup_user(self, user_id: str) -> None:
+        try:
+            slack_request.labels("users.info", "GET").inc()
+
+            result = self._sc.users_info(user=user_id)
+        except SlackApiError as e:
+            if e.response["error"] != "user_not_found":
+                raise
+            self._directory.unknown_user_ids.add(user_id)
+            return
+        self._directory.put("users", result["user"])
+
     def _get(self, resource: str) -> dict[str, Any]:
         """
-        Get Slack resources by type. This method uses a cache to ensure that
-        each resource type is only fetched once.
+        Get Slack resources by type. This method uses the directory cache
+        to ensure that each resource type is only fetched once per TTL.
 
         :param resource: resource type
         :return: data from API call
         """
-        if resource in self._results:
-            return self._results[resource]
+        with self._directory.lock:
+            if (cached := self._directory.get(resource)) is not None:
+                return cached
 
-        result_key = "members" if resource == "users" else resource
-        api_key = "conversations" if resource == "channels" else resource
-        results = {}
-        additional_kwargs: dict[str, str | int] = {"cursor": ""}
+            result_key = "members" if resource == "users" else resource
+            api_key = "conversations" if resource == "channels" else resource
+            results = {}
+            additional_kwargs: dict[str, str | int] = {"cursor": ""}
 
-        method_config = self.config.get_method_config(f"{api_key}.list")
-        if method_config:
-            additional_kwargs.update(method_config)
+            method_config = self.config.get_method_config(f"{api_key}.list")
+            if method_config:
+                additional_kwargs.update(method_config)
 
-        while True:
-            slack_request.labels(f"{api_key}.list", "GET").inc()
+            while True:
+                slack_request.labels(f"{api_key}.list", "GET").inc()
 
-            result = self._sc.api_call(
-                f"{api_key}.list", http_verb="GET", params=additional_kwargs
-            )
+                result = self._sc.api_call(
+                    f"{api_key}.list", http_verb="GET", params=additional_kwargs
+                )
 
-            for r in result[result_key]:
-                results[r["id"]] = r
+                for r in result[result_key]:
+                    results[r["id"]] = r
 
-            cursor = result["response_metadata"]["next_cursor"]
+                cursor = result["response_metadata"]["next_cursor"]
 
-            if not cursor:
-                break
-
-            additional_kwargs["cursor"] = cursor
+                if not cursor:
+                    break
 
-        self._results[resource] = results
+                additional_kwargs["cursor"] = cursor
 
-        if resource == "users":
-            self._enterprise_user_id_to_user_ids = {
-                enterprise_user_id: user["id"]
-                for user in results.values()
-                if (enterprise_user_id := user.get("enterprise_user", {}).get("id"))
-            }
-        return results
+            self._directory.set(resource, results)
+            return results
 
     def _translate_user_id(self, user_id: str) -> str:
         """Translate enterprise user id to user id"""
-        return self._enterprise_user_id_to_user_ids.get(user_id, user_id)
+        return self._directory.translate_user_id(user_id)
 
     def get_flat_conversation_history(
         self, from_timestamp: int, to_timestamp: int | None
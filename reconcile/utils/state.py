@@ -2,8 +2,9 @@ import contextlib
 import json
 import logging
 import os
+import threading
 from abc import abstractmethod
-from collections.abc import Callable, Generator, Mapping
+from collections.abc import Callable, Generator, Iterable, Mapping
 from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
@@ -13,6 +14,7 @@ from typing import (
 
 import boto3
 from botocore.errorfactory import ClientError
+from sretoolbox.utils import threaded
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
@@ -38,6 +40,8 @@ from reconcile.utils.secret_reader import (
     create_secret_reader,
 )
 
+DEFAULT_THREAD_POOL_SIZE = 10
+
 
 class StateInaccessibleException(Exception):
     pass
@@ -218,6 +222,9 @@ def acquire_state_settings(
     )
 
 
+_MISSING = object()
+
+
 class AbortStateTransaction(Exception):
     """Raise to abort a state transaction."""
 
@@ -239,11 +246,25 @@ class State:
     or not accessible
     """
 
-    def __init__(self, integration: str, bucket: str, client: S3Client) -> None:
+    def __init__(
+        self,
+        integration: str,
+        bucket: str,
+        client: S3Client,
+        thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+    ) -> None:
         """Initiates S3 client from AWSApi."""
         self.state_path = f"state/{integration}" if integration else "state"
         self.bucket = bucket
         self.client = client
+        self.thread_pool_size = thread_pool_size
+        # key -> (etag, raw body) of the objects read or written so far.
+        # raw bodies are cached to hand out a fresh object on every read.
+        self._cache: dict[str, tuple[str, bytes]] = {}
+        # keys whose cached etag was confirmed by a listing, see prefetch()
+        self._prefetched_keys: set[str] = set()
+        self._prefetched_prefixes: set[str] = set()
+        self._cache_lock = threading.Lock()
 
         # check if the bucket exists
         try:
@@ -276,6 +297,11 @@ class State:
         :raises StateInaccessibleException: if the bucket is missing or
         permissions are insufficient or a general AWS error occurred
         """
+        with self._cache_lock:
+            if key in self._prefetched_keys:
+                return True
+            if self._is_prefetched(key):
+                return False
         exists, _ = self.head(key)
         return exists
 
@@ -304,12 +330,9 @@ class State:
                 f"in bucket {self.bucket} - {details!s}"
             ) from None
 
-    def ls(self) -> list[str]:
-        """
-        Returns a list of keys in the state
-        """
+    def _list_objects(self, prefix: str = "") -> list[dict[str, Any]]:
         objects = self.client.list_objects_v2(
-            Bucket=self.bucket, Prefix=f"{self.state_path}/"
+            Bucket=self.bucket, Prefix=f"{self.state_path}/{prefix}"
         )
 
         if "Contents" not in objects:
@@ -320,13 +343,87 @@ class State:
         while objects["IsTruncated"]:
             objects = self.client.list_objects_v2(
                 Bucket=self.bucket,
-                Prefix=f"{self.state_path}/",
+                Prefix=f"{self.state_path}/{prefix}",
                 ContinuationToken=objects["NextContinuationToken"],
             )
 
             contents += objects["Contents"]
 
-        return [c["Key"].replace(self.state_path, "") for c in contents]
+        return contents
+
+    def ls(self) -> list[str]:
+        """
+        Returns a list of keys in the state
+        """
+        return [c["Key"].replace(self.state_path, "") for c in self._list_objects()]
+
+    def prefetch(self, prefix: str = "") -> list[str]:
+        """
+        Loads all keys below a prefix into the local read cache.
+
+        Only keys whose etag changed since they were cached are downloaded,
+        concurrently. Afterwards reads and existence checks of keys below
+        the prefix are served locally, without S3 round trips. Changes
+        made by other processes after the prefetch are not seen.
+
+        :return: the keys below the prefix
+        """
+        objects = self._list_objects(prefix)
+        listed = {
+            o["Key"].removeprefix(f"{self.state_path}/"): o["ETag"] for o in objects
+        }
+        with self._cache_lock:
+            stale = [
+                key
+                for key, etag in listed.items()
+                if self._cache.get(key, ("", b""))[0] != etag
+            ]
+        threaded.run(self._fetch, stale, self.thread_pool_size, trust_prefetched=False)
+        with self._cache_lock:
+            vanished = {
+                k
+                for k in self._prefetched_keys
+                if k.startswith(prefix) and k not in listed
+            }
+            self._prefetched_keys -= vanished
+            for key in vanished:
+                self._cache.pop(key, None)
+            self._prefetched_keys.update(listed)
+            self._prefetched_prefixes.add(prefix)
+        return list(listed)
+
+    def _is_prefetched(self, key: str) -> bool:
+        """Whether a key lies below a prefetched path. Call with the lock held."""
+        return any(
+            not prefix or key == prefix or key.startswith(f"{prefix.rstrip('/')}/")
+            for prefix in self._prefetched_prefixes
+        )
+
+    def _fetch(self, key: str, trust_prefetched: bool = True) -> bytes | None:
+        """Downloads a key into the read cache, returns None if it doesn't exist."""
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached and trust_prefetched and key in self._prefetched_keys:
+                return cached[1]
+        kwargs = {"IfNoneMatch": cached[0]} if cached else {}
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=f"{self.state_path}/{key}", **kwargs
+            )
+        except ClientError as details:
+            error_code = details.response["Error"]["Code"]
+            if cached and error_code in {"304", "NotModified"}:
+                return cached[1]
+            if error_code == "NoSuchKey":
+                with self._cache_lock:
+                    self._cache.pop(key, None)
+                    self._prefetched_keys.discard(key)
+                return None
+            raise
+        body = response["Body"].read()
+        with self._cache_lock:
+            self._cache[key] = (response["ETag"], body)
+        return body
 
     def add(
         self,
@@ -349,15 +446,47 @@ class State:
             raise KeyError(f"[state] key {key} already " f"exists in {self.state_path}")
         self._set(key, value, metadata=metadata)
 
+    def add_many(
+        self,
+        items: Mapping[str, Any],
+        metadata: Mapping[str, str] | None = None,
+        force: bool = False,
+    ) -> None:
+        """
+        Adds several key/values to the state concurrently and fails if any
+        of the keys already exists (checked upfront with a single listing)
+
+        :param items: mapping of keys to values
+        :param metadata: (optional) metadata for all the keys
+        :param force: (optional) if True, overrides keys that exist
+        """
+        if not force:
+            existing = {k.lstrip("/") for k in self.ls()} & set(items)
+            if existing:
+                raise KeyError(
+                    f"[state] keys {sorted(existing)} already exist in {self.state_path}"
+                )
+        threaded.run(
+            lambda item: self._set(item[0], item[1], metadata=metadata),
+            items.items(),
+            self.thread_pool_size,
+        )
+
     def _set(
         self, key: str, value: Any, metadata: Mapping[str, str] | None = None
     ) -> None:
-        self.client.put_object(
+        body = json.dumps(value).encode("utf-8")
+        response = self.client.put_object(
             Bucket=self.bucket,
             Key=f"{self.state_path}/{key}",
-            Body=json.dumps(value),
+            Body=body,
             Metadata=metadata or {},
         )
+        with self._cache_lock:
+            self._cache[key] = (response["ETag"], body)
+            # keep the prefetched listing in sync with our own writes
+            if self._is_prefetched(key):
+                self._prefetched_keys.add(key)
 
     def rm(self, key: str) -> None:
         """
@@ -370,6 +499,9 @@ class State:
         if not self.exists(key):
             raise KeyError(f"[state] key {key} does not exists in {self.state_path}")
         self.client.delete_object(Bucket=self.bucket, Key=f"{self.state_path}/{key}")
+        with self._cache_lock:
+            self._cache.pop(key, None)
+            self._prefetched_keys.discard(key)
 
     def get(self, key: str, *args: Any) -> Any:
         """
@@ -389,26 +521,32 @@ class State:
                 return args[0]
             raise
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Gets the values of several keys concurrently. Keys that don't
+        exist are left out of the result.
+        """
+        keys = list(keys)
+        values = threaded.run(
+            lambda k: self.get(k, _MISSING), keys, self.thread_pool_size
+        )
+        return {k: v for k, v in zip(keys, values, strict=True) if v is not _MISSING}
+
     def get_all(self, path: str) -> dict[str, Any]:
         """
         Gets all keys and values from the state in the specified path.
         """
         return {
-            k.replace(f"{path}/", "").strip("/"): self.get(k.lstrip("/"))
-            for k in self.ls()
-            if k.startswith(f"/{path}")
+            k.replace(f"{path}/", "").strip("/"): self.get(k)
+            for k in self.prefetch(path)
         }
 
     def __getitem__(self, item: str) -> Any:
+        body = self._fetch(item)
+        if body is None:
+            raise KeyError(item)
         try:
-            response = self.client.get_object(
-                Bucket=self.bucket, Key=f"{self.state_path}/{item}"
-            )
-            return json.loads(response["Body"].read())
-        except ClientError as details:
-            if details.response["Error"]["Code"] == "NoSuchKey":
-                raise KeyError(item) from None
-            raise
+            return json.loads(body)
         except json.decoder.JSONDecodeError:
             raise KeyError(item) from None
 
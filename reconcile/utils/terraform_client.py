@@ -40,6 +40,8 @@ from reconcile.utils.external_resource_spec import (
     ExternalResourceSpec,
     ExternalResourceSpecInventory,
 )
+from reconcile.utils.terraform_plan_cache import get_plan_cache
+from reconcile.utils.terraform_state import s3_state_outputs
 
 ALLOWED_TF_SHOW_FORMAT_VERSION = "1.2"
 DATE_FORMAT = "%Y-%m-%d"
@@ -50,6 +52,14 @@ PROVIDER_LOG_IGNORE_REGEX = (
     r""".*(?:ObjectLockConfigurationNotFoundError|WaitForState).*"""
 )
 TERRAFORM_LOG_LEVEL = "TRACE"  # can change to INFO after tf 0.15
+# the parts of `terraform show -json` used to process a plan, the planned
+# values, the configuration and the resources of the prior state are skipped
+PLAN_JSON_SELECTION = {
+    "format_version": True,
+    "output_changes": True,
+    "resource_changes": True,
+    "prior_state": {"values": {"outputs": True}},
+}
 
 
 @dataclass
@@ -94,6 +104,9 @@ class TerraformClient:  # pylint: disable=too-many-public-methods
         self._aws_api = aws_api
         self._log_lock = Lock()
         self.apply_count = 0
+        self._plan_cache = get_plan_cache()
+        # accounts without changes since their last plan, they are not applied
+        self.skipped_plans: set[str] = set()
 
         self.specs: list[TerraformSpec] = []
         self.init_specs()
@@ -142,8 +155,51 @@ class TerraformClient:  # pylint: disable=too-many-public-methods
             TerraformSpec(name=name, working_dir=wd)
             for name, wd in self.working_dirs.items()
         ]
+        # terraform doesn't lock the plugin cache against concurrent writers.
+        # One working directory per set of required providers populates it,
+        # one after another. The others reuse its dependency lock file, so
+        # their parallel inits only link the cached providers.
+        plugin_cache_dir = lean_tf.plugin_cache_dir()
+        groups: dict[str, list[TerraformSpec]] = {}
         for spec in self.specs:
-            self.terraform_init(spec)
+            providers = lean_tf.required_providers(spec.working_dir)
+            groups.setdefault(providers or spec.working_dir, []).append(spec)
+        cached: list[tuple[TerraformSpec, str | None]] = []
+        for seed, *others in groups.values():
+            self.terraform_init(seed, plugin_cache_dir=plugin_cache_dir)
+            lock_file = lean_tf.dependency_lock_file(seed.working_dir)
+            cached.extend((spec, lock_file) for spec in others)
+        failed = threaded.run(
+            self._terraform_init_from_cache,
+            cached,
+            self.thread_pool_size,
+            plugin_cache_dir=plugin_cache_dir,
+        )
+        # without the reused lock file init may download providers
+        for spec in failed:
+            if spec:
+                self.terraform_init(spec, plugin_cache_dir=plugin_cache_dir)
+
+    def _terraform_init_from_cache(
+        self,
+        item: tuple[TerraformSpec, str | None],
+        plugin_cache_dir: str | None,
+    ) -> TerraformSpec | None:
+        """Returns the spec if init failed with the reused lock file."""
+        spec, lock_file = item
+        with self._terraform_log_file(spec.working_dir) as (f, env):
+            return_code, stdout, stderr = lean_tf.init(
+                spec.working_dir,
+                env=env,
+                plugin_cache_dir=plugin_cache_dir,
+                lock_file=lock_file,
+            )
+            log = f.read().decode("utf-8")
+        if return_code != 0:
+            logging.debug(f"[{spec.name} - init] failed with reused lock file")
+            return spec
+        self.check_output(spec.name, "init", return_code, stdout, stderr, log)
+        return None
 
     @contextmanager
     def _terraform_log_file(
@@ -157,9 +213,15 @@ class TerraformClient:  # pylint: disable=too-many-public-methods
             yield f, env
 
     @retry(exceptions=TerraformCommandError)
-    def terraform_init(self, spec: TerraformSpec):
+    def terraform_init(
+        self,
+        spec: TerraformSpec,
+        plugin_cache_dir: str | None = None,
+    ):
         with self._terraform_log_file(spec.working_dir) as (f, env):
-            return_code, stdout, stderr = lean_tf.init(spec.working_dir, env=env)
+            return_code, stdout, stderr = lean_tf.init(
+                spec.working_dir, env=env, plugin_cache_dir=plugin_cache_dir
+            )
             log = f.read().decode("utf-8")
         error = self.check_output(spec.name, "init", return_code, stdout, stderr, log)
         if error:
@@ -173,6 +235,9 @@ class TerraformClient:  # pylint: disable=too-many-public-methods
 
     @retry(exceptions=TerraformCommandError)
     def terraform_output(self, spec: TerraformSpec):
+        # reading the outputs from the remote state saves a terraform run
+        if (outputs := s3_state_outputs(spec.working_dir)) is not None:
+            return spec.name, outputs
         with self._terraform_log_file(spec.working_dir) as (f, env):
             return_code, stdout, stderr = lean_tf.output(spec.working_dir, env=env)
             log = f.read().decode("utf-8")
@@ -201,6 +266,7 @@ class TerraformClient:  # pylint: disable=too-many-public-methods
         )
 
         self.created_users = []
+        self.skipped_plans = set()
         for disabled_deletion_detected, created_users, error in results:
             if error:
                 errors = True
@@ -222,6 +288,15 @@ class TerraformClient:  # pylint: disable=too-many-public-methods
     def terraform_plan(
         self, spec: TerraformSpec, enable_deletion: bool
     ) -> tuple[bool, list[AccountUser], bool]:
+        plan_key = self._plan_cache.key(
+            spec.working_dir, self.integration, self.integration_version
+        )
+        if plan_key and self._plan_cache.is_unchanged(plan_key):
+            logging.debug(f"[{spec.name}] config and state unchanged, skipping plan")
+            with self._log_lock:
+                self.skipped_plans.add(spec.name)
+            return False, [], False
+
         with self._terraform_log_file(spec.working_dir) as (f, env):
             return_code, stdout, stderr = lean_tf.plan(
                 spec.working_dir,
@@ -232,11 +307,33 @@ class TerraformClient:  # pylint: disable=too-many-public-methods
         error = self.check_output(spec.name, "plan", return_code, stdout, stderr, log)
         if error:
             return False, [], error
+        output = lean_tf.show_json(
+            spec.working_dir, spec.name, selection=PLAN_JSON_SELECTION
+        )
         disabled_deletion_detected, created_users = self.log_plan_diff(
-            spec, enable_deletion
+            spec, enable_deletion, output=output
         )
+        if plan_key and self._is_noop_plan(output):
+            self._plan_cache.set_unchanged(plan_key)
         return disabled_deletion_detected, created_users, error
 
+    @staticmethod
+    def _is_noop_plan(output: Mapping[str, Any]) -> bool:
+        output_changes = output.get("output_changes") or {}
+        prior_outputs = (
+            output.get("prior_state", {}).get("values", {}).get("outputs", {})
+        )
+        if set(prior_outputs) - set(output_changes):
+            return False
+        if any(
+            change.get("actions") != ["no-op"] for change in output_changes.values()
+        ):
+            return False
+        return all(
+            rc["change"]["actions"] == ["no-op"] and not rc.get("previous_address")
+            for rc in output.get("resource_changes") or []
+        )
+
     @staticmethod
     def _resource_diff_changed_fields(
         action: str, change: Mapping[str, Any]
@@ -274,6 +371,7 @@ class TerraformClient:  # pylint: disable=too-many-public-methods
         self,
         spec: TerraformSpec,
         enable_deletion: bool,
+        output: Mapping[str, Any] | None = None,
     ) -> tuple[bool, list]:
         disabled_deletion_detected = False
         name = spec.name
@@ -284,7 +382,10 @@ class TerraformClient:  # pylint: disable=too-many-public-methods
         deletions_allowed = enable_deletion or account_enable_deletion
         created_users: list[AccountUser] = []
 
-        output = lean_tf.show_json(spec.working_dir, name)
+        if output is None:
+            output = lean_tf.show_json(
+                spec.working_dir, name, selection=PLAN_JSON_SELECTION
+            )
         format_version = output.get("format_version")
         if format_version != ALLOWED_TF_SHOW_FORMAT_VERSION:
             raise NotImplementedError("terraform show untested format version")
@@ -436,7 +537,8 @@ class TerraformClient:  # pylint: disable=too-many-public-methods
 
     # terraform apply
     def apply(self):
-        errors = threaded.run(self.terraform_apply, self.specs, self.thread_pool_size)
+        specs = [s for s in self.specs if s.name not in self.skipped_plans]
+        errors = threaded.run(self.terraform_apply, specs, self.thread_pool_size)
         return any(errors)
 
     def terraform_apply(self, spec: TerraformSpec):
@@ -0,0 +1,112 @@
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from reconcile.utils.disk_cache import (
+    DiskCache,
+    cache_key,
+)
+from reconcile.utils.lean_terraform_client import LOCK_FILE_NAME
+from reconcile.utils.terraform_state import (
+    read_config,
+    s3_state_fingerprint,
+)
+
+# run a full plan at least this often to detect drift, 0 disables the cache
+TERRAFORM_PLAN_CACHE_MAX_AGE_SECONDS = int(
+    os.environ.get("TERRAFORM_PLAN_CACHE_MAX_AGE_SECONDS") or 3600
+)
+# persist plan results across runs if set
+TERRAFORM_PLAN_CACHE_DIR = os.environ.get("TERRAFORM_PLAN_CACHE_DIR")
+TERRAFORM_PLAN_CACHE_MAX_SIZE_MB = int(
+    os.environ.get("TERRAFORM_PLAN_CACHE_MAX_SIZE_MB") or 16
+)
+
+
+class PlanCache:
+    """
+    Remembers the inputs of terraform plans that didn't find any changes.
+
+    A plan is identified by the rendered configuration, the remote state
+    and the dependency lock file (provider versions) of a working
+    directory. While all of them are unchanged, planning again would not
+    find any changes either, unless the real infrastructure drifted. To
+    catch drift, an entry is only valid for `max_age_seconds` after the
+    plan that created it.
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: int = TERRAFORM_PLAN_CACHE_MAX_AGE_SECONDS,
+        disk_cache: DiskCache | None = None,
+        clock: Callable[[], float] = time.time,
+        state_fingerprint: Callable[
+            [dict[str, Any]], str | None
+        ] = s3_state_fingerprint,
+    ) -> None:
+        self.max_age_seconds = max_age_seconds
+        self._disk_cache = disk_cache
+        self._clock = clock
+        self._state_fingerprint = state_fingerprint
+        self._lock = threading.Lock()
+        self._planned_at: dict[str, float] = {}
+
+    def key(self, working_dir: str, *parts: Any) -> str | None:
+        """
+        Return the key of the plan of a working directory.
+
+        :param working_dir: An initialized working directory
+        :param parts: Additional parts of the key
+        :return: The key or None if the plan can't be cached
+        """
+        if not self.max_age_seconds:
+            return None
+        if not (config := read_config(working_dir)):
+            return None
+        config_text, config_data = config
+        state = self._state_fingerprint(config_data)
+        if state is None:
+            return None
+        try:
+            with open(os.path.join(working_dir, LOCK_FILE_NAME), encoding="utf-8") as f:
+                lock = f.read()
+        except OSError:
+            lock = ""
+        return cache_key("terraform-plan", config_text, state, lock, *parts)
+
+    def is_unchanged(self, key: str) -> bool:
+        with self._lock:
+            planned_at = self._planned_at.get(key)
+        if planned_at is None and self._disk_cache:
+            planned_at = self._disk_cache.get(key)
+        if planned_at is None:
+            return False
+        return self._clock() - planned_at < self.max_age_seconds
+
+    def set_unchanged(self, key: str) -> None:
+        planned_at = self._clock()
+        with self._lock:
+            self._planned_at[key] = planned_at
+        if self._disk_cache:
+            self._disk_cache.set(key, planned_at)
+
+
+_plan_cache: PlanCache | None = None
+_plan_cache_lock = threading.Lock()
+
+
+def get_plan_cache() -> PlanCache:
+    """Return the process wide terraform plan cache."""
+    global _plan_cache  # noqa: PLW0603
+    with _plan_cache_lock:
+        if _plan_cache is None:
+            disk_cache = None
+            if TERRAFORM_PLAN_CACHE_DIR:
+                disk_cache = DiskCache(
+                    TERRAFORM_PLAN_CACHE_DIR,
+                    max_size_bytes=TERRAFORM_PLAN_CACHE_MAX_SIZE_MB * 1024 * 1024,
+                )
+            _plan_cache = PlanCache(disk_cache=disk_cache)
+        return _plan_cache
@@ -0,0 +1,106 @@
+import json
+import logging
+import os
+from typing import Any
+
+import boto3
+from botocore.exceptions import ClientError
+
+from reconcile.utils.json_stream import load_selected
+
+CONFIG_FILE_NAME = "config.tf.json"
+
+
+def read_config(working_dir: str) -> tuple[str, dict[str, Any]] | None:
+    """
+    Read the terraform configuration of a working directory.
+
+    :param working_dir: The directory where the terraform files are located
+    :return: The raw and the decoded configuration or None if there is none
+    """
+    try:
+        with open(os.path.join(working_dir, CONFIG_FILE_NAME), encoding="utf-8") as f:
+            config_text = f.read()
+        return config_text, json.loads(config_text)
+    except (OSError, ValueError):
+        return None
+
+
+def s3_backend(config: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Return the settings of the s3 backend of a terraform configuration.
+
+    :param config: The terraform configuration
+    :return: The backend settings or None if the state is not stored in s3
+    """
+    backend = config.get("terraform", {}).get("backend", {})
+    if isinstance(backend, list):
+        backend = backend[0] if backend else {}
+    return backend.get("s3") or None
+
+
+def s3_client(backend: dict[str, Any]) -> Any:
+    return boto3.client(
+        "s3",
+        aws_access_key_id=backend.get("access_key"),
+        aws_secret_access_key=backend.get("secret_key"),
+        region_name=backend.get("region"),
+    )
+
+
+def s3_state_fingerprint(config: dict[str, Any]) -> str | None:
+    """
+    Return the ETag (and version) of the remote state of an s3 backend.
+
+    :param config: The terraform configuration
+    :return: The fingerprint or None if there is no s3 backend or the state
+        can't be looked up
+    """
+    if not (backend := s3_backend(config)):
+        return None
+    try:
+        head = s3_client(backend).head_object(
+            Bucket=backend["bucket"], Key=backend["key"]
+        )
+    except Exception as e:
+        logging.debug(f"unable to look up terraform state {backend.get('key')}: {e}")
+        return None
+    return f"{head['ETag']}:{head.get('VersionId') or ''}"
+
+
+def s3_state_outputs(working_dir: str) -> dict[str, Any] | None:
+    """
+    Read the outputs of a working directory from its remote state in s3.
+
+    Only the outputs are decoded, the resources of the state are skipped
+    while streaming it. The result has the format of `terraform output -json`.
+
+    :param working_dir: The directory where the terraform files are located
+    :return: The outputs or None if they can't be read from s3
+    """
+    if not (config := read_config(working_dir)):
+        return None
+    if not (backend := s3_backend(config[1])):
+        return None
+    try:
+        response = s3_client(backend).get_object(
+            Bucket=backend["bucket"], Key=backend["key"]
+        )
+        state = load_selected(response["Body"], {"outputs": True})
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "NoSuchKey":
+            # nothing has been applied yet
+            return {}
+        logging.debug(f"unable to read terraform state {backend.get('key')}: {e}")
+        return None
+    except Exception as e:
+        logging.debug(f"unable to read terraform state {backend.get('key')}: {e}")
+        return None
+    return {
+        name: {
+            "sensitive": bool(output.get("sensitive")),
+            "type": output.get("type"),
+            "value": output.get("value"),
+        }
+        for name, output in (state.get("outputs") or {}).items()
+    }
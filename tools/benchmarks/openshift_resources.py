@@ -0,0 +1,351 @@
+"""
+Benchmarks for the reconcile hot path shared by all openshift-* integrations.
+
+Synthetic inventories are populated from a fake OC client and realized in
+dry-run mode, so no cluster is required. Every benchmark reports its duration,
+throughput and peak memory usage. Results can be written to a JSON file and
+compared against the results of a previous release to catch regressions.
+
+    python -m tools.benchmarks.openshift_resources --sizes 1000,10000 \
+        --output results.json --baseline previous.json
+"""
+
+import gc
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from typing import Any
+
+import click
+
+from reconcile import openshift_base as ob
+from reconcile.utils.openshift_resource import OpenshiftResource as OR
+from reconcile.utils.openshift_resource import ResourceInventory
+
+INTEGRATION = "benchmark"
+INTEGRATION_VERSION = "1.0.0"
+CLUSTER = "benchmark-cluster"
+KIND = "ConfigMap"
+RESOURCES_PER_NAMESPACE = 100
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_MAX_REGRESSION = 0.25
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    size: int
+    seconds: float
+    items_per_second: float
+    peak_memory_bytes: int | None
+
+
+def desired_body(index: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": KIND,
+        "metadata": {
+            "name": f"config-{index}",
+            "labels": {"app": "benchmark", "index": str(index)},
+        },
+        "data": {f"key-{k}": f"value-{index}-{k}" for k in range(10)},
+    }
+
+
+def current_body(index: int) -> dict[str, Any] | None:
+    """
+    The body as it is returned by the cluster. Every 20th resource is missing
+    (it will be created), every 10th resource differs (it will be applied).
+    """
+    if index % 20 == 0:
+        return None
+    body = desired_body(index)
+    if index % 10 == 5:
+        body["data"]["key-0"] = "drifted"
+    annotated = OR(body, INTEGRATION, INTEGRATION_VERSION).annotate()
+    annotated.body["metadata"].update({
+        "namespace": namespace_of(index),
+        "resourceVersion": str(index),
+        "uid": f"uid-{index}",
+        "creationTimestamp": "2024-01-01T00:00:00Z",
+    })
+    return annotated.body
+
+
+def namespace_of(index: int) -> str:
+    return f"namespace-{index // RESOURCES_PER_NAMESPACE}"
+
+
+class FakeOC:
+    """Serves the current state of a synthetic cluster."""
+
+    def __init__(self, size: int) -> None:
+        self.items: dict[str, list[dict[str, Any]]] = {}
+        # every 25th resource only exists in the cluster (it will be deleted)
+        for index in range(size + size // 25):
+            if body := current_body(index):
+                self.items.setdefault(namespace_of(index), []).append(body)
+
+    def is_kind_supported(self, kind: str) -> bool:
+        return True
+
+    def iter_items(
+        self, kind: str, namespace: str = "", **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        for item in self.items.get(namespace, []):
+            # the real client hands out fresh objects
+            yield json.loads(json.dumps(item))
+
+    def recycle_pods(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+class FakeOCMap:
+    def __init__(self, oc: FakeOC) -> None:
+        self.oc = oc
+
+    def get(self, cluster: str, privileged: bool = False) -> FakeOC:
+        return self.oc
+
+    def get_cluster(self, cluster: str, privileged: bool = False) -> FakeOC:
+        return self.oc
+
+    def clusters(self, *args: Any, **kwargs: Any) -> list[str]:
+        return [CLUSTER]
+
+
+def populate_inventory(size: int, oc: FakeOC) -> ResourceInventory:
+    ri = ResourceInventory()
+    for namespace in oc.items:
+        ri.initialize_resource_type(CLUSTER, namespace, KIND)
+    for index in range(size):
+        ri.initialize_resource_type(CLUSTER, namespace_of(index), KIND)
+        desired = OR(desired_body(index), INTEGRATION, INTEGRATION_VERSION)
+        ri.add_desired(CLUSTER, namespace_of(index), KIND, desired.name, desired)
+    for namespace in oc.items:
+        spec = ob.CurrentStateSpec(
+            oc=oc,  # type: ignore[arg-type]
+            cluster=CLUSTER,
+            namespace=namespace,
+            kind=KIND,
+            resource_names=None,
+        )
+        ob.populate_current_state(spec, ri, INTEGRATION, INTEGRATION_VERSION)
+    return ri
+
+
+def bench_populate_inventory(size: int) -> Callable[[], Any]:
+    oc = FakeOC(size)
+    return lambda: populate_inventory(size, oc)
+
+
+def bench_canonicalize(size: int) -> Callable[[], Any]:
+    bodies = [desired_body(index) for index in range(size)]
+    return lambda: [OR.canonicalize(body) for body in bodies]
+
+
+def bench_sha256sum(size: int) -> Callable[[], Any]:
+    bodies = [desired_body(index) for index in range(size)]
+    return lambda: [
+        OR(body, INTEGRATION, INTEGRATION_VERSION).sha256sum() for body in bodies
+    ]
+
+
+def bench_realize_data(size: int) -> Callable[[], Any]:
+    oc = FakeOC(size)
+    oc_map = FakeOCMap(oc)
+    # dry-run realization does not modify the inventory
+    ri = populate_inventory(size, oc)
+
+    def run() -> Any:
+        return ob.realize_data(
+            dry_run=True,
+            oc_map=oc_map,
+            ri=ri,
+            thread_pool_size=1,
+            recycle_pods=False,
+        )
+
+    return run
+
+
+def bench_realize_resource_data(size: int) -> Callable[[], Any]:
+    oc = FakeOC(size)
+    oc_map = FakeOCMap(oc)
+    ri = populate_inventory(size, oc)
+
+    def run() -> Any:
+        return [
+            ob._realize_resource_data(
+                ri_item,
+                dry_run=True,
+                oc_map=oc_map,  # type: ignore[arg-type]
+                ri=ri,
+                take_over=False,
+                caller="",
+                all_callers=[],
+                wait_for_namespace=False,
+                no_dry_run_skip_compare=False,
+                override_enable_deletion=None,  # type: ignore[arg-type]
+                recycle_pods=False,
+            )
+            for ri_item in ri
+        ]
+
+    return run
+
+
+BENCHMARKS: dict[str, Callable[[int], Callable[[], Any]]] = {
+    "populate_inventory": bench_populate_inventory,
+    "canonicalize": bench_canonicalize,
+    "sha256sum": bench_sha256sum,
+    "realize_resource_data": bench_realize_resource_data,
+    "realize_data": bench_realize_data,
+}
+
+
+def run_benchmark(
+    name: str, size: int, repeat: int = 3, measure_memory: bool = True
+) -> BenchmarkResult:
+    """
+    Runs a benchmark `repeat` times and reports the fastest run. The peak
+    memory is measured in an additional run, as tracing slows down the
+    benchmarked code.
+    """
+    func = BENCHMARKS[name](size)
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    seconds = min(durations)
+
+    peak_memory = None
+    if measure_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        seconds=seconds,
+        items_per_second=size / seconds if seconds else float("inf"),
+        peak_memory_bytes=peak_memory,
+    )
+
+
+def find_regressions(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    max_regression: float,
+) -> list[str]:
+    baseline_results = {(r.name, r.size): r for r in baseline}
+    regressions = []
+    for result in results:
+        base = baseline_results.get((result.name, result.size))
+        if not base:
+            continue
+        if result.seconds > base.seconds * (1 + max_regression):
+            regressions.append(
+                f"{result.name}[{result.size}]: {base.seconds:.3f}s -> "
+                f"{result.seconds:.3f}s"
+            )
+        if (
+            result.peak_memory_bytes is not None
+            and base.peak_memory_bytes is not None
+            and result.peak_memory_bytes > base.peak_memory_bytes * (1 + max_regression)
+        ):
+            regressions.append(
+                f"{result.name}[{result.size}]: {base.peak_memory_bytes} bytes -> "
+                f"{result.peak_memory_bytes} bytes"
+            )
+    return regressions
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    print(f"{'benchmark':<24}{'size':>8}{'seconds':>12}{'items/s':>14}{'peak MiB':>12}")
+    for r in results:
+        peak = (
+            f"{r.peak_memory_bytes / 1024 / 1024:.1f}"
+            if r.peak_memory_bytes is not None
+            else "-"
+        )
+        print(
+            f"{r.name:<24}{r.size:>8}{r.seconds:>12.3f}"
+            f"{r.items_per_second:>14.0f}{peak:>12}"
+        )
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    default=",".join(str(s) for s in DEFAULT_SIZES),
+    help="Comma separated inventory sizes.",
+)
+@click.option(
+    "--benchmark",
+    "benchmarks",
+    multiple=True,
+    type=click.Choice(list(BENCHMARKS)),
+    help="Benchmarks to run. Defaults to all.",
+)
+@click.option("--repeat", default=3, help="Runs per benchmark, the fastest counts.")
+@click.option("--no-memory", is_flag=True, help="Skip the peak memory measurement.")
+@click.option("--output", help="Write the results to this JSON file.")
+@click.option("--baseline", help="Compare the results with this JSON file.")
+@click.option(
+    "--max-regression",
+    default=DEFAULT_MAX_REGRESSION,
+    help="Allowed relative slowdown/memory growth compared to the baseline.",
+)
+def main(
+    sizes: str,
+    benchmarks: tuple[str, ...],
+    repeat: int,
+    no_memory: bool,
+    output: str | None,
+    baseline: str | None,
+    max_regression: float,
+) -> None:
+    # realize_data logs every action, which would dominate the measurements
+    logging.basicConfig(level=logging.ERROR)
+    results = [
+        run_benchmark(name, int(size), repeat=repeat, measure_memory=not no_memory)
+        for size in sizes.split(",")
+        for name in benchmarks or BENCHMARKS
+    ]
+    print_results(results)
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+
+    if baseline:
+        with open(baseline, encoding="utf-8") as f:
+            baseline_results = [BenchmarkResult(**r) for r in json.load(f)]
+        regressions = find_regressions(results, baseline_results, max_regression)
+        if regressions:
+            print("regressions found:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
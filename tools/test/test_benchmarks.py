@@ -0,0 +1,41 @@
+import pytest
+
+from tools.benchmarks.openshift_resources import (
+    BENCHMARKS,
+    BenchmarkResult,
+    find_regressions,
+    run_benchmark,
+)
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_run_benchmark(name: str) -> None:
+    result = run_benchmark(name, 50, repeat=1)
+    assert result.name == name
+    assert result.size == 50
+    assert result.seconds > 0
+    assert result.peak_memory_bytes
+
+
+def test_realize_data_actions() -> None:
+    # 50 desired resources, 3 missing, 5 drifted, 2 only in the cluster
+    actions = BENCHMARKS["realize_data"](50)()
+    assert sorted(a["action"] for a in actions) == ["applied"] * 8 + ["deleted"] * 2
+
+
+def test_find_regressions() -> None:
+    baseline = [
+        BenchmarkResult("a", 10, 1.0, 10.0, 100),
+        BenchmarkResult("b", 10, 1.0, 10.0, 100),
+        BenchmarkResult("c", 10, 1.0, 10.0, None),
+    ]
+    results = [
+        BenchmarkResult("a", 10, 1.1, 9.0, 110),
+        BenchmarkResult("b", 10, 2.0, 5.0, 200),
+        BenchmarkResult("c", 10, 1.0, 10.0, 200),
+        BenchmarkResult("d", 10, 5.0, 2.0, 500),
+    ]
+    assert find_regressions(results, baseline, max_regression=0.25) == [
+        "b[10]: 1.000s -> 2.000s",
+        "b[10]: 100 bytes -> 200 bytes",
+    ]